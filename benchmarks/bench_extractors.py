@@ -0,0 +1,188 @@
+"""
+Throughput and memory benchmark for every extractor, with regression gating.
+
+Generates a deterministic synthetic corpus per format (see ``corpus.py``),
+then extracts each file in a fresh interpreter and records:
+
+- MB/s of input and units/s (pages, rows, records, lines...), best of N runs
+- peak Python allocations during one extraction (tracemalloc)
+- peak RSS of the measuring process
+
+Results are written as JSON. Given ``--baseline`` (an earlier results
+file), the script exits non-zero when any format got slower or hungrier
+than the baseline by more than ``--threshold``.
+
+Usage:
+    python benchmarks/bench_extractors.py --size-mb 8 --output bench.json
+    python benchmarks/bench_extractors.py --baseline bench.json --threshold 0.2
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from corpus import GENERATORS
+
+# Memory growth below this many MB is treated as noise
+MEMORY_NOISE_FLOOR_MB = 1.0
+
+_MEASURE = """
+import gc, json, resource, sys, time, tracemalloc
+sys.path.insert(0, %(root)r)
+from services.extractors.registry import registry
+
+path, repeat = %(path)r, %(repeat)d
+cls = registry.get_class(path)
+cls(path).extract_text()  # warm-up: imports, page cache
+best = float("inf")
+for _ in range(repeat):
+    gc.collect()
+    start = time.perf_counter()
+    text = cls(path).extract_text()
+    best = min(best, time.perf_counter() - start)
+chars = len(text)
+del text
+gc.collect()
+tracemalloc.start()
+cls(path).extract_text()
+peak = tracemalloc.get_traced_memory()[1]
+tracemalloc.stop()
+rss_mb = None
+try:
+    # ru_maxrss of a child carries over the high-water mark of the process
+    # that forked it; VmHWM only counts pages this interpreter touched
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                rss_mb = int(line.split()[1]) / 1024  # kB
+except OSError:
+    pass
+if rss_mb is None:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss_mb = rss / 2**20 if sys.platform == "darwin" else rss / 1024  # bytes on macOS, KB elsewhere
+print(json.dumps({"seconds": best, "chars": chars, "tracemalloc_peak_mb": peak / 2**20, "max_rss_mb": rss_mb}))
+"""
+
+
+def measure(path: str, repeat: int) -> dict:
+    """Extract ``path`` in a fresh interpreter and return its timing and memory figures."""
+    code = _MEASURE % {"root": project_root, "path": path, "repeat": repeat}
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if out.returncode != 0:
+        raise RuntimeError(out.stderr.strip().splitlines()[-1] if out.stderr.strip() else "measurement failed")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def run_format(name: str, work_dir: str, size_mb: float, repeat: int, seed: int) -> dict:
+    extension, generate = GENERATORS[name]
+    path = os.path.join(work_dir, f"corpus_{name}_{size_mb:g}mb_{seed}{extension}")
+    if os.path.exists(path):
+        with open(path + ".units") as f:
+            units, unit = json.load(f)
+    else:
+        units, unit = generate(path, int(size_mb * 2**20), seed=seed)
+        with open(path + ".units", "w") as f:
+            json.dump([units, unit], f)
+
+    result = measure(path, repeat)
+    size = os.path.getsize(path)
+    result.update({
+        "bytes": size,
+        "units": units,
+        "unit": unit,
+        "mb_per_s": size / 2**20 / result["seconds"],
+        "units_per_s": units / result["seconds"],
+    })
+    return result
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Return human-readable regressions of ``results`` against ``baseline``."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous or "error" in current or "error" in previous:
+            continue
+        if current["mb_per_s"] < previous["mb_per_s"] * (1 - threshold):
+            regressions.append(
+                f"{name}: throughput {current['mb_per_s']:.2f} MB/s vs {previous['mb_per_s']:.2f} MB/s baseline"
+            )
+        peak, old_peak = current["tracemalloc_peak_mb"], previous["tracemalloc_peak_mb"]
+        if peak > old_peak * (1 + threshold) and peak - old_peak > MEMORY_NOISE_FLOOR_MB:
+            regressions.append(f"{name}: peak memory {peak:.1f} MB vs {old_peak:.1f} MB baseline")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extractor throughput/memory benchmark")
+    parser.add_argument("--formats", nargs="+", choices=sorted(GENERATORS), default=list(GENERATORS),
+                        help="Formats to benchmark (default: all)")
+    parser.add_argument("--size-mb", type=float, default=8.0, help="Approximate corpus size per format")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per format (best counts)")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus random seed")
+    parser.add_argument("--work-dir", help="Keep generated corpora here and reuse them across runs")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument("--baseline", help="Earlier JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed relative slowdown / memory growth before failing (default 0.2)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = args.work_dir or tmp
+        os.makedirs(work_dir, exist_ok=True)
+
+        results = {}
+        print(f"{'format':<6} {'size':>9} {'MB/s':>9} {'units/s':>21} {'py peak':>9} {'max RSS':>9}")
+        for name in args.formats:
+            try:
+                r = run_format(name, work_dir, args.size_mb, args.repeat, args.seed)
+            except Exception as exc:
+                results[name] = {"error": f"{type(exc).__name__}: {exc}"}
+                print(f"{name:<6} ❌ {results[name]['error']}")
+                continue
+            results[name] = r
+            print(
+                f"{name:<6} {r['bytes'] / 2**20:7.1f}MB {r['mb_per_s']:9.2f} "
+                f"{r['units_per_s']:>10.0f} {r['unit']:<10} {r['tracemalloc_peak_mb']:7.1f}MB {r['max_rss_mb']:7.1f}MB"
+            )
+
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "size_mb": args.size_mb,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"results     : {args.output}")
+
+    failed = any("error" in r for r in results.values())
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"❌ Regression - {line}")
+        failed = failed or bool(regressions)
+        if not regressions:
+            print(f"✅ No regressions beyond {args.threshold:.0%} of {args.baseline}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
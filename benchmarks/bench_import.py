@@ -0,0 +1,66 @@
+"""
+Guard the start-up cost of importing the services package.
+
+Imports ``services.services`` in fresh interpreters, reports the best
+wall-clock time, and exits non-zero if it exceeds the budget or if any
+heavy extraction/LLM backend was imported eagerly.
+
+Usage:
+    python benchmarks/bench_import.py --budget-ms 200 --runs 5
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must only be imported when a matching file is extracted
+HEAVY_MODULES = [
+    "fitz", "pymupdf", "docx", "pandas", "yaml", "markdown", "openpyxl", "pyarrow",
+    "langchain_core", "pydantic", "requests", "easyocr",
+]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import services.services
+elapsed = time.perf_counter() - start
+print(json.dumps({"ms": elapsed * 1000, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+
+def measure() -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=project_root, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="services import-time budget check")
+    parser.add_argument("--budget-ms", type=float, default=200.0, help="Maximum allowed import time")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to try (best run counts)")
+    args = parser.parse_args()
+
+    results = [measure() for _ in range(args.runs)]
+    best = min(r["ms"] for r in results)
+    loaded = sorted({m for r in results for m in r["loaded"]})
+
+    print(f"import services.services: best {best:.1f} ms over {args.runs} runs (budget {args.budget_ms:.0f} ms)")
+    failed = False
+    if loaded:
+        print(f"❌ Heavy modules imported eagerly: {', '.join(loaded)}")
+        failed = True
+    if best > args.budget_ms:
+        print("❌ Import time over budget")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print("✅ Within budget")
+
+
+if __name__ == "__main__":
+    main()
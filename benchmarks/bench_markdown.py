@@ -0,0 +1,90 @@
+"""
+Benchmark MarkdownExtractor against the legacy markdown -> HTML -> regex path.
+
+Usage:
+    python benchmarks/bench_markdown.py --docs 2000
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from services.extractors.markdown_extractor import MarkdownExtractor
+
+try:
+    import markdown
+except ModuleNotFoundError:  # legacy baseline is optional
+    markdown = None
+
+
+def legacy_extract_text(file_path: str) -> str:
+    """The original implementation, kept here as the baseline."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        md = f.read()
+    html = markdown.markdown(md)
+    return re.sub(r'<[^>]+>', '', html).strip()
+
+
+def make_readme(rng: random.Random, index: int) -> str:
+    """Build one README/wiki-style page with headings, lists, code, links and tables."""
+    words = ["extract", "document", "pipeline", "service", "token", "worker", "cache", "stream"]
+
+    def sentence(n=12):
+        parts = [rng.choice(words) for _ in range(n)]
+        parts[2] = f"**{parts[2]}**"
+        parts[5] = f"[{parts[5]}](https://example.com/{index}/{parts[5]})"
+        parts[8] = f"`{parts[8]}()`"
+        return " ".join(parts).capitalize() + " &amp; more."
+
+    lines = [f"# Project {index}", "", sentence(20), sentence(15), ""]
+    for section in range(4):
+        lines += [f"## Section {section}", ""]
+        lines += [f"- {sentence(10)}" for _ in range(5)] + [""]
+        lines += ["```python", f"def run_{section}(x):", "    return x < 2 and x > 0", "```", ""]
+        lines += ["| name | value | note |", "|------|------:|------|"]
+        lines += [f"| {rng.choice(words)} | {rng.randint(0, 999)} | {sentence(9)} |" for _ in range(6)]
+        lines += ["", sentence(30), ""]
+    return "\n".join(lines) + "\n"
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Markdown extraction throughput benchmark")
+    parser.add_argument("--docs", type=int, default=2000, help="Number of README pages concatenated into the dump")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "wiki_dump.md")
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(args.docs):
+                f.write(make_readme(rng, i))
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(f"corpus  : {size_mb:.1f} MB ({args.docs} pages)")
+
+        _, current_s = timed(lambda p: MarkdownExtractor(p).extract_text(), path)
+        print(f"current : {current_s:8.3f}s  {size_mb / current_s:8.2f} MB/s")
+
+        if markdown is None:
+            print("legacy  : skipped (install 'markdown' to compare)")
+            return
+        _, legacy_s = timed(legacy_extract_text, path)
+        print(f"legacy  : {legacy_s:8.3f}s  {size_mb / legacy_s:8.2f} MB/s")
+        print(f"speedup : {legacy_s / current_s:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
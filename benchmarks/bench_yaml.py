@@ -0,0 +1,109 @@
+"""
+Benchmark YAMLExtractor on a multi-document manifest corpus, comparing the
+libyaml-backed CSafeLoader it uses against the pure-Python SafeLoader.
+
+Usage:
+    python benchmarks/bench_yaml.py --manifests 2000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+import yaml
+from services.extractors import yaml_extractor
+from services.extractors.yaml_extractor import YAMLExtractor
+
+
+def make_manifest(i: int) -> str:
+    """Build one Deployment + Service pair, Kubernetes style."""
+    return f"""apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: app-{i}
+  labels: {{app: app-{i}, tier: backend, team: team-{i % 7}}}
+spec:
+  replicas: {1 + i % 5}
+  selector:
+    matchLabels:
+      app: app-{i}
+  template:
+    metadata:
+      labels:
+        app: app-{i}
+    spec:
+      containers:
+        - name: app
+          image: registry.example.com/app-{i}:1.{i % 10}.0
+          ports:
+            - containerPort: 8080
+          env:
+            - name: LOG_LEVEL
+              value: info
+            - name: WORKERS
+              value: "{i % 16}"
+          resources:
+            limits: {{cpu: 500m, memory: 256Mi}}
+---
+apiVersion: v1
+kind: Service
+metadata:
+  name: app-{i}
+spec:
+  selector:
+    app: app-{i}
+  ports:
+    - port: 80
+      targetPort: 8080
+---
+"""
+
+
+def pure_python_extract_text(file_path: str) -> str:
+    """Same rendering as YAMLExtractor, but parsed with the pure-Python SafeLoader."""
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    with open(file_path, "r", encoding="utf-8") as f:
+        docs = [encoder.encode(d) for d in yaml.load_all(f, Loader=yaml.SafeLoader)]
+    return yaml_extractor.DOCUMENT_SEPARATOR.join(docs).strip()
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YAML extraction benchmark")
+    parser.add_argument("--manifests", type=int, default=2000, help="Number of Deployment/Service pairs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "manifests.yaml")
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(args.manifests):
+                f.write(make_manifest(i))
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(f"corpus      : {size_mb:.1f} MB ({2 * args.manifests} documents)")
+        print(f"loader      : {yaml_extractor.SafeLoader.__name__}")
+
+        current, current_s = timed(lambda p: YAMLExtractor(p).extract_text(), path)
+        print(f"extractor   : {current_s:8.3f}s  {size_mb / current_s:8.2f} MB/s")
+
+        baseline, baseline_s = timed(pure_python_extract_text, path)
+        print(f"pure Python : {baseline_s:8.3f}s  {size_mb / baseline_s:8.2f} MB/s")
+        print(f"speedup     : {baseline_s / current_s:8.1f}x")
+        if baseline != current:
+            print("❌ Output differs between loaders")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""
+Deterministic synthetic corpora for the extractor benchmarks.
+
+Every generator writes one file of roughly ``target_bytes`` (PDF and
+DOCX sizes are approximate since they are compressed) from a seeded
+random generator, so the same arguments always produce the same bytes,
+and returns the number of natural units it wrote (pages, rows, records,
+lines...) for per-unit throughput figures.
+"""
+import datetime
+import json
+import os
+import random
+import zipfile
+from typing import Callable, Dict, Tuple
+from xml.sax.saxutils import escape
+
+WORDS = (
+    "report data system value process result model design network service user market policy "
+    "analysis energy growth review quarter revenue customer product update release feature "
+    "budget team project timeline risk impact metric target region account invoice contract "
+    "storage cluster latency throughput memory request response document extraction pipeline"
+).split()
+
+
+def _sentence(rng: random.Random, min_words: int = 6, max_words: int = 16) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraph(rng: random.Random, sentences: int = 4) -> str:
+    return " ".join(_sentence(rng) for _ in range(sentences))
+
+
+def make_txt(path: str, target_bytes: int, seed: int = 0) -> Tuple[int, str]:
+    rng = random.Random(seed)
+    lines = written = 0
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        while written < target_bytes:
+            line = _sentence(rng) + "\n"
+            f.write(line)
+            written += len(line)
+            lines += 1
+    return lines, "lines"
+
+
+def make_md(path: str, target_bytes: int, seed: int = 0) -> Tuple[int, str]:
+    rng = random.Random(seed)
+    lines = written = section = 0
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        while written < target_bytes:
+            section += 1
+            block = [
+                f"## Section {section}: {rng.choice(WORDS).title()}",
+                "",
+                _paragraph(rng).replace(" data ", " **data** ").replace(" model ", " *model* "),
+                "",
+                f"- [{rng.choice(WORDS)}](https://example.com/{section}) item with `code`",
+                f"- {_sentence(rng)}",
+                "",
+                "| name | value |",
+                "| --- | --- |",
+                f"| {rng.choice(WORDS)} | {rng.randint(0, 9999)} |",
+                "",
+                "```python",
+                f"print({section})",
+                "```",
+                "",
+            ]
+            text = "\n".join(block) + "\n"
+            f.write(text)
+            written += len(text)
+            lines += len(block)
+    return lines, "lines"
+
+
+def make_csv(path: str, target_bytes: int, seed: int = 0) -> Tuple[int, str]:
+    rng = random.Random(seed)
+    rows = 0
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        written = f.write("id,name,region,amount,ratio,note\n")
+        while written < target_bytes:
+            row = (
+                f"{rows},{rng.choice(WORDS)},{rng.choice(WORDS)},{rng.randint(0, 10**6)},"
+                f"{rng.random():.6f},\"{_sentence(rng, 3, 8)}\"\n"
+            )
+            written += f.write(row)
+            rows += 1
+    return rows, "rows"
+
+
+def _record(rng: random.Random, i: int) -> dict:
+    return {
+        "id": i,
+        "name": f"{rng.choice(WORDS)}-{i}",
+        "active": rng.random() < 0.7,
+        "score": round(rng.random() * 100, 3),
+        "tags": [rng.choice(WORDS) for _ in range(3)],
+        "owner": {"team": rng.choice(WORDS), "region": rng.choice(WORDS)},
+        "summary": _sentence(rng),
+    }
+
+
+def make_json(path: str, target_bytes: int, seed: int = 0) -> Tuple[int, str]:
+    rng = random.Random(seed)
+    records = 0
+    with open(path, "w", encoding="utf-8") as f:
+        written = f.write('{"records": [\n')
+        while written < target_bytes:
+            if records:
+                written += f.write(",\n")
+            written += f.write(json.dumps(_record(rng, records)))
+            records += 1
+        f.write("\n]}\n")
+    return records, "records"
+
+
+def make_yaml(path: str, target_bytes: int, seed: int = 0) -> Tuple[int, str]:
+    rng = random.Random(seed)
+    records = written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while written < target_bytes:
+            r = _record(rng, records)
+            doc = (
+                f"id: {r['id']}\nname: {r['name']}\nactive: {str(r['active']).lower()}\n"
+                f"score: {r['score']}\ntags: [{', '.join(r['tags'])}]\n"
+                f"owner:\n  team: {r['owner']['team']}\n  region: {r['owner']['region']}\n"
+                f"summary: \"{r['summary']}\"\n---\n"
+            )
+            written += f.write(doc)
+            records += 1
+    return records, "documents"
+
+
+def make_toml(path: str, target_bytes: int, seed: int = 0) -> Tuple[int, str]:
+    rng = random.Random(seed)
+    records = 0
+    with open(path, "w", encoding="utf-8") as f:
+        written = f.write('title = "synthetic"\n\n')
+        while written < target_bytes:
+            r = _record(rng, records)
+            table = (
+                f"[[records]]\nid = {r['id']}\nname = \"{r['name']}\"\nactive = {str(r['active']).lower()}\n"
+                f"score = {r['score']}\ntags = {json.dumps(r['tags'])}\n"
+                f"owner = {{ team = \"{r['owner']['team']}\", region = \"{r['owner']['region']}\" }}\n"
+                f"summary = \"{r['summary']}\"\n\n"
+            )
+            written += f.write(table)
+            records += 1
+    return records, "records"
+
+
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def _zip_entry(name: str) -> zipfile.ZipInfo:
+    # Fixed timestamp so the archive bytes are reproducible
+    info = zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+    info.compress_type = zipfile.ZIP_DEFLATED
+    return info
+
+
+def _docx_paragraph(text: str) -> str:
+    return f"<w:p><w:r><w:t xml:space=\"preserve\">{escape(text)}</w:t></w:r></w:p>"
+
+
+def make_docx(path: str, target_bytes: int, seed: int = 0) -> Tuple[int, str]:
+    """Hand-written WordprocessingML (no python-docx needed): paragraphs plus a table every 50 paragraphs."""
+    rng = random.Random(seed)
+    paragraphs = 0
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(_zip_entry("[Content_Types].xml"), _DOCX_CONTENT_TYPES)
+        archive.writestr(_zip_entry("_rels/.rels"), _DOCX_RELS)
+        with archive.open(_zip_entry("word/document.xml"), "w") as part:
+            part.write(f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:document xmlns:w="{_W_NS}"><w:body>'.encode())
+            # DEFLATE shrinks the repetitive XML roughly 4x; aim the raw XML at that
+            written = 0
+            while written < target_bytes * 4:
+                chunk = _docx_paragraph(_paragraph(rng, 3))
+                paragraphs += 1
+                if paragraphs % 50 == 0:
+                    cells = "".join(
+                        f"<w:tc>{_docx_paragraph(rng.choice(WORDS))}</w:tc>" for _ in range(4)
+                    )
+                    chunk += f"<w:tbl><w:tr>{cells}</w:tr><w:tr>{cells}</w:tr></w:tbl>"
+                data = chunk.encode("utf-8")
+                part.write(data)
+                written += len(data)
+            part.write(b"</w:body></w:document>")
+    return paragraphs, "paragraphs"
+
+
+def make_xlsx(path: str, target_bytes: int, seed: int = 0) -> Tuple[int, str]:
+    """Two sheets of mixed-type rows written with openpyxl in write-only mode."""
+    import openpyxl
+
+    rng = random.Random(seed)
+    workbook = openpyxl.Workbook(write_only=True)
+    fixed = datetime.datetime(2000, 1, 1)
+    workbook.properties.created = workbook.properties.modified = fixed
+    sheets = [workbook.create_sheet("Orders"), workbook.create_sheet("Notes")]
+    for sheet in sheets:
+        sheet.append(["id", "name", "region", "amount", "ratio", "active", "date", "note"])
+    # A compressed row is around 40 bytes
+    rows = max(2, target_bytes // 40)
+    for i in range(rows):
+        sheets[i % 2].append([
+            i, rng.choice(WORDS), rng.choice(WORDS), rng.randint(0, 10**6), round(rng.random(), 6),
+            rng.random() < 0.5, fixed + datetime.timedelta(days=rng.randint(0, 3650)), _sentence(rng, 3, 8),
+        ])
+    tmp = path + ".tmp"
+    workbook.save(tmp)
+    # Re-pack with fixed member timestamps so the bytes are reproducible
+    with zipfile.ZipFile(tmp) as src, zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as dst:
+        for name in src.namelist():
+            dst.writestr(_zip_entry(name), src.read(name))
+    os.remove(tmp)
+    return rows, "rows"
+
+
+def make_html(path: str, target_bytes: int, seed: int = 0) -> Tuple[int, str]:
+    """A saved-page style document: articles wrapped in nav, script, style and footer boilerplate."""
+    rng = random.Random(seed)
+    sections = written = 0
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        head = (
+            "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>Synthetic page</title>\n"
+            "<style>body { font: 14px sans-serif } .note > p { margin: 0 }</style></head>\n<body>\n"
+        )
+        f.write(head)
+        written += len(head)
+        while written < target_bytes:
+            sections += 1
+            rows = "".join(
+                f"<tr><td>{rng.choice(WORDS)}</td><td>{rng.randint(0, 9999)}</td></tr>" for _ in range(4)
+            )
+            block = (
+                f"<nav><ul><li><a href=\"/{sections}\">{rng.choice(WORDS)}</a></li>"
+                f"<li><a href=\"/{sections}/next\">next</a></li></ul></nav>\n"
+                f"<script>var s{sections} = {{\"id\": {sections}}}; if (s{sections}.id < 0) {{ track(\"<p>\"); }}</script>\n"
+                f"<article class=\"note\"><h2>Section {sections} &amp; {rng.choice(WORDS)}</h2>\n"
+                f"<p>{_paragraph(rng)}</p>\n<p>{_sentence(rng)} <b>{rng.choice(WORDS)}</b> &mdash; "
+                f"<a href=\"https://example.com/{sections}\">{rng.choice(WORDS)}</a>.</p>\n"
+                f"<table><tr><th>name</th><th>value</th></tr>{rows}</table></article>\n"
+                f"<footer><p>&copy; {sections} Example</p></footer>\n"
+            )
+            f.write(block)
+            written += len(block)
+        f.write("</body></html>\n")
+    return sections, "sections"
+
+
+def make_pdf(path: str, target_bytes: int, seed: int = 0) -> Tuple[int, str]:
+    """Text-only A4 pages written with PyMuPDF (~45 lines each)."""
+    import fitz  # PyMuPDF
+
+    rng = random.Random(seed)
+    # A compressed text page is around 2 KB
+    pages = max(1, target_bytes // 2048)
+    doc = fitz.open()
+    for number in range(pages):
+        page = doc.new_page()
+        text = "\n".join([f"Page {number + 1}"] + [_sentence(rng, 8, 12) for _ in range(45)])
+        page.insert_text((50, 60), text, fontsize=8)
+    doc.set_metadata({})  # no creation/modification dates
+    doc.save(path, deflate=True, no_new_id=True)
+    doc.close()
+    return pages, "pages"
+
+
+# format name -> (file extension, generator)
+GENERATORS: Dict[str, Tuple[str, Callable[..., Tuple[int, str]]]] = {
+    "pdf": (".pdf", make_pdf),
+    "docx": (".docx", make_docx),
+    "csv": (".csv", make_csv),
+    "xlsx": (".xlsx", make_xlsx),
+    "json": (".json", make_json),
+    "yaml": (".yaml", make_yaml),
+    "toml": (".toml", make_toml),
+    "md": (".md", make_md),
+    "html": (".html", make_html),
+    "txt": (".txt", make_txt),
+}
@@ -1,27 +1,12 @@
 # extractor_factory.py
-import os
-from extractors import (
-    PDFExtractor, DocxExtractor, CSVExtractor, JSONExtractor,
-    TXTExtractor, MarkdownExtractor, YAMLExtractor, TOMLExtractor
-)
+# Thin CLI-facing wrapper around the shared, lazily-importing extractor registry.
+from services.extractors.registry import registry
 
-EXT_MAP = {
-    ".pdf": PDFExtractor,
-    ".docx": DocxExtractor,
-    ".csv": CSVExtractor,
-    ".json": JSONExtractor,
-    ".txt": TXTExtractor,
-    ".md": MarkdownExtractor,
-    ".markdown": MarkdownExtractor,
-    ".yml": YAMLExtractor,
-    ".yaml": YAMLExtractor,
-    ".toml": TOMLExtractor,
-}
+EXT_MAP = registry
 
 
-def get_extractor(file_path: str):
-    _, ext = os.path.splitext(file_path.lower())
-    extractor_cls = EXT_MAP.get(ext)
-    if not extractor_cls:
-        raise ValueError(f"No extractor implemented for extension: {ext}")
-    return extractor_cls(file_path)
+def get_extractor(file_path: str, **options):
+    try:
+        return registry.create(file_path, **options)
+    except ValueError:
+        raise ValueError(f"No extractor implemented for extension: {registry.extension_of(file_path)}") from None
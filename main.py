@@ -1,49 +1,195 @@
 # main.py
 import argparse
+import contextlib
+import glob
 import os
-from extractor_factory import get_extractor
+import shutil
+import sys
+import tempfile
+
+from extractor_factory import EXT_MAP, get_extractor
+from services.extractors.base_extractor import DEFAULT_CHUNK_SIZE
+from services.extractors.parallel import ordered_imap
+
+PREVIEW_CHARS = 500
+OUTPUT_SUFFIX = "_extracted.txt"
+
+
+def expand_inputs(patterns):
+    """Turn file paths, glob patterns and directories into a de-duplicated list of supported files."""
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, dirs, names in os.walk(pattern):
+                dirs.sort()
+                files.extend(
+                    os.path.join(root, name) for name in sorted(names)
+                    if EXT_MAP.extension_of(name) in EXT_MAP and not name.endswith(OUTPUT_SUFFIX)
+                )
+        elif glob.has_magic(pattern):
+            files.extend(
+                p for p in sorted(glob.glob(pattern, recursive=True))
+                if os.path.isfile(p) and not p.endswith(OUTPUT_SUFFIX)
+            )
+        else:
+            files.append(pattern)  # reported later if missing or unsupported
+
+    seen = set()
+    unique = []
+    for path in files:
+        key = os.path.abspath(path)
+        if key not in seen:
+            seen.add(key)
+            unique.append(path)
+    return unique
+
+
+def output_path_for(file_path, output_dir, common_root, taken):
+    """
+    ``<name>_extracted.txt`` next to the input, or mirrored under ``output_dir``.
+
+    If another input of this run already claimed that name (``report.pdf``
+    and ``report.docx``), the extension is kept: ``report_docx_extracted.txt``.
+    """
+    stem, ext = os.path.splitext(file_path)
+    candidates = [stem + OUTPUT_SUFFIX, f"{stem}_{ext.lstrip('.')}{OUTPUT_SUFFIX}"]
+    for candidate in candidates:
+        if output_dir:
+            candidate = os.path.join(output_dir, os.path.relpath(os.path.abspath(candidate), common_root))
+        if os.path.abspath(candidate) not in taken:
+            break
+    taken.add(os.path.abspath(candidate))
+    return candidate
+
+
+def extract_file(file_path, output_path, head=None, pages=None):
+    """
+    Stream the text of ``file_path`` into ``output_path`` (standard output if None).
+
+    Extraction stops as soon as ``head`` characters have been written, so a
+    preview never parses the rest of the document.
+
+    Returns a (file_path, output_path, chars written, preview, error) tuple.
+    """
+    if not os.path.isfile(file_path):
+        return file_path, output_path, 0, "", "File not found"
+    options = {}
+    if pages is not None and EXT_MAP.extension_of(file_path) == ".pdf":
+        options["max_pages"] = pages
+    try:
+        extractor = get_extractor(file_path, **options)
+        if output_path:
+            os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+            target = open(output_path, "w", encoding="utf-8")
+        else:
+            target = contextlib.nullcontext(sys.stdout)
+        chars = 0
+        preview = ""
+        # a short --head only needs one small chunk, not a full 64K one
+        chunk_size = DEFAULT_CHUNK_SIZE if head is None else max(1, min(head, DEFAULT_CHUNK_SIZE))
+        chunks = extractor.iter_chunks(chunk_size)
+        try:
+            with target as f:
+                for chunk in chunks:
+                    if head is not None and chars + len(chunk) >= head:
+                        chunk = chunk[:head - chars]
+                    f.write(chunk)
+                    chars += len(chunk)
+                    if len(preview) < PREVIEW_CHARS:
+                        preview += chunk[:PREVIEW_CHARS - len(preview)]
+                    if head is not None and chars >= head:
+                        break
+        finally:
+            chunks.close()  # stop the extractor right away when cut short
+    except Exception as exc:
+        if output_path and os.path.exists(output_path):
+            os.remove(output_path)  # no half-written output
+        return file_path, output_path, 0, "", f"{type(exc).__name__}: {exc}"
+    return file_path, output_path, chars, preview, None
+
+
+def run_jobs(tasks, jobs):
+    """Run ``extract_file`` over ``tasks``, yielding results in input order."""
+    if jobs <= 1:
+        for task in tasks:
+            yield extract_file(*task)
+    else:
+        yield from ordered_imap(extract_file, tasks, workers=jobs)
 
 
 def main():
     # Step 1: Create command-line argument parser
     parser = argparse.ArgumentParser(description="Universal text extractor")
-    parser.add_argument("file", help="Path to input file")
+    parser.add_argument("paths", nargs="+", metavar="path",
+                        help="Input files, glob patterns (quote them, '**' recurses) or directories")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Extract this many files in parallel")
+    parser.add_argument("--stdout", action="store_true",
+                        help="Stream extracted text to standard output instead of writing files")
+    parser.add_argument("--output-dir", help="Write <name>_extracted.txt files here instead of next to the inputs")
+    parser.add_argument("--head", type=int, metavar="N", help="Stop after the first N characters of each file")
+    parser.add_argument("--pages", type=int, metavar="N", help="Only extract the first N pages of PDF files")
     args = parser.parse_args()
 
-    # Step 2: Verify file exists
-    if not os.path.exists(args.file):
-        print(f"❌ File not found: {args.file}")
-        return
-
-    # Step 3: Get appropriate extractor based on file type
-    extractor = get_extractor(args.file)
-    if not extractor:
-        print(f"❌ Unsupported file format: {args.file}")
-        return
-
-    # Step 4: Extract text content
-    print("🔍 Extracting text... please wait.")
-    text = extractor.extract_text()
-
-    # Step 5: Save extracted text to a .txt file
-    base_name = os.path.splitext(args.file)[0]
-    output_path = base_name + "_extracted.txt"
+    # Step 2: Collect the files to process
+    files = expand_inputs(args.paths)
+    if not files:
+        print("❌ No matching files found", file=sys.stderr)
+        sys.exit(1)
+    log = sys.stderr if args.stdout else sys.stdout
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(text)
+    # Step 3: Decide where each file's text goes. With --stdout and -j > 1
+    # every file is written to a scratch file and copied out in input order,
+    # so parallel workers never interleave their output.
+    jobs = max(1, args.jobs)
+    scratch_dir = tempfile.mkdtemp(prefix="nexa_extract_") if args.stdout and jobs > 1 else None
+    common_root = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in files])
+    taken = set()
+    tasks = []
+    for index, file_path in enumerate(files):
+        if args.stdout:
+            output_path = os.path.join(scratch_dir, f"{index}.txt") if scratch_dir else None
+        else:
+            output_path = output_path_for(file_path, args.output_dir, common_root, taken)
+        tasks.append((file_path, output_path, args.head, args.pages))
 
-    # Step 6: Print success message
-    print("\n✅ Extraction completed successfully!")
-    print(f"📄 Extracted text saved to: {output_path}\n")
+    # Step 4: Extract (in parallel with -j) and report each file as it is written
+    print(f"🔍 Extracting text from {len(files)} file(s)... please wait.", file=log)
+    failures = 0
+    last = None
+    try:
+        for file_path, output_path, chars, preview, error in run_jobs(tasks, jobs):
+            if error:
+                failures += 1
+                print(f"❌ {file_path}: {error}", file=log)
+                continue
+            if args.stdout:
+                if scratch_dir:
+                    with open(output_path, "r", encoding="utf-8") as f:
+                        shutil.copyfileobj(f, sys.stdout)
+                    os.remove(output_path)
+                sys.stdout.write("\n")
+                sys.stdout.flush()
+            elif len(files) > 1:
+                print(f"✅ {file_path} -> {output_path} ({chars} characters)", file=log)
+            last = (output_path, preview)
+    finally:
+        if scratch_dir:
+            shutil.rmtree(scratch_dir, ignore_errors=True)
 
-    # (Optional) print first few lines for previ
-    # 
-    # ew
-    print("Preview:")
-    print("-" * 50)
-    print(text[:500])  # shows first 500 characters
-    print("-" * 50)
+    # Step 5: Print a summary; for a single file keep the familiar preview
+    if len(files) == 1 and last and not args.stdout:
+        output_path, preview = last
+        print("\n✅ Extraction completed successfully!")
+        print(f"📄 Extracted text saved to: {output_path}\n")
+        print("Preview:")
+        print("-" * 50)
+        print(preview)  # shows first 500 characters
+        print("-" * 50)
+    elif len(files) > 1:
+        print(f"\n{len(files) - failures}/{len(files)} file(s) extracted", file=log)
 
+    if failures:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
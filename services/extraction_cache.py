@@ -0,0 +1,211 @@
+"""
+Persistent, content-addressed cache for extracted document text.
+
+Entries are keyed by the file's content hash plus the extractor class,
+its ``version`` and the options it was built with. To avoid re-hashing
+unchanged files, the (size, mtime, inode) of every path seen is kept
+alongside its hash; only when that identity changes is the file read
+again. Extracted text is stored zlib-compressed, one blob per entry,
+and the least recently used blobs are evicted once the cache grows past
+``max_bytes``.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class ExtractionCache:
+    """On-disk LRU cache of extracted text with hit/miss counters."""
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_CACHE_MAX_BYTES, compress_level: int = 6):
+        """
+        :param cache_dir: Directory holding the index database and compressed blobs
+        :param max_bytes: Upper bound for the total compressed size of all blobs
+        :param compress_level: zlib compression level (1 = fastest, 9 = smallest)
+        """
+        self.cache_dir = cache_dir
+        self.blobs_dir = os.path.join(cache_dir, "blobs")
+        self.db_path = os.path.join(cache_dir, "index.db")
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.blobs_dir, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS file_identity (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                digest TEXT NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access)")
+        conn.commit()
+        conn.close()
+
+    # ---------------------------------------------------------------
+    # Keys
+    # ---------------------------------------------------------------
+
+    def file_digest(self, file_path: str) -> str:
+        """Return the content hash of a file, re-hashing only if its size, mtime or inode changed."""
+        path = os.path.realpath(file_path)
+        st = os.stat(path)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            row = conn.execute(
+                "SELECT size, mtime_ns, inode, digest FROM file_identity WHERE path = ?", (path,)
+            ).fetchone()
+            if row and row[:3] == (st.st_size, st.st_mtime_ns, st.st_ino):
+                return row[3]
+
+            digest = hash_file(path)
+            conn.execute(
+                "INSERT OR REPLACE INTO file_identity (path, size, mtime_ns, inode, digest) VALUES (?, ?, ?, ?, ?)",
+                (path, st.st_size, st.st_mtime_ns, st.st_ino, digest),
+            )
+            conn.commit()
+            return digest
+        finally:
+            conn.close()
+
+    def key_for(self, file_path: str, extractor_cls: type, options: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key for extracting ``file_path`` with ``extractor_cls(**options)``."""
+        parts = {
+            "digest": self.file_digest(file_path),
+            "extractor": f"{extractor_cls.__module__}.{extractor_cls.__qualname__}",
+            "version": str(getattr(extractor_cls, "version", "")),
+            "options": options or {},
+        }
+        raw = json.dumps(parts, sort_keys=True, default=repr)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    # ---------------------------------------------------------------
+    # Entries
+    # ---------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached text for ``key`` or ``None`` on a miss."""
+        blob_path = self._blob_path(key)
+        try:
+            with open(blob_path, "rb") as f:
+                text = zlib.decompress(f.read()).decode("utf-8")
+        except (FileNotFoundError, zlib.error):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+        conn.commit()
+        conn.close()
+        with self._lock:
+            self.hits += 1
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Store ``text`` under ``key`` and evict old entries if the cache is over budget."""
+        data = zlib.compress(text.encode("utf-8"), self.compress_level)
+        if len(data) > self.max_bytes:
+            return
+
+        blob_path = self._blob_path(key)
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        tmp_path = f"{blob_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, blob_path)
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "INSERT OR REPLACE INTO entries (key, size, last_access) VALUES (?, ?, ?)",
+            (key, len(data), time.time()),
+        )
+        conn.commit()
+        conn.close()
+        self._evict()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the current size of the cache."""
+        conn = sqlite3.connect(self.db_path)
+        entries, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        conn.close()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        """Remove every cached entry (file identities are kept)."""
+        conn = sqlite3.connect(self.db_path)
+        keys = [row[0] for row in conn.execute("SELECT key FROM entries")]
+        conn.execute("DELETE FROM entries")
+        conn.commit()
+        conn.close()
+        for key in keys:
+            self._remove_blob(key)
+
+    def _evict(self) -> None:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            evicted = []
+            for key, size in conn.execute("SELECT key, size FROM entries ORDER BY last_access ASC"):
+                if total <= self.max_bytes:
+                    break
+                evicted.append(key)
+                total -= size
+            conn.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k in evicted])
+            conn.commit()
+        finally:
+            conn.close()
+        for key in evicted:
+            self._remove_blob(key)
+
+    def _blob_path(self, key: str) -> str:
+        return os.path.join(self.blobs_dir, key[:2], key + ".zz")
+
+    def _remove_blob(self, key: str) -> None:
+        try:
+            os.remove(self._blob_path(key))
+        except FileNotFoundError:
+            pass
+
+
+def hash_file(file_path: str) -> str:
+    """Return the BLAKE2b hex digest of a file's contents, read in 1 MB blocks."""
+    h = hashlib.blake2b(digest_size=20)
+    with open(file_path, "rb") as f:
+        while True:
+            block = f.read(_HASH_BLOCK_SIZE)
+            if not block:
+                break
+            h.update(block)
+    return h.hexdigest()
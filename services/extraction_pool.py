@@ -0,0 +1,229 @@
+"""
+Sandboxed extraction workers.
+
+Each extraction runs in a separate worker process with an address-space
+limit, a wall-clock timeout enforced by the parent, and recycling after
+a fixed number of jobs. A worker that hangs, runs out of memory or
+crashes is killed and replaced, and the caller gets a structured failure
+instead of an exception or a stuck queue:
+
+    {
+        'path': str,
+        'text': str or None,
+        'error': str or None,
+        'status': 'ok' | 'error' | 'timeout' | 'memory_limit' | 'crashed',
+        'elapsed': float (seconds)
+    }
+"""
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .extractors.parallel import resolve_workers
+from .extractors.registry import registry
+
+try:
+    import resource  # POSIX only
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+DEFAULT_TIMEOUT_SECONDS = 120.0
+DEFAULT_MEMORY_LIMIT_MB = 2048
+DEFAULT_MAX_JOBS_PER_WORKER = 100
+
+# Job statuses after which the worker is unusable and is killed rather than
+# asked to exit (an extractor error leaves the worker healthy).
+_KILL_STATUSES = frozenset({"timeout", "crashed", "memory_limit"})
+
+logger = logging.getLogger(__name__)
+
+
+def _worker_main(conn, memory_limit_bytes: Optional[int]) -> None:
+    """Worker process loop: receive (extractor_cls, path, options) jobs until told to stop."""
+    if memory_limit_bytes and resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if job is None:
+            return
+        extractor_cls, file_path, options = job
+        try:
+            text = extractor_cls(file_path, **options).extract_text()
+            reply = ("ok", text)
+        except MemoryError:
+            reply = ("memory_limit", "MemoryError: extraction exceeded the worker memory limit")
+        except Exception as exc:
+            reply = ("error", f"{type(exc).__name__}: {exc}")
+        try:
+            conn.send(reply)
+        except MemoryError:
+            conn.send(("memory_limit", "MemoryError: result too large for the worker memory limit"))
+
+
+class _Worker:
+    """Parent-side handle of one worker process."""
+
+    def __init__(self, context, memory_limit_bytes: Optional[int]):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, memory_limit_bytes), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=5)
+        self.conn.close()
+
+
+class SandboxedExtractionPool:
+    """Pool of isolated, recyclable extraction worker processes."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        timeout: Optional[float] = DEFAULT_TIMEOUT_SECONDS,
+        memory_limit_mb: Optional[int] = DEFAULT_MEMORY_LIMIT_MB,
+        max_jobs_per_worker: int = DEFAULT_MAX_JOBS_PER_WORKER,
+    ):
+        """
+        :param workers: Number of worker processes (defaults to the CPU count)
+        :param timeout: Wall-clock seconds allowed per file (``None`` = no limit)
+        :param memory_limit_mb: Address-space limit per worker in MB (``None`` = no
+            limit; not enforced on platforms without the ``resource`` module)
+        :param max_jobs_per_worker: Replace a worker after this many files, so
+            leaks in parsing libraries cannot accumulate
+        """
+        self.workers = resolve_workers(workers)
+        self.timeout = timeout
+        self.memory_limit_bytes = memory_limit_mb * 1024 * 1024 if memory_limit_mb else None
+        self.max_jobs_per_worker = max(1, max_jobs_per_worker)
+
+        # spawn gives every worker a clean interpreter (no inherited threads or locks)
+        self._context = multiprocessing.get_context("spawn")
+        self._idle = queue.LifoQueue()
+        self._all = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._dispatcher = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="extraction-sandbox")
+        for _ in range(self.workers):
+            self._idle.put(None)  # slot; the process is started on first use
+
+    def submit(self, extractor_cls: type, file_path: str, options: Optional[Dict[str, Any]] = None) -> "Future":
+        """Schedule one extraction; the future resolves to a result dict (it never raises)."""
+        if self._closed:
+            raise RuntimeError("SandboxedExtractionPool is closed")
+        return self._dispatcher.submit(self._run, extractor_cls, file_path, options or {})
+
+    def extract(self, file_path: str, **extractor_options: Any) -> Dict[str, Any]:
+        """Extract one file in a sandboxed worker and return its result dict."""
+        try:
+            extractor_cls = registry.get_class(file_path)
+        except ValueError as exc:
+            return {'path': file_path, 'text': None, 'error': str(exc), 'status': 'error', 'elapsed': 0.0}
+        return self.submit(extractor_cls, file_path, extractor_options).result()
+
+    def extract_many(self, paths: List[str], **extractor_options: Any) -> List[Dict[str, Any]]:
+        """Extract many files concurrently; results come back in input order."""
+        futures = []
+        for file_path in paths:
+            try:
+                extractor_cls = registry.get_class(file_path)
+            except ValueError as exc:
+                done = Future()
+                done.set_result({'path': file_path, 'text': None, 'error': str(exc), 'status': 'error', 'elapsed': 0.0})
+                futures.append(done)
+                continue
+            futures.append(self.submit(extractor_cls, file_path, extractor_options))
+        return [f.result() for f in futures]
+
+    def close(self) -> None:
+        """Stop all worker processes."""
+        self._closed = True
+        self._dispatcher.shutdown(wait=True)
+        with self._lock:
+            workers, self._all = list(self._all), set()
+        for worker in workers:
+            worker.stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # ---------------------------------------------------------------
+    # Internals
+    # ---------------------------------------------------------------
+
+    def _run(self, extractor_cls: type, file_path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+        worker = self._idle.get()
+        start = time.perf_counter()
+        try:
+            if worker is None or not worker.process.is_alive():
+                worker = self._spawn()
+            status, payload = self._call(worker, (extractor_cls, file_path, options))
+        except Exception as exc:  # e.g. unpicklable options
+            status, payload = "error", f"{type(exc).__name__}: {exc}"
+        finally:
+            if worker is not None:
+                worker.jobs += 1
+                kill = status in _KILL_STATUSES
+                if kill or worker.jobs >= self.max_jobs_per_worker:
+                    self._retire(worker, kill=kill)
+                    worker = None
+            self._idle.put(worker)
+
+        result = {
+            'path': file_path,
+            'text': payload if status == "ok" else None,
+            'error': None if status == "ok" else payload,
+            'status': status,
+            'elapsed': time.perf_counter() - start,
+        }
+        if status != "ok":
+            logger.warning("Sandboxed extraction of %s failed (%s): %s", file_path, status, payload)
+        return result
+
+    def _call(self, worker: _Worker, job) -> tuple:
+        worker.conn.send(job)
+        if not worker.conn.poll(self.timeout):
+            return "timeout", f"Extraction exceeded the {self.timeout:g}s timeout"
+        try:
+            return worker.conn.recv()
+        except (EOFError, OSError):
+            worker.process.join(timeout=5)
+            return "crashed", f"Worker process died (exit code {worker.process.exitcode})"
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._context, self.memory_limit_bytes)
+        with self._lock:
+            self._all.add(worker)
+        return worker
+
+    def _retire(self, worker: _Worker, kill: bool) -> None:
+        with self._lock:
+            self._all.discard(worker)
+        if kill:
+            worker.kill()
+        else:
+            worker.stop()
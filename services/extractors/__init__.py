@@ -1,15 +1,39 @@
 # extractors/__init__.py
-from .pdf_extractor import PDFExtractor
-from .docx_extractor import DocxExtractor
-from .csv_extractor import CSVExtractor
-from .json_extractor import JSONExtractor
-from .txt_extractor import TXTExtractor
-from .markdown_extractor import MarkdownExtractor
-from .yaml_extractor import YAMLExtractor
-from .toml_extractor import TOMLExtractor
+# Extractor classes are imported lazily (PEP 562) so that importing the
+# package does not load PyMuPDF, pandas, PyYAML, ... until they are used.
+import importlib
+
+from .base_extractor import BaseExtractor
+from .result import ExtractionResult
+from .registry import ExtractorRegistry, registry, register_extractor, get_extractor
+
+_LAZY_CLASSES = {
+    "PDFExtractor": ".pdf_extractor",
+    "DocxExtractor": ".docx_extractor",
+    "CSVExtractor": ".csv_extractor",
+    "JSONExtractor": ".json_extractor",
+    "JSONLinesExtractor": ".jsonl_extractor",
+    "TXTExtractor": ".txt_extractor",
+    "MarkdownExtractor": ".markdown_extractor",
+    "YAMLExtractor": ".yaml_extractor",
+    "TOMLExtractor": ".toml_extractor",
+    "HTMLExtractor": ".html_extractor",
+    "XLSXExtractor": ".xlsx_extractor",
+    "ArchiveExtractor": ".archive_extractor",
+    "CompressedExtractor": ".compressed_extractor",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_CLASSES:
+        module = importlib.import_module(_LAZY_CLASSES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "PDFExtractor", "DocxExtractor", "CSVExtractor",
-    "JSONExtractor", "TXTExtractor", "MarkdownExtractor",
-    "YAMLExtractor", "TOMLExtractor",
+    "JSONExtractor", "JSONLinesExtractor", "TXTExtractor", "MarkdownExtractor",
+    "YAMLExtractor", "TOMLExtractor", "HTMLExtractor", "XLSXExtractor", "ArchiveExtractor", "CompressedExtractor",
+    "BaseExtractor", "ExtractionResult", "ExtractorRegistry", "registry", "register_extractor", "get_extractor",
 ]
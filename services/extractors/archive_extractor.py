@@ -0,0 +1,269 @@
+"""
+Extractor for zip and tar archives that never unpacks them to disk.
+
+Members are read one at a time (tar archives in pure streaming mode),
+copied into an in-memory buffer - or an anonymous temporary file once
+they outgrow ``spool_bytes`` - and handed to the extractor registered for
+their extension. Limits on member count, total uncompressed bytes and
+compression ratio guard against archive bombs.
+"""
+import io
+import logging
+import os
+import shutil
+import tarfile
+import tempfile
+import zipfile
+from collections import deque
+from typing import IO, Any, Dict, Iterator, Optional, Tuple
+
+from .base_extractor import BaseExtractor
+from .parallel import ordered_imap, resolve_workers
+from .registry import registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MEMBERS = 10_000
+DEFAULT_MAX_TOTAL_BYTES = 1024 * 1024 * 1024
+DEFAULT_MAX_RATIO = 100.0
+# Members up to this size stay in memory; bigger ones go to a temporary file.
+DEFAULT_SPOOL_BYTES = 8 * 1024 * 1024
+# Below this many uncompressed bytes the compression ratio is not checked:
+# tiny, highly repetitive files legitimately compress very well.
+RATIO_MIN_BYTES = 1024 * 1024
+
+_COPY_BLOCK = 1024 * 1024
+_ZIP_MAGIC = (b"PK\x03\x04", b"PK\x05\x06")  # local file header, empty archive
+
+
+def _extract_member(extractor_cls: type, file_path: str, options: Optional[Dict[str, Any]]) -> Tuple[str, Optional[str]]:
+    """Worker entrypoint: return ``(text, error)`` for one spooled member."""
+    try:
+        return extractor_cls(file_path, **(options or {})).extract_text(), None
+    except Exception as exc:
+        return "", f"{type(exc).__name__}: {exc}"
+
+
+class ArchiveExtractor(BaseExtractor):
+    """Extractor for .zip, .tar and compressed tar archives."""
+
+    cost_weight = 2.0
+    random_access = True
+
+    def __init__(
+        self,
+        file_path: str,
+        max_members: int = DEFAULT_MAX_MEMBERS,
+        max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES,
+        max_ratio: float = DEFAULT_MAX_RATIO,
+        spool_bytes: int = DEFAULT_SPOOL_BYTES,
+        workers: int = 1,
+        member_options: Optional[Dict[str, Dict[str, Any]]] = None,
+        on_error: str = "skip",
+    ):
+        """
+        :param file_path: Path to the archive
+        :param max_members: Maximum number of file members; more raises ValueError
+        :param max_total_bytes: Maximum uncompressed bytes read over all members
+        :param max_ratio: Maximum uncompressed/compressed size ratio (per zip
+            member, over the whole stream for tar archives)
+        :param spool_bytes: Members up to this size are buffered in memory,
+            larger ones in an anonymous temporary file
+        :param workers: Number of worker processes extracting members in
+            parallel (``1`` extracts in-process, ``None`` or ``0`` uses one
+            worker per CPU); members are then written to temporary files
+        :param member_options: Extractor options per member extension, e.g.
+            ``{".pdf": {"max_pages": 5}}``
+        :param on_error: ``"skip"`` logs and skips members that fail to
+            extract, ``"raise"`` propagates the error
+        """
+        super().__init__(file_path)
+        if on_error not in ("skip", "raise"):
+            raise ValueError("on_error must be 'skip' or 'raise'")
+        self.max_members = max_members
+        self.max_total_bytes = max_total_bytes
+        self.max_ratio = max_ratio
+        self.spool_bytes = max(0, spool_bytes)
+        self.workers = workers
+        self.member_options = member_options or {}
+        self.on_error = on_error
+
+    def iter_text(self):
+        """Yield each supported member's text under a ``=== name ===`` header, in archive order."""
+        first = True
+        for name, text in self._iter_member_texts():
+            if not text:
+                continue
+            if not first:
+                yield "\n\n"
+            first = False
+            yield f"=== {name} ===\n"
+            yield text
+
+    def _iter_member_texts(self) -> Iterator[Tuple[str, str]]:
+        workers = resolve_workers(self.workers)
+        if workers <= 1:
+            for name, extractor_cls, stream in self._iter_members():
+                with stream:
+                    try:
+                        with self._stage("members"):
+                            text = extractor_cls(stream, **self._options_for(name)).extract_text()
+                    except Exception as exc:
+                        self._member_failed(name, f"{type(exc).__name__}: {exc}", exc)
+                        continue
+                yield name, text
+            return
+
+        # Parallel: members are written to temporary files (workers need a
+        # path) and deleted as soon as their text comes back, so at most the
+        # in-flight window is on disk at once
+        with tempfile.TemporaryDirectory(prefix="nexa_archive_") as tmp:
+            in_flight = deque()
+
+            def tasks():
+                for index, (name, extractor_cls, stream) in enumerate(self._iter_members()):
+                    path = os.path.join(tmp, f"{index}{registry.extension_of(name)}")
+                    with stream, open(path, "wb") as f:
+                        shutil.copyfileobj(stream, f, _COPY_BLOCK)
+                    in_flight.append((name, path))
+                    yield extractor_cls, path, self._options_for(name)
+
+            for text, error in self._timed("members", ordered_imap(_extract_member, tasks(), workers=workers)):
+                name, path = in_flight.popleft()
+                os.remove(path)
+                if error:
+                    self._member_failed(name, error)
+                    continue
+                yield name, text
+
+    def _options_for(self, name: str) -> Dict[str, Any]:
+        return self.member_options.get(registry.extension_of(name), {})
+
+    def _member_failed(self, name: str, error: str, exc: Optional[Exception] = None) -> None:
+        if self.on_error == "raise":
+            if exc is not None:
+                raise exc
+            raise ValueError(f"Failed to extract archive member {name}: {error}")
+        logger.warning("Skipping archive member %s: %s", name, error)
+
+    def _extractor_for(self, name: str) -> Optional[type]:
+        """Extractor class for a member, or None for unsupported types and nested archives or compressed files."""
+        from .compressed_extractor import CompressedExtractor
+
+        extension = registry.extension_of(name)
+        if extension not in registry:
+            return None
+        extractor_cls = registry[extension]
+        if issubclass(extractor_cls, (ArchiveExtractor, CompressedExtractor)):
+            return None
+        return extractor_cls
+
+    def _iter_members(self) -> Iterator[Tuple[str, type, IO[bytes]]]:
+        """Yield ``(name, extractor class, spooled stream)`` for every supported member."""
+        self._members = 0
+        self._total = 0
+        with self.open_binary() as f:
+            # Sniff the leading magic rather than zipfile.is_zipfile(): that
+            # searches for a trailing zip directory and matches uncompressed
+            # tars whose last member is itself a zip (.docx, .xlsx, ...).
+            # peek() leaves the position alone, so tar streams need no seek
+            magic = f.peek(4)[:4]
+            if magic in _ZIP_MAGIC:
+                if not f.seekable():
+                    raise ValueError("Zip archives need a file path or a seekable stream")
+                yield from self._iter_zip(f)
+            else:
+                yield from self._iter_tar(f)
+
+    def _iter_zip(self, f) -> Iterator[Tuple[str, type, IO[bytes]]]:
+        with zipfile.ZipFile(f) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                self._count_member()
+                extractor_cls = self._extractor_for(info.filename)
+                if extractor_cls is None:
+                    continue
+                self._count("members")
+                # Declared sizes are checked up front and the real byte
+                # counts again while copying, since headers can lie
+                self._check_ratio(info.filename, info.file_size, info.compress_size)
+                try:
+                    with archive.open(info) as member:
+                        with self._stage("spool"):
+                            stream = self._spool(info.filename, member, info.compress_size)
+                except ValueError:
+                    raise  # archive limits
+                except Exception as exc:
+                    # Bad CRC, encrypted or unsupported member: only this one is lost
+                    self._member_failed(info.filename, f"{type(exc).__name__}: {exc}", exc)
+                    continue
+                yield info.filename, extractor_cls, stream
+
+    def _iter_tar(self, f) -> Iterator[Tuple[str, type, IO[bytes]]]:
+        archive_size = self.source_size()
+        try:
+            archive = tarfile.open(fileobj=f, mode="r|*")
+        except tarfile.TarError as exc:
+            raise ValueError(f"Not a zip or tar archive: {exc}") from None
+        with archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                self._count_member()
+                extractor_cls = self._extractor_for(member.name)
+                if extractor_cls is None:
+                    continue
+                self._count("members")
+                if self._total + member.size > self.max_total_bytes:
+                    raise ValueError(f"Archive exceeds {self.max_total_bytes} uncompressed bytes at {member.name}")
+                # Compressed bytes per member are unknown in a tar stream: the
+                # ratio is checked for everything read so far against the archive
+                try:
+                    with self._stage("spool"):
+                        stream = self._spool(member.name, archive.extractfile(member), archive_size, cumulative=True)
+                except ValueError:
+                    raise  # archive limits
+                except Exception as exc:
+                    self._member_failed(member.name, f"{type(exc).__name__}: {exc}", exc)
+                    continue
+                yield member.name, extractor_cls, stream
+
+    def _count_member(self) -> None:
+        self._members += 1
+        if self._members > self.max_members:
+            raise ValueError(f"Archive has more than {self.max_members} members")
+
+    def _check_ratio(self, name: str, size: int, compressed: Optional[int]) -> None:
+        if compressed is None:
+            return  # size of a non-seekable archive stream is unknown
+        if size >= RATIO_MIN_BYTES and size > self.max_ratio * max(1, compressed):
+            raise ValueError(
+                f"Compression ratio of {name} exceeds {self.max_ratio:g} ({size} bytes from {compressed})"
+            )
+
+    def _spool(self, name: str, source: IO[bytes], compressed: Optional[int], cumulative: bool = False) -> IO[bytes]:
+        """Copy a member into memory (or a temporary file past ``spool_bytes``), enforcing the byte limits."""
+        buffer = io.BytesIO()
+        size = 0
+        try:
+            while True:
+                block = source.read(_COPY_BLOCK)
+                if not block:
+                    break
+                size += len(block)
+                self._total += len(block)
+                if self._total > self.max_total_bytes:
+                    raise ValueError(f"Archive exceeds {self.max_total_bytes} uncompressed bytes at {name}")
+                self._check_ratio(name, self._total if cumulative else size, compressed)
+                if isinstance(buffer, io.BytesIO) and size > self.spool_bytes:
+                    spilled = tempfile.TemporaryFile()
+                    spilled.write(buffer.getbuffer())
+                    buffer.close()
+                    buffer = spilled
+                buffer.write(block)
+        except BaseException:
+            buffer.close()
+            raise
+        buffer.seek(0)
+        return buffer
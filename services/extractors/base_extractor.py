@@ -1,13 +1,262 @@
 # extractors/base_extractor.py
+import io
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import CancelledError
+from contextlib import contextmanager
+from typing import IO, BinaryIO, Dict, Iterable, Iterator, Optional, TypeVar, Union
+
+from .result import ExtractionResult
+
+T = TypeVar("T")
+
+# Default size (in characters) of the chunks produced by iter_chunks().
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class _StreamView(io.RawIOBase):
+    """Read-only view of a caller-owned binary stream; closing the view leaves the stream open."""
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def seekable(self) -> bool:
+        return self._stream.seekable()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._stream.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._stream.tell()
+
+    def fileno(self) -> int:
+        return self._stream.fileno()
+
 
 class BaseExtractor(ABC):
-    """Abstract base class for all extractors."""
+    """Abstract base class for all extractors.
+
+    Subclasses implement :meth:`iter_text`, a generator yielding the
+    document text piece by piece (pages, rows, paragraphs, ...). The
+    full-string :meth:`extract_text` and the streaming helpers
+    :meth:`iter_chunks` / :meth:`write_to` are built on top of it, so a
+    large document never has to be materialized as a single string.
+    """
+
+    # Bump whenever the text produced for the same input changes, so cached
+    # extractions made by an older implementation are not reused.
+    version = "1"
 
-    def __init__(self, file_path: str):
+    # Relative parsing cost per input byte, used to schedule expensive files
+    # first in batch extraction.
+    cost_weight = 1.0
+
+    # True for formats that need a seekable source (PDF, zip-based formats);
+    # streamed inputs such as decompressed files are spooled for them first.
+    random_access = False
+
+    # Stage timings and unit counts, only collected while extract_result()
+    # runs; None otherwise, so plain extraction pays nothing for them.
+    _timings: Optional[Dict[str, float]] = None
+    _counts: Optional[Dict[str, int]] = None
+
+    def __init__(self, file_path: Union[str, BinaryIO]):
+        """
+        :param file_path: Path of the document, or an open binary file object
+            (e.g. an archive member spooled to memory) read from its start
+        """
         self.file_path = file_path
 
+    @property
+    def is_path(self) -> bool:
+        """True when the source is a filesystem path rather than a file object."""
+        return isinstance(self.file_path, (str, os.PathLike))
+
+    def source_size(self) -> Optional[int]:
+        """Size of the source in bytes (None for a forward-only stream of unknown length)."""
+        if self.is_path:
+            return os.path.getsize(self.file_path)
+        stream = self.file_path
+        if not stream.seekable():
+            return None
+        position = stream.tell()
+        try:
+            return stream.seek(0, io.SEEK_END)
+        finally:
+            stream.seek(position)
+
     @abstractmethod
-    def extract_text(self) -> str:
-        """Read file and return extracted plain text."""
+    def iter_text(self) -> Iterator[str]:
+        """Yield the extracted plain text incrementally.
+
+        Concatenating every yielded piece gives the document text before
+        leading/trailing whitespace is stripped.
+        """
         pass
+
+    def extract_text(self, cancel_event: Optional[threading.Event] = None) -> str:
+        """Read file and return extracted plain text.
+
+        If ``cancel_event`` is given and gets set (e.g. from another
+        thread), extraction stops at the next piece of text and raises
+        ``concurrent.futures.CancelledError``.
+        """
+        pieces = self.iter_text()
+        if cancel_event is not None:
+            pieces = self._until_cancelled(pieces, cancel_event)
+        return "".join(pieces).strip()
+
+    @staticmethod
+    def _until_cancelled(pieces: Iterator[str], cancel_event: threading.Event) -> Iterator[str]:
+        try:
+            for piece in pieces:
+                if cancel_event.is_set():
+                    raise CancelledError()
+                yield piece
+        finally:
+            close = getattr(pieces, "close", None)
+            if close is not None:
+                close()  # release the file right away, not when the traceback is dropped
+
+    def extract_result(self, cancel_event: Optional[threading.Event] = None) -> ExtractionResult:
+        """Extract the text along with byte/character/page/row counts and per-stage timings."""
+        self._timings, self._counts = {}, {}
+        start = time.perf_counter()
+        try:
+            text = self.extract_text(cancel_event)
+            elapsed = time.perf_counter() - start
+            timings, counts = self._timings, self._counts
+        finally:
+            self._timings = self._counts = None
+        timings["total"] = elapsed
+        return ExtractionResult(
+            text=text,
+            extractor=type(self).__name__,
+            version=self.version,
+            path=os.fspath(self.file_path) if self.is_path else None,
+            bytes=self.source_size() or 0,
+            chars=len(text),
+            pages=counts.pop("pages", None),
+            rows=counts.pop("rows", None),
+            counts=counts,
+            timings=timings,
+        )
+
+    @contextmanager
+    def _stage(self, name: str):
+        """Charge the time spent in the ``with`` block to stage ``name`` (when instrumented)."""
+        if self._timings is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._timings[name] = self._timings.get(name, 0.0) + time.perf_counter() - start
+
+    def _timed(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        """Iterate ``iterable``, charging the time spent producing each item to stage ``name``."""
+        if self._timings is None:
+            return iter(iterable)
+        return self._iter_timed(name, iter(iterable), self._timings)
+
+    @staticmethod
+    def _iter_timed(name: str, iterator: Iterator[T], timings: Dict[str, float]) -> Iterator[T]:
+        clock = time.perf_counter
+        spent = 0.0
+        try:
+            while True:
+                start = clock()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    spent += clock() - start
+                    return
+                spent += clock() - start
+                yield item
+        finally:
+            timings[name] = timings.get(name, 0.0) + spent
+
+    def _count(self, name: str, n: int = 1) -> None:
+        """Add ``n`` units (``"pages"``, ``"rows"``, ...) to the counts of an instrumented run."""
+        if self._counts is not None:
+            self._counts[name] = self._counts.get(name, 0) + n
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        """Yield the extracted text re-packed into chunks of ``chunk_size`` characters.
+
+        The last chunk may be shorter. Leading and trailing whitespace of
+        the whole document is dropped, so ``"".join(iter_chunks())`` is
+        identical to :meth:`extract_text`.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+
+        buffer = []
+        buffered = 0
+        pending_ws = ""  # trailing whitespace held back until more text arrives
+        started = False
+
+        for piece in self.iter_text():
+            if not piece:
+                continue
+            if not started:
+                piece = piece.lstrip()
+                if not piece:
+                    continue
+                started = True
+            body = piece.rstrip()
+            if not body:
+                pending_ws += piece
+                continue
+            buffer.append(pending_ws + body)
+            buffered += len(pending_ws) + len(body)
+            pending_ws = piece[len(body):]
+
+            if buffered >= chunk_size:
+                data = "".join(buffer)
+                offset = 0
+                while len(data) - offset >= chunk_size:
+                    yield data[offset:offset + chunk_size]
+                    offset += chunk_size
+                rest = data[offset:]
+                buffer = [rest] if rest else []
+                buffered = len(rest)
+
+        if buffered:
+            yield "".join(buffer)
+
+    def write_to(self, stream: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Stream the extracted text into a writable text stream.
+
+        Returns the number of characters written.
+        """
+        written = 0
+        for chunk in self.iter_chunks(chunk_size):
+            stream.write(chunk)
+            written += len(chunk)
+        return written
+
+    def open_text(self, encoding: str = "utf-8"):
+        """Open the source file for reading text."""
+        if self.is_path:
+            return open(self.file_path, "r", encoding=encoding)
+        return io.TextIOWrapper(self.open_binary(), encoding=encoding)
+
+    def open_binary(self):
+        """Open the source file for reading bytes."""
+        if self.is_path:
+            return open(self.file_path, "rb")
+        if self.file_path.seekable():
+            self.file_path.seek(0)
+        return io.BufferedReader(_StreamView(self.file_path))
@@ -0,0 +1,134 @@
+"""
+Extractor for single-file compressed inputs (``.csv.gz``, ``.jsonl.zst``,
+``.txt.xz``, ...).
+
+The inner format comes from the file name without its compression suffix.
+The file is decompressed as a forward-only stream straight into the inner
+extractor, so memory stays bounded by that extractor's own buffers whatever
+the decompressed size. Formats that need random access (PDF, DOCX, zip) are
+the exception: they are spooled first, in memory up to ``spool_bytes`` and
+in an anonymous temporary file beyond that.
+"""
+import bz2
+import gzip
+import io
+import lzma
+import os
+import tempfile
+
+from .base_extractor import BaseExtractor
+from .registry import registry
+
+# Compressed inputs of random-access formats are kept in memory up to this size.
+DEFAULT_SPOOL_BYTES = 8 * 1024 * 1024
+
+_COPY_BLOCK = 1024 * 1024
+
+
+def _open_zstd(f):
+    try:
+        import zstandard
+    except ImportError:
+        raise ValueError("Reading .zst files requires the zstandard package (pip install zstandard)") from None
+    return zstandard.ZstdDecompressor().stream_reader(f, closefd=True)
+
+
+# compression suffix -> function opening a decompressed binary stream over a compressed file object
+DECOMPRESSORS = {
+    ".gz": lambda f: gzip.GzipFile(fileobj=f, mode="rb"),
+    ".bz2": lambda f: bz2.BZ2File(f, mode="rb"),
+    ".xz": lambda f: lzma.LZMAFile(f, mode="rb"),
+    ".zst": _open_zstd,
+}
+
+
+class _Decompressed(io.RawIOBase):
+    """
+    Forward-only view of a decompression stream that also owns the compressed file.
+
+    It offers neither seek() nor fileno(): gzip and friends would otherwise
+    emulate seeking by decompressing from the start again, and report the
+    descriptor of the *compressed* file (which TXTExtractor would mmap).
+    """
+
+    def __init__(self, stream, raw):
+        self._stream = stream
+        self._raw = raw
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                self._stream.close()
+            finally:
+                self._raw.close()
+        super().close()
+
+
+class CompressedExtractor(BaseExtractor):
+    """Extractor for .gz, .bz2, .xz and .zst files, dispatching on the inner extension."""
+
+    cost_weight = 1.5
+
+    def __init__(self, file_path: str, spool_bytes: int = DEFAULT_SPOOL_BYTES, **inner_options):
+        """
+        :param file_path: Path to the compressed file, e.g. ``export.csv.gz``
+        :param spool_bytes: Random-access formats (PDF, DOCX, zip) are
+            decompressed into memory up to this size, into an anonymous
+            temporary file beyond it
+        :param inner_options: Options forwarded to the inner extractor
+            (e.g. ``chunk_size`` for a ``.csv.gz``)
+        """
+        super().__init__(file_path)
+        if not self.is_path:
+            raise ValueError("CompressedExtractor needs a file path to tell the inner format")
+        name, self.compression = os.path.splitext(os.path.basename(file_path))
+        self.compression = self.compression.lower()
+        if self.compression not in DECOMPRESSORS:
+            raise ValueError(f"Unsupported compression: {self.compression}")
+        inner_ext = registry.extension_of(name)
+        if not inner_ext or inner_ext not in registry:
+            raise ValueError(f"Unsupported file type: {inner_ext}{self.compression}")
+        self.inner_class = registry[inner_ext]
+        if issubclass(self.inner_class, CompressedExtractor):
+            raise ValueError(f"Nested compression is not supported: {os.path.basename(file_path)}")
+        self.spool_bytes = spool_bytes
+        self.inner_options = inner_options
+
+    def iter_text(self):
+        """Decompress on the fly and yield the inner extractor's text."""
+        with self._open_decompressed() as stream:
+            inner = self.inner_class(stream, **self.inner_options)
+            # Share stage timings and counts with an instrumented run
+            inner._timings, inner._counts = self._timings, self._counts
+            yield from inner.iter_text()
+
+    def _open_decompressed(self):
+        raw = open(self.file_path, "rb")
+        try:
+            stream = _Decompressed(DECOMPRESSORS[self.compression](raw), raw)
+        except BaseException:
+            raw.close()
+            raise
+        if not self.inner_class.random_access:
+            return io.BufferedReader(stream, _COPY_BLOCK)
+        with stream, self._stage("decompress"):
+            spool = tempfile.SpooledTemporaryFile(max_size=self.spool_bytes)
+            try:
+                while True:
+                    block = stream.read(_COPY_BLOCK)
+                    if not block:
+                        break
+                    spool.write(block)
+                spool.seek(0)
+            except BaseException:
+                spool.close()
+                raise
+        return spool
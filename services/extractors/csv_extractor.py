@@ -1,14 +1,215 @@
 # extractors/csv_extractor.py
+import csv
+import importlib.util
+import numbers
+from typing import Any, Dict, List, Optional, Sequence
+
 from .base_extractor import BaseExtractor
+import numpy as np
 import pandas as pd
 
+# Rows parsed per chunk; bounds memory to roughly one chunk of DataFrame plus its text.
+DEFAULT_CSV_CHUNK_ROWS = 50_000
+# engine="auto" switches to the multi-threaded pyarrow reader from this file size on.
+PYARROW_MIN_BYTES = 32 * 1024 * 1024
+# Bytes parsed per pyarrow record batch (split across its threads).
+PYARROW_BLOCK_BYTES = 16 * 1024 * 1024
+
+ENGINES = ("auto", "c", "pyarrow")
+
+
+def _render_rows(df: pd.DataFrame) -> str:
+    """Render every row as a ``" | "``-joined line in one bulk pass (no per-row pandas objects)."""
+    # dtype=str with keep_default_na=False guarantees every cell is already a str
+    return "\n".join([" | ".join(row) for row in df.to_numpy(dtype=object).tolist()])
+
+
+def _pyarrow_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Number) and not isinstance(value, bool)
+
+
+def _check_where(where: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    where = dict(where or {})
+    for column, condition in where.items():
+        if isinstance(condition, tuple):
+            if len(condition) != 2 or condition == (None, None):
+                raise ValueError(f"Range for column {column!r} must be (low, high) with at least one bound")
+        elif condition is None:
+            raise ValueError(f"Condition for column {column!r} must be a value or a (low, high) range")
+    return where
+
+
+def _row_mask(df: pd.DataFrame, where: Dict[str, Any]) -> np.ndarray:
+    """
+    Boolean mask of the rows of ``df`` (all-str cells) matching every condition.
+
+    A scalar condition tests equality, a ``(low, high)`` tuple an inclusive
+    range (``None`` leaves that side open). Numeric conditions compare the
+    column as numbers, so ``"1.50"`` matches ``1.5``; cells that are not
+    numbers never match them.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for column, condition in where.items():
+        if column not in df.columns:
+            raise ValueError(f"Unknown CSV column in where: {column!r}")
+        values = df[column]
+        if isinstance(condition, tuple):
+            low, high = condition
+            if _is_number(low) or _is_number(high):
+                values = pd.to_numeric(values, errors="coerce")
+            if low is not None:
+                mask &= (values >= low).to_numpy(dtype=bool)
+            if high is not None:
+                mask &= (values <= high).to_numpy(dtype=bool)
+        elif _is_number(condition):
+            mask &= (pd.to_numeric(values, errors="coerce") == condition).to_numpy(dtype=bool)
+        else:
+            mask &= (values == str(condition)).to_numpy(dtype=bool)
+    return mask
+
 
 class CSVExtractor(BaseExtractor):
-    def extract_text(self) -> str:
-        # Read CSV and convert to readable text (rows as lines)
-        df = pd.read_csv(self.file_path, dtype=str, keep_default_na=False)
-        lines = []
-        for _, row in df.iterrows():
-            # join columns by tab or pipe to keep structure readable
-            lines.append(" | ".join([str(v) for v in row.tolist()]))
-        return "\n".join(lines).strip()
+    def __init__(
+        self,
+        file_path: str,
+        chunk_size: int = DEFAULT_CSV_CHUNK_ROWS,
+        usecols: Optional[Sequence] = None,
+        nrows: Optional[int] = None,
+        engine: str = "auto",
+        where: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        :param file_path: Path to the CSV file
+        :param chunk_size: Number of rows parsed and rendered at a time
+        :param usecols: Optional column names or positions to extract; other
+            columns are skipped by the parser instead of being materialized
+        :param nrows: Optional maximum number of data rows to read (counted
+            before ``where`` filtering)
+        :param engine: ``"c"`` (pandas' chunked C parser), ``"pyarrow"``
+            (multi-threaded Arrow reader, needs the pyarrow package) or
+            ``"auto"`` (pyarrow for files of ``PYARROW_MIN_BYTES`` and up when
+            it is installed, the C parser otherwise)
+        :param where: Optional row predicates ``{column name: condition}``;
+            a condition is a value (equality) or a ``(low, high)`` inclusive
+            range with ``None`` for an open end. Rows are filtered chunk by
+            chunk before being rendered, and predicate columns are read even
+            if ``usecols`` leaves them out of the output.
+        """
+        super().__init__(file_path)
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        if engine not in ENGINES:
+            raise ValueError(f"engine must be one of {', '.join(ENGINES)}")
+        self.chunk_size = chunk_size
+        self.usecols = usecols
+        self.nrows = nrows
+        self.engine = engine
+        self.where = _check_where(where)
+
+    def iter_text(self):
+        # Read CSV chunk by chunk and convert to readable text (rows as lines, columns joined by a pipe)
+        use_pyarrow = self._use_pyarrow()
+        read_cols, out_cols = self._columns(names_only=use_pyarrow)
+        chunks = self._iter_pyarrow(read_cols) if use_pyarrow else self._iter_c(read_cols)
+        first = True
+        for chunk in chunks:
+            if self.where and not chunk.empty:
+                with self._stage("filter"):
+                    chunk = chunk[_row_mask(chunk, self.where)]
+            if chunk.empty:
+                continue
+            if out_cols is not None:
+                # Drop predicate-only columns, keeping the file's column order
+                chunk = chunk[[c for c in chunk.columns if c in out_cols]]
+            if not first:
+                yield "\n"
+            first = False
+            self._count("rows", len(chunk))
+            with self._stage("render"):
+                text = _render_rows(chunk)
+            yield text
+
+    def _iter_c(self, read_cols: Optional[List]):
+        with self._stage("open"):
+            reader = pd.read_csv(
+                self.file_path if self.is_path else self.open_binary(),
+                dtype=str,
+                keep_default_na=False,
+                usecols=read_cols,
+                nrows=self.nrows,
+                chunksize=self.chunk_size,
+            )
+        with reader:
+            yield from self._timed("parse", reader)
+
+    def _iter_pyarrow(self, read_cols: Optional[List[str]]):
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        header = self._header()
+        if read_cols is not None:
+            missing = [c for c in read_cols if c not in header]
+            if missing:
+                raise ValueError(f"Unknown CSV columns: {', '.join(map(str, missing))}")
+        # Keep the file's column order, as the C parser does, and read every
+        # cell as a string so both engines render identical text
+        names = header if read_cols is None else [name for name in header if name in set(read_cols)]
+        with self._stage("open"):
+            reader = pa_csv.open_csv(
+                self.file_path if self.is_path else self.open_binary(),
+                read_options=pa_csv.ReadOptions(use_threads=True, block_size=PYARROW_BLOCK_BYTES),
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=names,
+                    column_types={name: pa.string() for name in names},
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            )
+        remaining = self.nrows
+        for batch in self._timed("parse", reader):
+            if remaining is not None:
+                if remaining <= 0:
+                    break
+                batch = batch.slice(0, remaining)
+                remaining -= batch.num_rows
+            # Re-slice to chunk_size rows so memory per rendered chunk matches the C engine
+            for start in range(0, batch.num_rows, self.chunk_size):
+                yield batch.slice(start, self.chunk_size).to_pandas()
+
+    def _use_pyarrow(self) -> bool:
+        if self.engine == "c":
+            return False
+        if self.engine == "pyarrow":
+            if not _pyarrow_available():
+                raise ValueError("engine='pyarrow' requires the pyarrow package (pip install pyarrow)")
+            return True
+        return self.is_path and self.source_size() >= PYARROW_MIN_BYTES and _pyarrow_available()
+
+    def _columns(self, names_only: bool):
+        """Return (columns to parse, set of columns to output); None means all of them."""
+        if self.usecols is None:
+            return None, None
+        usecols = list(self.usecols)
+        if (names_only or self.where) and not all(isinstance(c, str) for c in usecols):
+            # Positions can't be mixed with the names used by predicates (or pyarrow)
+            header = self._header()
+            try:
+                usecols = [c if isinstance(c, str) else header[c] for c in usecols]
+            except IndexError:
+                raise ValueError(f"Column position out of range; the file has {len(header)} columns") from None
+        if not self.where:
+            return usecols, None
+        return usecols + [c for c in self.where if c not in usecols], set(usecols)
+
+    def _header(self) -> List[str]:
+        if not self.is_path and not self.file_path.seekable():
+            raise ValueError("Column positions and the pyarrow engine need a file path or a seekable stream")
+        with self.open_text(encoding="utf-8-sig") as f:
+            header = next(csv.reader(f), None)
+        if not header:
+            raise ValueError("CSV file has no header row")
+        return header
@@ -1,10 +1,144 @@
 # extractors/docx_extractor.py
+import re
+import zipfile
+from xml.etree.ElementTree import iterparse
+
 from .base_extractor import BaseExtractor
-from docx import Document
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_P, _TBL, _TR, _TC = _W + "p", _W + "tbl", _W + "tr", _W + "tc"
+# Word stores drawings such as text boxes twice: as DrawingML in mc:Choice
+# and again as VML in mc:Fallback. Only the first copy is read.
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+_RUN_TEXT = {_W + "t": None, _W + "tab": "\t", _W + "br": "\n", _W + "cr": "\n", _W + "noBreakHyphen": "-"}
+
+
+def _part_names(names, prefix):
+    """Return zip members like word/header1.xml, word/header2.xml in numeric order."""
+    pattern = re.compile(rf"^word/{prefix}(\d*)\.xml$")
+    found = [(int(m.group(1) or 0), name) for name in names if (m := pattern.match(name))]
+    return [name for _, name in sorted(found)]
+
+
+def _iter_part_blocks(stream):
+    """
+    Yield the text blocks of one WordprocessingML part in document order.
+
+    A block is a non-empty paragraph, or a table row rendered as its cell
+    texts joined by " | ". Finished top-level blocks are cleared from the
+    tree as soon as they are emitted, so memory stays bounded by the
+    largest single paragraph or table.
+    """
+    open_elems = []  # elements from the root down to the current one
+    paragraphs = []  # text pieces of each open paragraph (text boxes nest them)
+    tables = []  # per open table: {"row": cell texts, "cell": paragraph texts}
+    fallback = 0  # depth of open mc:Fallback elements
+
+    for event, elem in iterparse(stream, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            open_elems.append(elem)
+            if tag == _MC_FALLBACK:
+                fallback += 1
+            elif fallback:
+                continue
+            elif tag == _P:
+                paragraphs.append([])
+            elif tag == _TBL:
+                tables.append({"row": None, "cell": None})
+            elif tag == _TR:
+                tables[-1]["row"] = []
+            elif tag == _TC:
+                tables[-1]["cell"] = []
+            continue
+
+        open_elems.pop()
+        if tag == _MC_FALLBACK:
+            fallback -= 1
+            continue
+        if fallback:
+            continue
+        if tag in _RUN_TEXT:
+            if paragraphs:
+                text = _RUN_TEXT[tag]
+                paragraphs[-1].append((elem.text or "") if text is None else text)
+            continue
+
+        block = None
+        if tag == _P:
+            text = "".join(paragraphs.pop())
+            if paragraphs:
+                # Paragraph inside a text box: part of the enclosing paragraph
+                if text:
+                    outer = paragraphs[-1]
+                    outer.append(text if not outer or outer[-1][-1:].isspace() else " " + text)
+            elif tables and tables[-1]["cell"] is not None:
+                if text:
+                    tables[-1]["cell"].append(text)
+            elif text:
+                block = text
+        elif tag == _TC:
+            table = tables[-1]
+            table["row"].append(" ".join(table["cell"]))
+            table["cell"] = None
+        elif tag == _TR:
+            table = tables[-1]
+            row = table["row"]
+            table["row"] = None
+            if any(row):
+                line = " | ".join(row)
+                if len(tables) > 1 and tables[-2]["cell"] is not None:
+                    tables[-2]["cell"].append(line)  # nested table lives in the outer cell
+                else:
+                    block = line
+        elif tag == _TBL:
+            tables.pop()
+        else:
+            continue
+
+        if block is not None:
+            yield block
+        if not paragraphs and not tables and open_elems:
+            # Top-level block finished: drop it (and its siblings) from the tree
+            open_elems[-1].clear()
 
 
 class DocxExtractor(BaseExtractor):
-    def extract_text(self) -> str:
-        doc = Document(self.file_path)
-        paragraphs = [p.text for p in doc.paragraphs if p.text]
-        return "\n".join(paragraphs).strip()
+    # 2: streaming zip/XML reader, table rows are included in document order
+    # 3: text boxes are read once (their VML fallback copy is skipped)
+    version = "3"
+    cost_weight = 2.0
+    random_access = True
+
+    def __init__(self, file_path: str, include_headers_footers: bool = False, include_notes: bool = False):
+        """
+        :param file_path: Path to the .docx file
+        :param include_headers_footers: Also emit page header text (before the
+            body) and footer text (after it)
+        :param include_notes: Also emit footnotes and endnotes after the body
+        """
+        super().__init__(file_path)
+        self.include_headers_footers = include_headers_footers
+        self.include_notes = include_notes
+
+    def iter_text(self):
+        """Stream paragraphs and table rows straight out of the zipped WordprocessingML parts."""
+        with self.open_binary() as f, zipfile.ZipFile(f) as archive:
+            names = archive.namelist()
+            parts = []
+            if self.include_headers_footers:
+                parts += _part_names(names, "header")
+            parts.append("word/document.xml")
+            if self.include_notes:
+                parts += [name for name in ("word/footnotes.xml", "word/endnotes.xml") if name in names]
+            if self.include_headers_footers:
+                parts += _part_names(names, "footer")
+
+            first = True
+            for part in parts:
+                with archive.open(part) as stream:
+                    for block in self._timed("parse", _iter_part_blocks(stream)):
+                        if not first:
+                            yield "\n"
+                        first = False
+                        yield block
@@ -0,0 +1,184 @@
+"""
+Compact key-path rendering for structured data (JSON, YAML, TOML).
+
+Instead of pretty-printed JSON, every leaf becomes one line::
+
+    server.ports[0] = 8080
+    server.name = api
+    owner["full name"] = Tom
+
+Nesting below ``max_depth`` is kept as a compact inline JSON value and
+arrays can be sampled down to their first ``max_array_items`` entries,
+which keeps large configs small while every key path stays searchable.
+
+The renderer consumes the parse events produced by ``json_stream``, so
+it works both on streamed JSON and, via ``iter_object_events``, on
+already-loaded data.
+"""
+import datetime
+import json
+import math
+import re
+from typing import Iterable, Iterator, Optional
+
+OUTPUT_FORMATS = ("json", "flat")
+
+_BARE_KEY = re.compile(r"^[A-Za-z_][A-Za-z0-9_\-]*$")
+
+
+def check_output_format(output_format: str) -> str:
+    """Validate an extractor ``output_format`` option."""
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: {output_format!r} (expected one of {OUTPUT_FORMATS})")
+    return output_format
+
+
+def json_default(value):
+    """``json`` fallback for YAML/TOML scalars that JSON has no type for (dates, times, ...)."""
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
+
+
+_compact = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=json_default).encode
+
+
+def iter_object_events(obj) -> Iterator[tuple]:
+    """Yield ``json_stream``-style parse events for an in-memory object."""
+    if isinstance(obj, dict):
+        yield ("start_map", None)
+        for key, value in obj.items():
+            yield ("map_key", key if isinstance(key, str) else str(key))
+            yield from iter_object_events(value)
+        yield ("end_map", None)
+    elif isinstance(obj, (list, tuple)):
+        yield ("start_array", None)
+        for value in obj:
+            yield from iter_object_events(value)
+        yield ("end_array", None)
+    else:
+        yield ("value", obj)
+
+
+def _expand(events):
+    # json_stream reports small containers as a single decoded value
+    for event, value in events:
+        if event == "value" and isinstance(value, (dict, list)):
+            yield from iter_object_events(value)
+        else:
+            yield event, value
+
+
+def _scalar(value) -> str:
+    if isinstance(value, str):
+        # Plain strings are written bare; anything that would be ambiguous
+        # on a single line (newlines, edge whitespace, empty) is quoted
+        if value and value == value.strip() and "\n" not in value and "\r" not in value:
+            return value
+        return json.dumps(value, ensure_ascii=False)
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float) and not math.isfinite(value):
+        return json.dumps(value)
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
+
+
+def _key_path(path: str, key: str) -> str:
+    if _BARE_KEY.match(key):
+        return f"{path}.{key}" if path else key
+    return f"{path}[{json.dumps(key, ensure_ascii=False)}]"
+
+
+def _line(path: str, text: str) -> str:
+    return f"{path} = {text}\n" if path else f"{text}\n"
+
+
+def _skip(events, event) -> None:
+    if event not in ("start_map", "start_array"):
+        return
+    depth = 1
+    for ev, _ in events:
+        if ev in ("start_map", "start_array"):
+            depth += 1
+        elif ev in ("end_map", "end_array"):
+            depth -= 1
+            if depth == 0:
+                return
+
+
+def _build(events, event, value):
+    """Rebuild the Python value whose first event is ``(event, value)``."""
+    if event == "value":
+        return value
+    if event == "start_array":
+        items = []
+        for ev, v in events:
+            if ev == "end_array":
+                return items
+            items.append(_build(events, ev, v))
+    obj = {}
+    for ev, key in events:
+        if ev == "end_map":
+            return obj
+        ev, v = next(events)
+        obj[key] = _build(events, ev, v)
+    return obj
+
+
+def _flatten(events, event, value, path, depth, max_depth, max_array_items):
+    if event == "value":
+        yield _line(path, _scalar(value))
+        return
+
+    if max_depth is not None and depth >= max_depth:
+        yield _line(path, _compact(_build(events, event, value)))
+        return
+
+    is_map = event == "start_map"
+    empty = True
+    index = skipped = 0
+    for ev, v in events:
+        if ev in ("end_map", "end_array"):
+            break
+        if is_map:
+            child = _key_path(path, v)
+            ev, v = next(events)
+        else:
+            if max_array_items is not None and index >= max_array_items:
+                _skip(events, ev)
+                skipped += 1
+                continue
+            child = f"{path}[{index}]"
+            index += 1
+        empty = False
+        yield from _flatten(events, ev, v, child, depth + 1, max_depth, max_array_items)
+
+    if empty and not skipped:
+        yield _line(path, "{}" if is_map else "[]")
+    if skipped:
+        yield _line(f"{path}[{index}:]", f"<{skipped} more items>")
+
+
+def iter_flat_lines(
+    events: Iterable[tuple],
+    max_depth: Optional[int] = None,
+    max_array_items: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Render parse events as ``key.path[i] = value`` lines (each ending in a newline).
+
+    :param events: ``json_stream`` parse events of one document
+    :param max_depth: Number of key-path components to expand; deeper
+        values are written as compact inline JSON
+    :param max_array_items: Keep only the first N items of every array and
+        summarize the rest as ``path[N:] = <K more items>``
+    """
+    events = _expand(events)
+    for event, value in events:
+        yield from _flatten(events, event, value, "", 0, max_depth, max_array_items)
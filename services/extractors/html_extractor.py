@@ -0,0 +1,150 @@
+"""
+Extractor for HTML pages (.html / .htm).
+
+The page is fed block by block to the standard library's incremental
+``html.parser``, and the text collected from each block is yielded before
+the next one is read, so memory is bounded by the block size rather than
+the page size. Entities are decoded by the parser; script, style and
+navigation boilerplate is dropped.
+"""
+import re
+from html.parser import HTMLParser
+from typing import List
+
+from .base_extractor import BaseExtractor
+
+# Characters of markup fed to the parser per step.
+HTML_BLOCK_CHARS = 256 * 1024
+
+# Elements whose content is never extracted.
+SKIP_TAGS = frozenset({"script", "style", "noscript", "template", "nav", "footer", "svg", "iframe"})
+
+# Elements that start and end a line of text.
+BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "br", "caption", "dd", "details", "dialog", "div", "dl",
+    "dt", "fieldset", "figcaption", "figure", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr",
+    "legend", "li", "main", "ol", "option", "p", "pre", "section", "summary", "table", "tbody", "tfoot",
+    "thead", "title", "tr", "ul",
+})
+
+# Table cells, joined with " | " within their row.
+CELL_TAGS = frozenset({"td", "th"})
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class _TextCollector(HTMLParser):
+    """
+    Collects the visible text of the markup fed to it into ``pieces``.
+
+    Whitespace is collapsed as a browser would (except inside ``<pre>``),
+    block elements start a new line and table cells are joined with
+    ``" | "``, like CSV rows.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.pieces: List[str] = []
+        self._skip = 0
+        self._pre = 0
+        self._cells = 0
+        self._line_start = True
+        self._space = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip += 1
+        elif tag in CELL_TAGS:
+            if self._cells and not self._skip:
+                self.pieces.append(" | ")
+                self._line_start = self._space = False
+            self._cells += 1
+        elif tag in BLOCK_TAGS:
+            self._newline()
+            if tag == "pre":
+                self._pre += 1
+            elif tag == "tr":
+                self._cells = 0
+
+    def handle_startendtag(self, tag, attrs):
+        # <br/>, <hr/>: no content, so no end tag to wait for
+        if tag in BLOCK_TAGS:
+            self._newline()
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self._skip = max(0, self._skip - 1)
+        elif tag in BLOCK_TAGS:
+            self._newline()
+            if tag == "pre":
+                self._pre = max(0, self._pre - 1)
+
+    def handle_data(self, data):
+        if self._skip or not data:
+            return
+        if self._pre:
+            if self._space and not self._line_start:
+                self.pieces.append(" ")
+            self.pieces.append(data)
+            self._line_start = data.endswith("\n")
+            self._space = False
+            return
+        text = _WHITESPACE.sub(" ", data).strip()
+        if not text:
+            self._space = True
+            return
+        if not self._line_start and (self._space or data[0].isspace()):
+            self.pieces.append(" ")
+        self.pieces.append(text)
+        self._line_start = False
+        self._space = data[-1].isspace()
+
+    def _newline(self):
+        if not self._skip and not self._line_start:
+            self.pieces.append("\n")
+            self._line_start = True
+        self._space = False
+
+    def drain(self) -> str:
+        text = "".join(self.pieces)
+        self.pieces.clear()
+        return text
+
+
+class HTMLExtractor(BaseExtractor):
+    """Extractor for HTML pages, streamed through an incremental parser."""
+
+    def __init__(self, file_path: str, encoding: str = "utf-8-sig", block_size: int = HTML_BLOCK_CHARS):
+        """
+        :param file_path: Path to the HTML file
+        :param encoding: Text encoding of the file (the default also skips a
+            leading UTF-8 byte order mark)
+        :param block_size: Characters of markup parsed per step
+        """
+        super().__init__(file_path)
+        self.encoding = encoding
+        self.block_size = max(1, block_size)
+
+    def iter_text(self):
+        """
+        Yield the page's visible text, one parsed block at a time.
+
+        Content of ``SKIP_TAGS`` elements (scripts, styles, navigation,
+        footers...) is dropped and entities are decoded.
+        """
+        parser = _TextCollector()
+        with self.open_text(encoding=self.encoding) as f:
+            while True:
+                block = f.read(self.block_size)
+                if not block:
+                    break
+                with self._stage("parse"):
+                    parser.feed(block)
+                    text = parser.drain()
+                if text:
+                    yield text
+        with self._stage("parse"):
+            parser.close()
+            text = parser.drain()
+        if text:
+            yield text
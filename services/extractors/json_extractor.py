@@ -1,11 +1,62 @@
 # extractors/json_extractor.py
+from typing import Optional
+
 from .base_extractor import BaseExtractor
+from .flatten import check_output_format, iter_flat_lines, iter_object_events
+from .json_stream import iter_events, iter_pretty
 import json
 
+# Files at least this large are tokenized incrementally instead of loaded whole.
+STREAMING_THRESHOLD_BYTES = 16 * 1024 * 1024
+
 
 class JSONExtractor(BaseExtractor):
-    def extract_text(self) -> str:
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        # Pretty-print JSON as text
-        return json.dumps(data, indent=2, ensure_ascii=False)
+    def __init__(
+        self,
+        file_path: str,
+        streaming: Optional[bool] = None,
+        output_format: str = "json",
+        max_depth: Optional[int] = None,
+        max_array_items: Optional[int] = None,
+    ):
+        """
+        :param file_path: Path to the JSON file
+        :param streaming: Tokenize the file incrementally with bounded memory
+            instead of ``json.load``. Defaults to streaming only files of at
+            least ``STREAMING_THRESHOLD_BYTES``. The output is the same either way.
+        :param output_format: ``"json"`` (pretty-printed, indent 2) or
+            ``"flat"`` (one ``key.path[i] = value`` line per leaf)
+        :param max_depth: Flat format only: key-path depth to expand
+        :param max_array_items: Flat format only: array items kept per array
+        """
+        super().__init__(file_path)
+        self.streaming = streaming
+        self.output_format = check_output_format(output_format)
+        self.max_depth = max_depth
+        self.max_array_items = max_array_items
+
+    def iter_text(self):
+        streaming = self.streaming
+        if streaming is None:
+            size = self.source_size()
+            # A stream of unknown length (e.g. being decompressed) may be huge
+            streaming = size is None or size >= STREAMING_THRESHOLD_BYTES
+
+        with self.open_text() as f:
+            if streaming:
+                # Parsing and rendering interleave event by event
+                yield from self._timed("parse", self._render(iter_events(f)))
+                return
+            with self._stage("parse"):
+                data = json.load(f)
+        if self.output_format == "flat":
+            yield from self._timed("render", self._render(iter_object_events(data)))
+            return
+        # Pretty-print JSON as text, emitted piece by piece by the encoder
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+        yield from self._timed("render", encoder.iterencode(data))
+
+    def _render(self, events):
+        if self.output_format == "flat":
+            return iter_flat_lines(events, self.max_depth, self.max_array_items)
+        return iter_pretty(events)
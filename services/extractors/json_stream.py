@@ -0,0 +1,257 @@
+"""
+Incremental JSON tokenizer and pretty-printer.
+
+``iter_events`` reads a JSON document from a text stream block by block
+and yields parse events, so only the current block (plus the token being
+read) is ever held in memory. Any value that fits entirely inside the
+current block is decoded in one go by the C scanner and reported as a
+single ``value`` event; only containers spanning block boundaries are
+walked token by token. ``iter_pretty`` turns the events back into text
+formatted exactly like ``json.dumps(data, indent=2, ensure_ascii=False)``.
+
+Events are ``(name, value)`` tuples:
+    ("start_map", None), ("map_key", str), ("end_map", None),
+    ("start_array", None), ("end_array", None),
+    ("value", scalar, or a small dict/list decoded in one piece)
+"""
+import json
+import re
+from json.decoder import scanstring
+from json.scanner import NUMBER_RE
+from typing import IO, Iterable, Iterator, Tuple
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_LITERALS = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "NaN": float("nan"),
+    "Infinity": float("inf"),
+    "-Infinity": float("-inf"),
+}
+_LONGEST_LITERAL = max(len(k) for k in _LITERALS)
+
+Event = Tuple[str, object]
+
+_INCOMPLETE = object()
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """Sliding text buffer over a stream that drops consumed characters."""
+
+    def __init__(self, fp: IO[str], buffer_size: int):
+        self.fp = fp
+        self.buffer_size = buffer_size
+        self.buf = ""
+        self.pos = 0
+        self.offset = 0  # absolute position of buf[0] in the stream
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read another block; return False at end of stream."""
+        if self.eof:
+            return False
+        if self.pos:
+            self.offset += self.pos
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        block = self.fp.read(self.buffer_size)
+        if not block:
+            self.eof = True
+            return False
+        self.buf += block
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of stream)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def error(self, msg: str) -> ValueError:
+        return ValueError(f"{msg}: char {self.offset + self.pos}")
+
+    def decode_value(self):
+        """Decode the value at the cursor if it lies entirely inside the buffer, else return _INCOMPLETE."""
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                return _INCOMPLETE
+            # A value touching the end of the buffer may be cut short, e.g. a
+            # number whose fraction or exponent is still in the next block.
+            # fill() may shift the buffer, so advance by length.
+            length = end - self.pos
+            truncated = end == len(self.buf) or (
+                isinstance(value, (int, float)) and self.buf[end] in ".eE+-"
+            )
+            if not truncated or not self.fill():
+                self.pos += length
+                return value
+
+    def read_string(self) -> str:
+        while True:
+            try:
+                value, end = scanstring(self.buf, self.pos + 1)
+            except json.JSONDecodeError as exc:
+                # The string (or an escape in it) may just be cut by the end
+                # of the block: read more and scan again
+                truncated = exc.msg.startswith("Unterminated") or exc.pos >= len(self.buf) - 6
+                if truncated and self.fill():
+                    continue
+                raise self.error(exc.msg) from None
+            self.pos = end
+            return value
+
+    def read_scalar(self):
+        # Make sure a number or literal is not cut by the end of the buffer
+        while not self.eof and len(self.buf) - self.pos <= max(_LONGEST_LITERAL, 64):
+            if not self.fill():
+                break
+        while True:
+            m = NUMBER_RE.match(self.buf, self.pos)
+            if m and m.end() == len(self.buf) and not self.eof and self.fill():
+                continue
+            break
+        if m:
+            integer, frac, exp = m.groups()
+            self.pos = m.end()
+            if frac or exp:
+                return float(integer + (frac or "") + (exp or ""))
+            return int(integer)
+        for literal, value in _LITERALS.items():
+            if self.buf.startswith(literal, self.pos):
+                self.pos += len(literal)
+                return value
+        raise self.error("Expecting value")
+
+
+def iter_events(fp: IO[str], buffer_size: int = DEFAULT_BUFFER_SIZE) -> Iterator[Event]:
+    """Yield parse events for the single JSON document in ``fp``."""
+    reader = _Reader(fp, buffer_size)
+    stack = []  # "map" / "array" for each open container
+    expect = "value"
+
+    while True:
+        c = reader.peek()
+        if not c:
+            if expect != "end":
+                raise reader.error("Unexpected end of JSON input")
+            return
+
+        if expect in ("value", "value_or_end"):
+            if c == "]" and expect == "value_or_end":
+                reader.pos += 1
+                stack.pop()
+                yield ("end_array", None)
+            elif (value := reader.decode_value()) is not _INCOMPLETE:
+                yield ("value", value)
+            elif c == "{":
+                reader.pos += 1
+                stack.append("map")
+                yield ("start_map", None)
+                expect = "key_or_end"
+                continue
+            elif c == "[":
+                reader.pos += 1
+                stack.append("array")
+                yield ("start_array", None)
+                expect = "value_or_end"
+                continue
+            elif c == '"':
+                yield ("value", reader.read_string())
+            else:
+                yield ("value", reader.read_scalar())
+        elif expect in ("key", "key_or_end"):
+            if c == "}" and expect == "key_or_end":
+                reader.pos += 1
+                stack.pop()
+                yield ("end_map", None)
+            elif c == '"':
+                yield ("map_key", reader.read_string())
+                expect = "colon"
+                continue
+            else:
+                raise reader.error("Expecting property name enclosed in double quotes")
+        elif expect == "colon":
+            if c != ":":
+                raise reader.error("Expecting ':' delimiter")
+            reader.pos += 1
+            expect = "value"
+            continue
+        elif expect == "comma_or_end":
+            reader.pos += 1
+            if c == ",":
+                expect = "key" if stack[-1] == "map" else "value"
+                continue
+            if c == "}" and stack[-1] == "map":
+                stack.pop()
+                yield ("end_map", None)
+            elif c == "]" and stack[-1] == "array":
+                stack.pop()
+                yield ("end_array", None)
+            else:
+                reader.pos -= 1
+                raise reader.error("Expecting ',' delimiter")
+        else:
+            raise reader.error("Extra data")
+
+        # A complete value (scalar or closed container) was just read
+        expect = "comma_or_end" if stack else "end"
+
+
+def iter_pretty(events: Iterable[Event], indent: int = 2) -> Iterator[str]:
+    """Render parse events like ``json.dumps(data, indent=indent, ensure_ascii=False)``."""
+    encode = json.JSONEncoder(indent=indent, ensure_ascii=False).encode
+    depth = 0
+    first = []  # per open container: no item written yet
+    opener = None  # bracket held back until we know whether the container is empty
+    after_key = False
+
+    for event, value in events:
+        if opener is not None:
+            if event in ("end_map", "end_array"):
+                yield opener + ("}" if opener == "{" else "]")
+                opener = None
+                depth -= 1
+                first.pop()
+                continue
+            yield opener
+            opener = None
+
+        if event in ("end_map", "end_array"):
+            depth -= 1
+            first.pop()
+            yield "\n" + " " * (indent * depth) + ("}" if event == "end_map" else "]")
+            continue
+
+        if after_key:
+            prefix = ""
+            after_key = False
+        elif first:
+            prefix = ("\n" if first[-1] else ",\n") + " " * (indent * depth)
+            first[-1] = False
+        else:
+            prefix = ""
+
+        if event == "map_key":
+            yield prefix + encode(value) + ": "
+            after_key = True
+        elif event in ("start_map", "start_array"):
+            if prefix:
+                yield prefix
+            opener = "{" if event == "start_map" else "["
+            depth += 1
+            first.append(True)
+        else:
+            text = encode(value)
+            if depth and isinstance(value, (dict, list)):
+                # Nested pretty-printed block: shift it to the current depth
+                text = text.replace("\n", "\n" + " " * (indent * depth))
+            yield prefix + text
@@ -0,0 +1,109 @@
+# extractors/jsonl_extractor.py
+import json
+import os
+from typing import Optional
+
+from .base_extractor import BaseExtractor
+from .parallel import ordered_imap, resolve_workers
+
+# Size of the byte range handed to one worker in parallel mode.
+DEFAULT_SHARD_BYTES = 16 * 1024 * 1024
+
+
+def _render_line(line: str, skip_invalid: bool, where: str) -> Optional[str]:
+    """Re-encode one JSON Lines record on a single line (``None`` for blank or skipped lines)."""
+    if not line.strip():
+        return None
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as exc:
+        if skip_invalid:
+            return None
+        raise ValueError(f"Invalid JSON {where}: {exc.msg}") from None
+    return json.dumps(record, ensure_ascii=False)
+
+
+def _render_byte_range(file_path: str, start: int, stop: int, skip_invalid: bool) -> str:
+    """Worker entrypoint: render every record whose line starts in [start, stop)."""
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        data = f.read(stop - start)
+    rendered = []
+    # Split on "\n" only: str.splitlines() would also break on U+2028 etc.,
+    # which may legally appear inside JSON strings
+    for line in data.decode("utf-8").split("\n"):
+        text = _render_line(line, skip_invalid, f"in bytes {start}-{stop}")
+        if text is not None:
+            rendered.append(text)
+    return "\n".join(rendered)
+
+
+def _line_aligned_ranges(file_path: str, shard_bytes: int):
+    """Yield ``(start, stop)`` byte ranges of roughly ``shard_bytes`` that begin at line starts."""
+    size = os.path.getsize(file_path)
+    with open(file_path, "rb") as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + shard_bytes, size))
+            f.readline()  # move to the start of the next line
+            stop = min(f.tell(), size)
+            yield start, stop
+            start = stop
+
+
+class JSONLinesExtractor(BaseExtractor):
+    """Extractor for JSON Lines / NDJSON files, processed one record at a time."""
+
+    def __init__(
+        self,
+        file_path: str,
+        workers: int = 1,
+        shard_bytes: int = DEFAULT_SHARD_BYTES,
+        skip_invalid: bool = False,
+    ):
+        """
+        :param file_path: Path to the .jsonl / .ndjson file
+        :param workers: Number of worker processes rendering byte ranges in
+            parallel (``1`` reads line by line in-process, ``None`` or ``0``
+            uses one worker per CPU)
+        :param shard_bytes: Approximate size of the byte range given to one worker
+        :param skip_invalid: Skip malformed lines instead of raising ValueError
+        """
+        super().__init__(file_path)
+        self.workers = workers
+        self.shard_bytes = max(1, shard_bytes)
+        self.skip_invalid = skip_invalid
+
+    def iter_text(self):
+        workers = resolve_workers(self.workers)
+        # Workers re-open the file by path, so streams are read in-process
+        if workers > 1 and self.is_path and self.source_size() > self.shard_bytes:
+            tasks = (
+                (self.file_path, start, stop, self.skip_invalid)
+                for start, stop in _line_aligned_ranges(self.file_path, self.shard_bytes)
+            )
+            first = True
+            for text in self._timed("parse", ordered_imap(_render_byte_range, tasks, workers=workers)):
+                if not text:
+                    continue
+                # json.dumps escapes newlines, so every line is one record
+                self._count("rows", text.count("\n") + 1)
+                if not first:
+                    yield "\n"
+                first = False
+                yield text
+            return
+
+        first = True
+        with self.open_text() as f:
+            rendered = (
+                _render_line(line, self.skip_invalid, f"on line {lineno}") for lineno, line in enumerate(f, 1)
+            )
+            for text in self._timed("parse", rendered):
+                if text is None:
+                    continue
+                self._count("rows")
+                if not first:
+                    yield "\n"
+                first = False
+                yield text
@@ -1,15 +1,14 @@
 # extractors/markdown_extractor.py
 from .base_extractor import BaseExtractor
-import markdown
-import re
+from .markdown_text import iter_markdown_text
 
 
 class MarkdownExtractor(BaseExtractor):
-    def extract_text(self) -> str:
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            md = f.read()
-        # Convert markdown to HTML then strip tags to get plain text
-        html = markdown.markdown(md)
-        # Simple HTML tag stripper
-        text = re.sub(r'<[^>]+>', '', html)
-        return text.strip()
+    # 2: single-pass converter (no HTML round trip, entities decoded, tables kept as rows)
+    # 3: backslashes inside code spans are kept literally
+    version = "3"
+
+    def iter_text(self):
+        # Convert markdown straight to plain text, line by line
+        with self.open_text() as f:
+            yield from self._timed("parse", iter_markdown_text(f))
@@ -0,0 +1,142 @@
+"""
+Single-pass Markdown to plain-text converter.
+
+Markdown is read line by line and turned straight into text, without
+rendering HTML first. Block syntax (headings, lists, block quotes, code
+fences, tables, rules) is stripped down to its content, inline markup
+(emphasis, code spans, links, images, raw HTML tags) is reduced to the
+visible text, and HTML entities are decoded. Consecutive blocks are
+separated by a single blank line.
+"""
+import html
+import re
+from typing import Iterable, Iterator
+
+_FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_ATX_HEADING = re.compile(r"^ {0,3}#{1,6}(?:[ \t]+|$)(.*?)(?:[ \t]+#+)?[ \t]*$")
+_SETEXT_OR_RULE = re.compile(r"^ {0,3}(?:=+|-+|(?:[-*_][ \t]*){3,})[ \t]*$")
+_TABLE_SEPARATOR = re.compile(r"^\s*\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?\s*$")
+_LINK_DEFINITION = re.compile(r"^ {0,3}\[[^\]]+\]:\s*\S+")
+_BLOCKQUOTE = re.compile(r"^\s*(?:>\s?)+")
+_LIST_ITEM = re.compile(r"^\s*(?:[-*+]|\d{1,9}[.)])\s+(?:\[[ xX]\]\s+)?")
+
+# A backslash escape, or a code span (group 2: backtick run, group 3: code).
+# Matching both in one left-to-right pass leaves backslashes inside code
+# alone, and keeps an escaped backtick from opening a span.
+_ESCAPE_OR_CODE = re.compile(r"\\([\\`*_{}\[\]()#+\-.!|>~<])|(`+)(.+?)\2")
+_IMAGE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]+)\](?:\([^)]*\)|\[[^\]]*\])")
+_AUTOLINK = re.compile(r"<((?:https?|ftp)://[^>\s]+|mailto:[^>\s]+)>")
+_HTML_TAG = re.compile(r"</?[A-Za-z][^>]*>|<!--.*?-->")
+_STRONG = re.compile(r"(\*\*|__)(?=\S)(.+?)(?<=\S)\1")
+_EMPHASIS = re.compile(r"\*(?=\S)(.+?)(?<=\S)\*|(?<!\w)_(?=\S)(.+?)(?<=\S)_(?!\w)")
+_STRIKE = re.compile(r"~~(?=\S)(.+?)(?<=\S)~~")
+_ESCAPED_CHAR = re.compile("\x00(\\d+)\x00")
+_MARKUP_CHARS = re.compile(r"[\\`*_\[<&~]")
+
+
+def _inline_markup(text: str) -> str:
+    """Reduce inline Markdown in ``text`` (outside code spans) to plain text."""
+    text = _IMAGE.sub(r"\1", text)
+    text = _LINK.sub(r"\1", text)
+    text = _AUTOLINK.sub(r"\1", text)
+    text = _HTML_TAG.sub("", text)
+    text = _STRONG.sub(r"\2", text)
+    text = _EMPHASIS.sub(lambda m: m.group(1) or m.group(2), text)
+    text = _STRIKE.sub(r"\1", text)
+    return html.unescape(text)
+
+
+def render_inline(text: str) -> str:
+    """Render one line of inline Markdown as plain text."""
+    if not _MARKUP_CHARS.search(text):
+        return text
+    parts = []
+    segment = []  # text since the last code span
+    pos = 0
+    for m in _ESCAPE_OR_CODE.finditer(text):
+        segment.append(text[pos:m.start()])
+        if m.group(1) is not None:
+            # Protect backslash-escaped characters from being read as markup
+            segment.append(f"\x00{ord(m.group(1))}\x00")
+        else:
+            parts.append(_inline_markup("".join(segment)))
+            segment = []
+            parts.append(m.group(3).strip())  # code is literal: no markup, escapes or entities
+        pos = m.end()
+    segment.append(text[pos:])
+    parts.append(_inline_markup("".join(segment)))
+    return _ESCAPED_CHAR.sub(lambda m: chr(int(m.group(1))), "".join(parts))
+
+
+def _table_row(line: str) -> str:
+    row = line.strip()
+    if row.startswith("|"):
+        row = row[1:]
+    if row.endswith("|") and not row.endswith("\\|"):
+        row = row[:-1]
+    cells = re.split(r"(?<!\\)\|", row)
+    return " | ".join(render_inline(cell.strip()) for cell in cells)
+
+
+def iter_markdown_text(lines: Iterable[str]) -> Iterator[str]:
+    """Convert Markdown ``lines`` to plain text, yielding one output line (with newline) at a time."""
+    fence = None  # opening fence marker while inside a code block
+    blank = False  # a blank line is owed before the next block
+    started = False
+
+    def emit(text):
+        nonlocal blank, started
+        out = ("\n" if blank and started else "") + text + "\n"
+        blank = False
+        started = True
+        return out
+
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+
+        if fence is not None:
+            stripped = line.strip()
+            if stripped.startswith(fence[0]) and set(stripped) == {fence[0]} and len(stripped) >= len(fence):
+                fence = None
+                blank = True
+            else:
+                yield emit(line.rstrip())
+            continue
+
+        m = _FENCE.match(line)
+        if m:
+            fence = m.group(1)
+            blank = True
+            continue
+
+        if not line.strip():
+            blank = True
+            continue
+
+        m = _ATX_HEADING.match(line)
+        if m:
+            blank = True
+            yield emit(render_inline(m.group(1)))
+            blank = True
+            continue
+
+        if _SETEXT_OR_RULE.match(line):
+            # Setext underline (the heading text was the previous line) or
+            # horizontal rule: nothing visible, but it ends the block
+            blank = True
+            continue
+
+        if _LINK_DEFINITION.match(line):
+            continue
+
+        line = _BLOCKQUOTE.sub("", line, count=1)
+        if line.lstrip().startswith("|"):
+            if not _TABLE_SEPARATOR.match(line):
+                yield emit(_table_row(line))
+            continue
+
+        line = _LIST_ITEM.sub("", line, count=1)
+        text = render_inline(line.strip())
+        if text:
+            yield emit(text)
@@ -0,0 +1,61 @@
+"""
+Process-pool helpers shared by the extractors and batch extraction.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """Return a concrete worker count (``None`` or ``0`` means one per CPU)."""
+    if not workers:
+        return os.cpu_count() or 1
+    return max(1, int(workers))
+
+
+def split_range(total: int, shards: int) -> list:
+    """Split ``range(total)`` into ``shards`` contiguous ``(start, stop)`` pairs of near-equal size."""
+    shards = max(1, min(shards, total))
+    size, extra = divmod(total, shards)
+    ranges = []
+    start = 0
+    for i in range(shards):
+        stop = start + size + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def ordered_imap(
+    func: Callable,
+    arg_tuples: Iterable[Sequence],
+    workers: int,
+    prefetch: int = 2,
+) -> Iterator:
+    """
+    Run ``func(*args)`` for every tuple in ``arg_tuples`` on a process pool.
+
+    Results are yielded in input order. At most ``workers * prefetch`` tasks
+    are in flight at once, so a slow consumer never lets finished results
+    pile up in memory. ``func`` must be a module-level (picklable) function.
+    """
+    window = max(1, workers * prefetch)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        try:
+            for args in arg_tuples:
+                pending.append(pool.submit(func, *args))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Consumer stopped early or a task failed: drop queued work
+            for future in pending:
+                future.cancel()
+
+
+def run_extractor(extractor_cls: type, file_path: str, options: Optional[Dict[str, Any]] = None) -> str:
+    """Worker entrypoint: build ``extractor_cls(file_path, **options)`` and return its text."""
+    return extractor_cls(file_path, **(options or {})).extract_text()
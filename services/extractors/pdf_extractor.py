@@ -1,13 +1,170 @@
 # extractors/pdf_extractor.py
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional
+
 from .base_extractor import BaseExtractor
+from .parallel import ordered_imap, resolve_workers, split_range
 import fitz  # PyMuPDF
 
+# Below this many pages per shard, process start-up costs more than it saves.
+DEFAULT_MIN_PAGES_PER_SHARD = 64
+SHARDS_PER_WORKER = 4
+
+# OCR fallback defaults
+DEFAULT_OCR_DPI = 200
+DEFAULT_OCR_MIN_CHARS = 16
+DEFAULT_OCR_BATCH_PAGES = 4
+# Pages read ahead to find OCR candidates before text is emitted
+OCR_WINDOW_PAGES = 64
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> list:
+    """Worker entrypoint: open the PDF independently and return the text of pages [start, stop)."""
+    with fitz.open(file_path) as doc:
+        return [doc[i].get_text("text") for i in range(start, stop)]
+
+
+def _ocr_images(doc, page_numbers: List[int], dpi: int) -> List[str]:
+    """Rasterize the given pages of an open document and return their OCR text."""
+    from ..nexy_rep.ocr import extract_text_from_images
+
+    images = [doc[i].get_pixmap(dpi=dpi).tobytes("png") for i in page_numbers]
+    return extract_text_from_images(images)
+
+
+def _ocr_pages(file_path: str, page_numbers: List[int], dpi: int) -> List[str]:
+    """Worker entrypoint: open the PDF independently and OCR the given pages."""
+    with fitz.open(file_path) as doc:
+        return _ocr_images(doc, page_numbers, dpi)
+
 
 class PDFExtractor(BaseExtractor):
-    def extract_text(self) -> str:
-        """Extract plain text from a PDF using PyMuPDF."""
-        text_parts = []
-        with fitz.open(self.file_path) as doc:
-            for page in doc:
-                text_parts.append(page.get_text("text"))
-        return "\n".join(text_parts).strip()
+    cost_weight = 4.0
+    random_access = True
+
+    def __init__(
+        self,
+        file_path: str,
+        parallel: bool = False,
+        workers: Optional[int] = None,
+        min_pages_per_shard: int = DEFAULT_MIN_PAGES_PER_SHARD,
+        max_pages: Optional[int] = None,
+        ocr: bool = False,
+        ocr_dpi: int = DEFAULT_OCR_DPI,
+        ocr_min_chars: int = DEFAULT_OCR_MIN_CHARS,
+        ocr_workers: int = 1,
+        ocr_batch_pages: int = DEFAULT_OCR_BATCH_PAGES,
+    ):
+        """
+        :param file_path: Path to the PDF file
+        :param parallel: Shard page ranges across a process pool
+        :param workers: Number of worker processes (defaults to the CPU count)
+        :param min_pages_per_shard: Smallest page range handed to one worker;
+            documents too small to fill two shards stay single-process
+        :param max_pages: Only extract the first N pages (e.g. for previews)
+        :param ocr: OCR pages without a usable text layer (fewer than
+            ``ocr_min_chars`` characters of text and at least one image);
+            every other page keeps the fast text-layer path
+        :param ocr_dpi: Resolution the OCR pages are rasterized at
+        :param ocr_min_chars: Pages with less text than this are OCR candidates
+        :param ocr_workers: Processes running OCR in parallel (each loads its
+            own OCR model)
+        :param ocr_batch_pages: Pages rasterized and recognized per OCR task
+        """
+        super().__init__(file_path)
+        self.parallel = parallel
+        self.workers = workers
+        self.min_pages_per_shard = max(1, min_pages_per_shard)
+        self.max_pages = max_pages
+        self.ocr = ocr
+        self.ocr_dpi = ocr_dpi
+        self.ocr_min_chars = ocr_min_chars
+        self.ocr_workers = max(1, ocr_workers)
+        self.ocr_batch_pages = max(1, ocr_batch_pages)
+
+    def iter_text(self):
+        """Extract plain text from a PDF using PyMuPDF, one page at a time."""
+        with self._stage("open"):
+            doc = self._open_document()
+        with doc:
+            page_count = doc.page_count
+            if self.max_pages is not None:
+                page_count = min(page_count, max(0, self.max_pages))
+            self._count("pages", page_count)
+            workers = self._worker_count(page_count)
+            if workers <= 1:
+                pages = (doc[i].get_text("text") for i in range(page_count))
+            else:
+                pages = self._iter_sharded(page_count, workers)
+            pages = self._timed("parse", pages)
+            if self.ocr:
+                pages = self._with_ocr(doc, pages)
+
+            for i, text in enumerate(pages):
+                if i:
+                    yield "\n"
+                yield text
+
+    def _open_document(self):
+        if self.is_path:
+            return fitz.open(self.file_path)
+        with self.open_binary() as f:
+            return fitz.open(stream=f.read(), filetype="pdf")
+
+    def _iter_sharded(self, page_count: int, workers: int) -> Iterator[str]:
+        # Several shards per worker keep the pool balanced and let the first
+        # pages stream out early. Each worker opens its own document and the
+        # shards come back in page order.
+        shards = min(page_count // self.min_pages_per_shard, workers * SHARDS_PER_WORKER)
+        tasks = ((self.file_path, start, stop) for start, stop in split_range(page_count, shards))
+        for pages in ordered_imap(_extract_page_range, tasks, workers=workers):
+            yield from pages
+
+    def _needs_ocr(self, page, text: str) -> bool:
+        return len(text.strip()) < self.ocr_min_chars and bool(page.get_images(full=False))
+
+    def _with_ocr(self, doc, pages: Iterator[str]) -> Iterator[str]:
+        """Replace the text of image-only pages by OCR output, keeping page order."""
+        pool = None
+        if self.ocr_workers > 1 and self.is_path:
+            pool = ProcessPoolExecutor(max_workers=self.ocr_workers)
+        try:
+            window = []
+            start = 0
+            for text in pages:
+                window.append(text)
+                if len(window) == OCR_WINDOW_PAGES:
+                    yield from self._ocr_window(doc, start, window, pool)
+                    start += len(window)
+                    window = []
+            if window:
+                yield from self._ocr_window(doc, start, window, pool)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+    def _ocr_window(self, doc, start: int, texts: List[str], pool) -> List[str]:
+        candidates = [start + i for i, text in enumerate(texts) if self._needs_ocr(doc[start + i], text)]
+        if not candidates:
+            return texts
+        self._count("ocr_pages", len(candidates))
+        step = self.ocr_batch_pages
+        batches = [candidates[i:i + step] for i in range(0, len(candidates), step)]
+        with self._stage("ocr"):
+            if not self.is_path:
+                results = [_ocr_images(doc, batch, self.ocr_dpi) for batch in batches]
+            elif pool is None:
+                results = [_ocr_pages(self.file_path, batch, self.ocr_dpi) for batch in batches]
+            else:
+                futures = [pool.submit(_ocr_pages, self.file_path, batch, self.ocr_dpi) for batch in batches]
+                results = [future.result() for future in futures]
+        for batch, batch_texts in zip(batches, results):
+            for number, text in zip(batch, batch_texts):
+                if text.strip():
+                    texts[number - start] = text
+        return texts
+
+    def _worker_count(self, page_count: int) -> int:
+        if not self.parallel or not self.is_path:
+            return 1
+        return min(resolve_workers(self.workers), page_count // self.min_pages_per_shard)
@@ -0,0 +1,177 @@
+"""
+Single registry mapping file extensions to extractor classes.
+
+Extractors are registered by dotted path (``"package.module:ClassName"``)
+and only imported the first time a file of that type is extracted, so
+importing the services package does not pull in PyMuPDF, pandas, PyYAML
+and friends up front.
+
+Third-party packages can add extractors through the ``nexa.extractors``
+entry-point group; the entry-point name is the extension::
+
+    [project.entry-points."nexa.extractors"]
+    ".rtf" = "my_package.rtf:RTFExtractor"
+"""
+import importlib
+import os
+from collections.abc import Mapping
+from importlib.metadata import entry_points
+from typing import Dict, Iterator, Union
+
+ENTRY_POINT_GROUP = "nexa.extractors"
+
+_PKG = __name__.rsplit(".", 1)[0]
+
+BUILTIN_EXTRACTORS: Dict[str, str] = {
+    ".pdf": f"{_PKG}.pdf_extractor:PDFExtractor",
+    ".docx": f"{_PKG}.docx_extractor:DocxExtractor",
+    ".csv": f"{_PKG}.csv_extractor:CSVExtractor",
+    ".txt": f"{_PKG}.txt_extractor:TXTExtractor",
+    ".json": f"{_PKG}.json_extractor:JSONExtractor",
+    ".jsonl": f"{_PKG}.jsonl_extractor:JSONLinesExtractor",
+    ".ndjson": f"{_PKG}.jsonl_extractor:JSONLinesExtractor",
+    ".yaml": f"{_PKG}.yaml_extractor:YAMLExtractor",
+    ".yml": f"{_PKG}.yaml_extractor:YAMLExtractor",
+    ".toml": f"{_PKG}.toml_extractor:TOMLExtractor",
+    ".md": f"{_PKG}.markdown_extractor:MarkdownExtractor",
+    ".markdown": f"{_PKG}.markdown_extractor:MarkdownExtractor",
+    ".html": f"{_PKG}.html_extractor:HTMLExtractor",
+    ".htm": f"{_PKG}.html_extractor:HTMLExtractor",
+    ".xlsx": f"{_PKG}.xlsx_extractor:XLSXExtractor",
+    ".xlsm": f"{_PKG}.xlsx_extractor:XLSXExtractor",
+    ".zip": f"{_PKG}.archive_extractor:ArchiveExtractor",
+    ".tar": f"{_PKG}.archive_extractor:ArchiveExtractor",
+    ".tar.gz": f"{_PKG}.archive_extractor:ArchiveExtractor",
+    ".tgz": f"{_PKG}.archive_extractor:ArchiveExtractor",
+    ".tar.bz2": f"{_PKG}.archive_extractor:ArchiveExtractor",
+    ".tbz2": f"{_PKG}.archive_extractor:ArchiveExtractor",
+    ".tar.xz": f"{_PKG}.archive_extractor:ArchiveExtractor",
+    ".txz": f"{_PKG}.archive_extractor:ArchiveExtractor",
+    ".gz": f"{_PKG}.compressed_extractor:CompressedExtractor",
+    ".bz2": f"{_PKG}.compressed_extractor:CompressedExtractor",
+    ".xz": f"{_PKG}.compressed_extractor:CompressedExtractor",
+    ".zst": f"{_PKG}.compressed_extractor:CompressedExtractor",
+}
+
+
+def import_target(target: str) -> type:
+    """Import ``"package.module:ClassName"`` and return the class."""
+    module_name, _, attr = target.partition(":")
+    if not attr:
+        raise ValueError(f"Extractor target must look like 'package.module:ClassName', got {target!r}")
+    obj = importlib.import_module(module_name)
+    for part in attr.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _normalize(extension: str) -> str:
+    extension = extension.lower()
+    return extension if extension.startswith(".") else "." + extension
+
+
+class ExtractorRegistry(Mapping):
+    """
+    Read-only mapping of extension -> extractor class that imports lazily.
+
+    ``ext in registry`` and iteration never import anything; indexing
+    imports the extractor's module on first use and caches the class.
+    """
+
+    def __init__(self, targets: Dict[str, str] = None, load_entry_points: bool = True):
+        self._targets = {}
+        self._classes = {}
+        self._compound = ()  # multi-part extensions such as ".tar.gz", longest first
+        self._entry_points_loaded = not load_entry_points
+        for extension, target in (BUILTIN_EXTRACTORS if targets is None else targets).items():
+            self.register(extension, target)
+
+    def register(self, extension: str, target: Union[str, type]) -> None:
+        """Register an extractor class (or its dotted path) for ``extension``, replacing any previous one."""
+        extension = _normalize(extension)
+        self._classes.pop(extension, None)
+        if isinstance(target, str):
+            self._targets[extension] = target
+        else:
+            self._targets[extension] = f"{target.__module__}:{target.__qualname__}"
+            self._classes[extension] = target
+        self._index_compound(extension)
+
+    def extension_of(self, file_path: str) -> str:
+        """
+        Return the lower-cased extension of ``file_path`` (e.g. ``".pdf"``).
+
+        Registered multi-part extensions win over the last suffix, so
+        ``data.tar.gz`` maps to ``".tar.gz"`` rather than ``".gz"``.
+        """
+        name = os.path.basename(file_path).lower()
+        for extension in self._compound:
+            if name.endswith(extension) and len(name) > len(extension):
+                return extension
+        return os.path.splitext(name)[1]
+
+    def get_class(self, file_path: str) -> type:
+        """Return the extractor class for ``file_path``, or raise ValueError if unsupported."""
+        file_ext = self.extension_of(file_path)
+        if file_ext not in self:
+            raise ValueError(f"Unsupported file type: {file_ext}")
+        return self[file_ext]
+
+    def create(self, file_path: str, **options):
+        """Instantiate the extractor for ``file_path``."""
+        return self.get_class(file_path)(file_path, **options)
+
+    def _load_entry_points(self) -> None:
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+        for ep in entry_points(group=ENTRY_POINT_GROUP):
+            extension = _normalize(ep.name)
+            # Built-ins and explicit register() calls take precedence
+            if extension not in self._targets:
+                self._targets[extension] = ep.value
+                self._index_compound(extension)
+
+    def _index_compound(self, extension: str) -> None:
+        if extension.count(".") > 1 and extension not in self._compound:
+            self._compound = tuple(sorted(self._compound + (extension,), key=len, reverse=True))
+
+    def __getitem__(self, extension: str) -> type:
+        extension = _normalize(extension)
+        cls = self._classes.get(extension)
+        if cls is None:
+            self._load_entry_points()
+            cls = import_target(self._targets[extension])
+            self._classes[extension] = cls
+        return cls
+
+    def __contains__(self, extension) -> bool:
+        if not isinstance(extension, str):
+            return False
+        extension = _normalize(extension)
+        if extension in self._targets:
+            return True
+        self._load_entry_points()
+        return extension in self._targets
+
+    def __iter__(self) -> Iterator[str]:
+        self._load_entry_points()
+        return iter(list(self._targets))
+
+    def __len__(self) -> int:
+        self._load_entry_points()
+        return len(self._targets)
+
+
+# Shared default registry used by UnifiedService and the CLI.
+registry = ExtractorRegistry()
+
+
+def register_extractor(extension: str, target: Union[str, type]) -> None:
+    """Register an extractor for ``extension`` in the default registry."""
+    registry.register(extension, target)
+
+
+def get_extractor(file_path: str, **options):
+    """Instantiate the extractor registered for ``file_path`` in the default registry."""
+    return registry.create(file_path, **options)
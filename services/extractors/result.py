@@ -0,0 +1,57 @@
+"""
+Structured extraction result with per-stage timings.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class ExtractionResult:
+    """
+    Text of one document plus what it took to produce it.
+
+    ``timings`` maps stage names to wall-clock seconds. Which stages are
+    reported depends on the extractor (``open``, ``parse``, ``render``,
+    ``ocr``, ...); ``total`` is always present and covers the whole
+    extraction, including time not attributed to any stage. Stages of
+    streaming extractors interleave, so they need not add up to ``total``.
+    """
+
+    text: str
+    extractor: str
+    version: str
+    path: Optional[str] = None
+    bytes: int = 0
+    chars: int = 0
+    pages: Optional[int] = None
+    rows: Optional[int] = None
+    counts: Dict[str, int] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+    cached: bool = False
+
+    @property
+    def format(self) -> str:
+        """Short format name derived from the extractor class (``PDFExtractor`` -> ``"pdf"``)."""
+        name = self.extractor.lower()
+        return name[:-len("extractor")] if name.endswith("extractor") else name
+
+    def to_metrics(self, prefix: str = "nexa.extraction") -> Dict[str, float]:
+        """
+        Flatten the result into ``{metric name: value}`` for a metrics backend.
+
+        Names look like ``nexa.extraction.pdf.parse_seconds`` and
+        ``nexa.extraction.pdf.pages``, so they can be fed to a StatsD or
+        Prometheus client as-is.
+        """
+        base = f"{prefix}.{self.format}"
+        metrics = {f"{base}.{stage}_seconds": seconds for stage, seconds in self.timings.items()}
+        metrics[f"{base}.bytes"] = self.bytes
+        metrics[f"{base}.chars"] = self.chars
+        if self.pages is not None:
+            metrics[f"{base}.pages"] = self.pages
+        if self.rows is not None:
+            metrics[f"{base}.rows"] = self.rows
+        for name, value in self.counts.items():
+            metrics[f"{base}.{name}"] = value
+        metrics[f"{base}.cache_hits"] = int(self.cached)
+        return metrics
@@ -1,5 +1,8 @@
 # extractors/toml_extractor.py
+from typing import Optional
+
 from .base_extractor import BaseExtractor
+from .flatten import check_output_format, iter_flat_lines, iter_object_events, json_default
 import json
 
 try:
@@ -9,7 +12,32 @@ except ModuleNotFoundError:
 
 
 class TOMLExtractor(BaseExtractor):
-    def extract_text(self) -> str:
-        with open(self.file_path, 'rb') as f:
+    def __init__(
+        self,
+        file_path: str,
+        output_format: str = "json",
+        max_depth: Optional[int] = None,
+        max_array_items: Optional[int] = None,
+    ):
+        """
+        :param file_path: Path to the TOML file
+        :param output_format: ``"json"`` (pretty-printed, indent 2) or
+            ``"flat"`` (one ``key.path[i] = value`` line per leaf)
+        :param max_depth: Flat format only: key-path depth to expand
+        :param max_array_items: Flat format only: array items kept per array
+        """
+        super().__init__(file_path)
+        self.output_format = check_output_format(output_format)
+        self.max_depth = max_depth
+        self.max_array_items = max_array_items
+
+    def iter_text(self):
+        with self.open_binary() as f, self._stage("parse"):
             data = tomllib.load(f)
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        if self.output_format == "flat":
+            lines = iter_flat_lines(iter_object_events(data), self.max_depth, self.max_array_items)
+            yield from self._timed("render", lines)
+            return
+        # TOML dates and times have no JSON type: render them as ISO strings
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False, default=json_default)
+        yield from self._timed("render", encoder.iterencode(data))
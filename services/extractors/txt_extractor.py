@@ -1,8 +1,241 @@
 # extractors/txt_extractor.py
+import mmap
+import os
+import stat
+from typing import Iterator, Optional, Tuple
+
 from .base_extractor import BaseExtractor
 
+# Bytes decoded per step; the text of one block is all that is held in memory.
+MMAP_BLOCK_SIZE = 1024 * 1024
+
+
+def _complete_prefix(data: bytes) -> int:
+    """
+    Length of the longest prefix of ``data`` that can be decoded on its own:
+    no UTF-8 sequence is cut in half and a trailing ``\\r`` is held back in
+    case the next block starts with ``\\n``.
+    """
+    end = len(data)
+    if data.endswith(b"\r"):
+        end -= 1
+    i = end - 1
+    back = 0
+    while i >= 0 and back < 3 and 0x80 <= data[i] < 0xC0:
+        i -= 1
+        back += 1
+    if i >= 0 and data[i] >= 0xC0:
+        need = 2 if data[i] < 0xE0 else 3 if data[i] < 0xF0 else 4
+        if i + need > end:
+            end = i
+    return end
+
+
+def _translate(text: str) -> str:
+    # Same universal-newline translation as opening the file in text mode
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _decode_blocks(blocks: Iterator[bytes], drop_partial: bool = False) -> Iterator[str]:
+    """Decode UTF-8 ``blocks``; with ``drop_partial`` a character cut off at the very end is dropped."""
+    carry = b""
+    for block in blocks:
+        data = carry + block if carry else block
+        cut = _complete_prefix(data)
+        carry = data[cut:]
+        if cut:
+            yield _translate(data[:cut].decode("utf-8"))
+    if carry:
+        if drop_partial and not carry.endswith(b"\r"):
+            # carry is a held-back "\r" or the start of a cut-off character
+            carry = carry[:_complete_prefix(carry)]
+        if carry:
+            yield _translate(carry.decode("utf-8"))
+
+
+def _char_boundary(buf, pos: int, size: int) -> int:
+    """
+    Move offset ``pos`` of ``buf`` (``size`` bytes long) back to the start
+    of the character it falls in, and past the ``\n`` of a CRLF pair it
+    would split.
+    """
+    back = 0
+    while 0 < pos < size and back < 3 and 0x80 <= buf[pos] < 0xC0:
+        pos -= 1
+        back += 1
+    if 0 < pos < size and buf[pos - 1] == 0x0D and buf[pos] == 0x0A:
+        pos += 1
+    return pos
+
+
+def _line_slice(blocks: Iterator[bytes], first: int, stop: Optional[int]) -> Iterator[bytes]:
+    """Bytes of the zero-based, half-open range of ``\n``-terminated lines ``[first, stop)``."""
+    line = 0
+    for block in blocks:
+        pos = 0
+        if line < first:
+            count = block.count(b"\n")
+            if line + count < first:
+                line += count
+                continue
+            while line < first:
+                pos = block.index(b"\n", pos) + 1
+                line += 1
+        end = len(block)
+        if stop is not None:
+            cursor = pos
+            while line < stop:
+                index = block.find(b"\n", cursor)
+                if index < 0:
+                    break
+                line += 1
+                cursor = index + 1
+            if line >= stop:
+                end = max(pos, cursor)
+        if end > pos:
+            yield block[pos:end]
+        if stop is not None and line >= stop:
+            return
+
 
 class TXTExtractor(BaseExtractor):
-    def extract_text(self) -> str:
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            return f.read().strip()
+    def __init__(
+        self,
+        file_path: str,
+        byte_range: Optional[Tuple[int, Optional[int]]] = None,
+        line_range: Optional[Tuple[int, Optional[int]]] = None,
+        block_size: int = MMAP_BLOCK_SIZE,
+    ):
+        """
+        :param file_path: Path to the UTF-8 text file
+        :param byte_range: ``(start, stop)`` byte offsets to extract (``stop``
+            may be None for end of file); both ends are moved back to a
+            character boundary so no character is split and adjacent ranges
+            tile the file
+        :param line_range: ``(first, stop)`` zero-based, half-open range of
+            ``\\n``-terminated lines to extract (``stop`` may be None)
+        :param block_size: Bytes decoded per step
+        """
+        super().__init__(file_path)
+        if byte_range is not None and line_range is not None:
+            raise ValueError("byte_range and line_range are mutually exclusive")
+        self.byte_range = byte_range
+        self.line_range = line_range
+        self.block_size = max(16, block_size)
+
+    def iter_text(self):
+        """Decode the file block by block from a read-only memory map, in constant memory."""
+        with self.open_binary() as f:
+            try:
+                st = os.fstat(f.fileno())
+                if stat.S_ISREG(st.st_mode) and st.st_size == 0:
+                    return
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Not mappable (pipe, special file, in-memory stream): plain buffered reads
+                yield from self._timed("decode", self._iter_file(f))
+                return
+            size = st.st_size
+            with buf:
+                if hasattr(buf, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    buf.madvise(mmap.MADV_SEQUENTIAL)
+                start, stop = self._byte_bounds(buf, size)
+                step = self.block_size
+                blocks = (buf[pos:min(pos + step, stop)] for pos in range(start, stop, step))
+                yield from self._timed("decode", _decode_blocks(blocks))
+
+    def _byte_bounds(self, buf, size: int) -> Tuple[int, int]:
+        """Resolve the requested slice to character-aligned ``[start, stop)`` byte offsets."""
+        if self.line_range is not None:
+            first, last = self.line_range
+            start = self._line_offset(buf, size, first)
+            stop = size if last is None else self._line_offset(buf, size, last)
+            return start, max(start, stop)
+        if self.byte_range is None:
+            return 0, size
+
+        start, stop = self.byte_range
+        start = min(max(0, start), size)
+        stop = size if stop is None else min(max(start, stop), size)
+        # Both ends move back to the start of the character they fall in, so
+        # adjacent ranges tile the file exactly
+        start = _char_boundary(buf, start, size)
+        return start, max(start, _char_boundary(buf, stop, size))
+
+    def _line_offset(self, buf, size: int, line: int) -> int:
+        """Byte offset where zero-based ``line`` starts (``size`` if the file has fewer lines)."""
+        if line <= 0:
+            return 0
+        seen = 0
+        step = self.block_size
+        for pos in range(0, size, step):
+            block = buf[pos:pos + step]
+            count = block.count(b"\n")
+            if seen + count < line:
+                seen += count
+                continue
+            index = -1
+            for _ in range(line - seen):
+                index = block.find(b"\n", index + 1)
+            return pos + index + 1
+        return size
+
+    def _iter_file(self, f):
+        """Same slicing rules as the mmap path, reading ``f`` front to back."""
+        if self.line_range is not None:
+            first, last = self.line_range
+            yield from _decode_blocks(_line_slice(self._read_blocks(f), max(0, first), last))
+            return
+        start, stop = self.byte_range or (0, None)
+        yield from _decode_blocks(self._byte_slice(f, max(0, start), stop), drop_partial=stop is not None)
+
+    def _read_blocks(self, f) -> Iterator[bytes]:
+        while True:
+            block = f.read(self.block_size)
+            if not block:
+                return
+            yield block
+
+    def _byte_slice(self, f, start: int, stop: Optional[int]) -> Iterator[bytes]:
+        """
+        Bytes of ``[start, stop)`` with both ends aligned by ``_char_boundary``.
+
+        Only a few bytes around each end are buffered: a boundary never moves
+        more than 3 bytes back or 1 byte forward.
+        """
+        # Start reading up to 4 bytes early so the start can move back
+        base = max(0, start - 4)
+        if f.seekable():
+            f.seek(base)
+        else:
+            skip = base
+            while skip > 0:
+                block = f.read(min(self.block_size, skip))
+                if not block:
+                    return
+                skip -= len(block)
+        data = f.read(start + 1 - base)  # up to and including the byte at start
+        begin = _char_boundary(data, min(start - base, len(data)), len(data))
+        data, base = data[begin:], base + begin
+        if stop is None:
+            if data:
+                yield data
+            yield from self._read_blocks(f)
+            return
+
+        stop = max(start, stop)
+        while base + len(data) <= stop:
+            block = f.read(self.block_size)
+            if not block:
+                break
+            data += block
+            # Everything before stop - 4 is final; keep the rest to align the stop
+            final = min(len(data), stop - 4 - base)
+            if final > 0:
+                yield data[:final]
+                data, base = data[final:], base + final
+        end = _char_boundary(data, min(max(0, stop - base), len(data)), len(data))
+        if end > 0:
+            yield data[:end]
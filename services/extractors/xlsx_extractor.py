@@ -0,0 +1,113 @@
+# extractors/xlsx_extractor.py
+import datetime
+from typing import Optional, Sequence, Union
+
+from .base_extractor import BaseExtractor
+
+
+def _render_cell(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"  # as Excel shows them
+    return str(value)
+
+
+def _render_row(values) -> Optional[str]:
+    """Render one row of cell values as a ``" | "``-joined line (None if every cell is empty)."""
+    cells = [_render_cell(value) for value in values]
+    while cells and not cells[-1]:
+        cells.pop()  # formatting often stretches rows with empty trailing cells
+    if not cells:
+        return None
+    return " | ".join(cells)
+
+
+class XLSXExtractor(BaseExtractor):
+    """Extractor for Excel workbooks (.xlsx / .xlsm), streamed row by row."""
+
+    cost_weight = 3.0
+    random_access = True
+
+    def __init__(
+        self,
+        file_path: str,
+        sheets: Optional[Sequence[Union[str, int]]] = None,
+        max_rows: Optional[int] = None,
+    ):
+        """
+        :param file_path: Path to the workbook
+        :param sheets: Optional sheet names or zero-based positions to
+            extract, in the order given (default: every worksheet in
+            workbook order)
+        :param max_rows: Optional maximum number of non-empty rows per sheet;
+            reading a sheet stops as soon as it is reached
+        """
+        super().__init__(file_path)
+        if max_rows is not None and max_rows < 0:
+            raise ValueError("max_rows must be a non-negative integer")
+        self.sheets = sheets
+        self.max_rows = max_rows
+
+    def iter_text(self):
+        """
+        Yield the rows of each selected sheet as ``" | "``-joined lines.
+
+        The workbook is opened in read-only mode, so rows are parsed from the
+        sheet XML as they are iterated and memory does not grow with the
+        sheet size. Sheets written without a ``<dimension>`` element (Excel
+        always writes one) are scanned once more by openpyxl when the
+        workbook is opened. Formulas are rendered as their last computed values.
+        When more than one sheet is extracted, each starts with an
+        ``=== sheet name ===`` line. Rows without any value are skipped.
+        """
+        import openpyxl
+
+        source = self.file_path if self.is_path else self.open_binary()
+        with self._stage("open"):
+            workbook = openpyxl.load_workbook(source, read_only=True, data_only=True, keep_links=False)
+        try:
+            worksheets = self._select(workbook)
+            first = True
+            for worksheet in worksheets:
+                # Read-only sheets trust the stored dimensions, which some
+                # writers get wrong; iterate over the cells actually present
+                worksheet.reset_dimensions()
+                emitted = 0
+                for values in self._timed("parse", worksheet.iter_rows(values_only=True)):
+                    if self.max_rows is not None and emitted >= self.max_rows:
+                        break
+                    line = _render_row(values)
+                    if line is None:
+                        continue
+                    separator = "\n"
+                    if emitted == 0 and len(worksheets) > 1:
+                        line = f"=== {worksheet.title} ===\n{line}"
+                        separator = "\n\n"
+                    if not first:
+                        yield separator
+                    first = False
+                    emitted += 1
+                    self._count("rows")
+                    yield line
+        finally:
+            workbook.close()
+
+    def _select(self, workbook) -> list:
+        worksheets = workbook.worksheets  # chart sheets have no cells and are left out
+        if self.sheets is None:
+            return worksheets
+        by_name = {worksheet.title: worksheet for worksheet in worksheets}
+        selected = []
+        for sheet in self.sheets:
+            if isinstance(sheet, int):
+                if not 0 <= sheet < len(worksheets):
+                    raise ValueError(f"Sheet index {sheet} out of range; the workbook has {len(worksheets)} sheets")
+                selected.append(worksheets[sheet])
+            elif sheet in by_name:
+                selected.append(by_name[sheet])
+            else:
+                raise ValueError(f"No sheet named {sheet!r}; available: {', '.join(by_name)}")
+        return selected
@@ -1,12 +1,57 @@
 # extractors/yaml_extractor.py
+from typing import Optional
+
 from .base_extractor import BaseExtractor
+from .flatten import check_output_format, iter_flat_lines, iter_object_events, json_default
 import yaml
 import json
 
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml-backed, much faster
+except ImportError:
+    from yaml import SafeLoader  # pure-Python fallback
+
+# Written between documents of a multi-document stream.
+DOCUMENT_SEPARATOR = "\n---\n"
+
 
 class YAMLExtractor(BaseExtractor):
-    def extract_text(self) -> str:
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-        # Convert to pretty JSON-like text for readability
-        return json.dumps(data, indent=2, ensure_ascii=False)
+    def __init__(
+        self,
+        file_path: str,
+        output_format: str = "json",
+        max_depth: Optional[int] = None,
+        max_array_items: Optional[int] = None,
+    ):
+        """
+        :param file_path: Path to the YAML file
+        :param output_format: ``"json"`` (pretty-printed, indent 2) or
+            ``"flat"`` (one ``key.path[i] = value`` line per leaf)
+        :param max_depth: Flat format only: key-path depth to expand
+        :param max_array_items: Flat format only: array items kept per array
+        """
+        super().__init__(file_path)
+        self.output_format = check_output_format(output_format)
+        self.max_depth = max_depth
+        self.max_array_items = max_array_items
+
+    def iter_text(self):
+        # Documents are parsed and rendered one at a time, so a long
+        # multi-document stream (e.g. Kubernetes manifests) is never fully loaded
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False, default=json_default)
+        empty = True
+        with self.open_text() as f:
+            for data in self._timed("parse", yaml.load_all(f, Loader=SafeLoader)):
+                if not empty:
+                    # flat lines already end with a newline
+                    yield DOCUMENT_SEPARATOR if self.output_format == "json" else DOCUMENT_SEPARATOR.lstrip("\n")
+                empty = False
+                self._count("documents")
+                if self.output_format == "flat":
+                    lines = iter_flat_lines(iter_object_events(data), self.max_depth, self.max_array_items)
+                    yield from self._timed("render", lines)
+                else:
+                    # Convert to pretty JSON-like text for readability
+                    yield from self._timed("render", encoder.iterencode(data))
+        if empty:
+            yield from encoder.iterencode(None)
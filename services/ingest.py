@@ -0,0 +1,347 @@
+"""
+Incremental directory ingestion.
+
+A ``DirectoryIngester`` walks a folder tree, extracts every file the
+extractor registry supports and records the outcome in a SQLite
+manifest (path, size, mtime, content hash, status). Later runs only
+extract files that are new or whose size/mtime changed; a file that was
+merely touched (same content hash) is not extracted again. Files that
+disappeared are tombstoned rather than forgotten, so consumers can
+remove them downstream.
+
+``watch()`` keeps the manifest current continuously, using filesystem
+notifications (inotify on Linux) through the optional ``watchdog``
+package, or periodic re-scans when it is not installed.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .extraction_cache import hash_file
+from .extractors.registry import registry
+
+DEFAULT_POLL_INTERVAL_SECONDS = 60.0
+DEFAULT_DEBOUNCE_SECONDS = 2.0
+_COMMIT_EVERY = 256
+
+logger = logging.getLogger(__name__)
+
+
+class DirectoryIngester:
+    """Extract new and changed files under ``root``, tracked in a SQLite manifest."""
+
+    def __init__(
+        self,
+        root: str,
+        manifest_path: str,
+        service=None,
+        handler: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_delete: Optional[Callable[[str], None]] = None,
+        workers: Optional[int] = None,
+        isolated: bool = False,
+        retry_failed: bool = False,
+        **extractor_options: Any,
+    ):
+        """
+        :param root: Directory to ingest (walked recursively, symlinked
+            directories are not followed)
+        :param manifest_path: SQLite file holding the manifest; one manifest
+            can track several roots
+        :param service: ``UnifiedService`` used for extraction (a default one
+            is created when omitted)
+        :param handler: Called with each extraction result dict
+            (``path``, ``text``, ``error``, ``status``) as files finish
+        :param on_delete: Called with the path of every newly tombstoned file
+        :param workers: Worker processes for extraction (see ``UnifiedService.extract_many``)
+        :param isolated: Extract in sandboxed workers (timeouts, memory cap)
+        :param retry_failed: Also re-extract unchanged files whose last
+            extraction failed
+        :param extractor_options: Keyword options forwarded to every extractor
+        """
+        self.root = os.path.abspath(root)
+        self.manifest_path = manifest_path
+        if service is None:
+            from .services import UnifiedService
+            service = UnifiedService()
+        self.service = service
+        self.handler = handler
+        self.on_delete = on_delete
+        self.workers = workers
+        self.isolated = isolated
+        self.retry_failed = retry_failed
+        self.extractor_options = extractor_options
+
+        manifest_dir = os.path.dirname(os.path.abspath(manifest_path))
+        os.makedirs(manifest_dir, exist_ok=True)
+        conn = sqlite3.connect(self.manifest_path)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS manifest (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                digest TEXT,
+                status TEXT NOT NULL,
+                error TEXT,
+                chars INTEGER,
+                updated_at REAL NOT NULL,
+                deleted INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        conn.commit()
+        conn.close()
+
+    # ---------------------------------------------------------------
+    # Runs
+    # ---------------------------------------------------------------
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Scan the whole tree once and bring the manifest up to date.
+
+        :return: Summary dict with the counts ``scanned``, ``new``,
+            ``changed``, ``touched`` (metadata changed, content did not),
+            ``unchanged``, ``deleted``, ``ok`` and ``failed``, plus ``elapsed``
+            seconds
+        """
+        start = time.perf_counter()
+        conn = sqlite3.connect(self.manifest_path)
+        try:
+            known = self._load(conn, self.root)
+            seen = list(self._walk(self.root))
+            summary = self._sync(conn, seen, known)
+            seen_paths = {path for path, _, _ in seen}
+            gone = [path for path, row in known.items() if not row[4] and path not in seen_paths]
+            summary["deleted"] = self._tombstone(conn, gone)
+        finally:
+            conn.close()
+        summary["elapsed"] = time.perf_counter() - start
+        return summary
+
+    def ingest_paths(self, paths: Iterable[str]) -> Dict[str, Any]:
+        """
+        Bring the manifest up to date for specific files or directories only.
+
+        Paths that no longer exist are tombstoned (for a directory, every
+        file recorded below it); existing directories are walked.
+
+        :return: Summary dict as described in ``run``
+        """
+        start = time.perf_counter()
+        seen = []
+        missing = []
+        for path in {os.path.abspath(p) for p in paths}:
+            if os.path.isdir(path):
+                seen.extend(self._walk(path))
+            elif os.path.isfile(path):
+                if registry.extension_of(path) in registry:
+                    st = os.stat(path)
+                    seen.append((path, st.st_size, st.st_mtime_ns))
+            else:
+                missing.append(path)
+
+        conn = sqlite3.connect(self.manifest_path)
+        try:
+            known = {}
+            for path, _, _ in seen:
+                row = conn.execute(
+                    "SELECT size, mtime_ns, digest, status, deleted FROM manifest WHERE path = ?", (path,)
+                ).fetchone()
+                if row:
+                    known[path] = row
+            summary = self._sync(conn, seen, known)
+            gone = []
+            for path in missing:
+                gone.extend(p for p, row in self._load(conn, path).items() if not row[4])
+            summary["deleted"] = self._tombstone(conn, gone)
+        finally:
+            conn.close()
+        summary["elapsed"] = time.perf_counter() - start
+        return summary
+
+    def watch(
+        self,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        debounce: float = DEFAULT_DEBOUNCE_SECONDS,
+        stop_event: Optional[threading.Event] = None,
+    ) -> None:
+        """
+        Run once, then keep ingesting changes until ``stop_event`` is set
+        (or the process is interrupted).
+
+        With ``watchdog`` installed, filesystem events are collected and the
+        affected paths are ingested in batches every ``debounce`` seconds;
+        without it the tree is re-scanned every ``poll_interval`` seconds.
+        """
+        stop_event = stop_event or threading.Event()
+        logger.info("Initial ingestion of %s: %s", self.root, self.run())
+
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logger.info("watchdog not installed; polling %s every %gs", self.root, poll_interval)
+            while not stop_event.wait(poll_interval):
+                logger.info("Ingestion of %s: %s", self.root, self.run())
+            return
+
+        dirty = set()
+        lock = threading.Lock()
+
+        class _Collector(FileSystemEventHandler):
+            def on_any_event(self, event):
+                with lock:
+                    dirty.add(event.src_path)
+                    if getattr(event, "dest_path", None):
+                        dirty.add(event.dest_path)
+
+        observer = Observer()
+        observer.schedule(_Collector(), self.root, recursive=True)
+        observer.start()
+        try:
+            while not stop_event.wait(debounce):
+                with lock:
+                    paths = [p for p in dirty if p != self.root]
+                    dirty.clear()
+                if paths:
+                    logger.info("Ingestion of %d changed paths: %s", len(paths), self.ingest_paths(paths))
+        finally:
+            observer.stop()
+            observer.join()
+
+    def manifest(self, include_deleted: bool = False) -> List[Dict[str, Any]]:
+        """Return the manifest rows recorded under ``root``."""
+        conn = sqlite3.connect(self.manifest_path)
+        try:
+            rows = conn.execute(
+                "SELECT path, size, mtime_ns, digest, status, error, chars, updated_at, deleted FROM manifest "
+                "WHERE (path = ? OR (path >= ? AND path < ?)) ORDER BY path",
+                (self.root, *_prefix_range(self.root)),
+            ).fetchall()
+        finally:
+            conn.close()
+        columns = ("path", "size", "mtime_ns", "digest", "status", "error", "chars", "updated_at", "deleted")
+        return [dict(zip(columns, row)) for row in rows if include_deleted or not row[8]]
+
+    # ---------------------------------------------------------------
+    # Internals
+    # ---------------------------------------------------------------
+
+    def _walk(self, top: str) -> Iterator[Tuple[str, int, int]]:
+        """Yield (path, size, mtime_ns) of every supported file under ``top``."""
+        manifest = os.path.abspath(self.manifest_path)
+        stack = [top]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError as exc:
+                logger.warning("Cannot list %s: %s", directory, exc)
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file() and registry.extension_of(entry.name) in registry:
+                            if entry.path != manifest:
+                                st = entry.stat()
+                                yield entry.path, st.st_size, st.st_mtime_ns
+                    except OSError:
+                        continue  # vanished or unreadable while walking
+
+    def _load(self, conn, top: str) -> Dict[str, tuple]:
+        rows = conn.execute(
+            "SELECT path, size, mtime_ns, digest, status, deleted FROM manifest "
+            "WHERE path = ? OR (path >= ? AND path < ?)",
+            (top, *_prefix_range(top)),
+        )
+        return {row[0]: row[1:] for row in rows}
+
+    def _sync(self, conn, seen: List[Tuple[str, int, int]], known: Dict[str, tuple]) -> Dict[str, Any]:
+        summary = {"root": self.root, "scanned": len(seen), "new": 0, "changed": 0, "touched": 0,
+                   "unchanged": 0, "deleted": 0, "ok": 0, "failed": 0}
+        todo = {}  # path -> (size, mtime_ns, digest)
+        touched = []
+        for path, size, mtime_ns in seen:
+            row = known.get(path)
+            if row is None:
+                summary["new"] += 1
+                todo[path] = (size, mtime_ns, None)
+                continue
+            old_size, old_mtime, old_digest, status, deleted = row
+            if not deleted and (old_size, old_mtime) == (size, mtime_ns):
+                if self.retry_failed and status != "ok":
+                    summary["changed"] += 1
+                    todo[path] = (size, mtime_ns, old_digest)
+                else:
+                    summary["unchanged"] += 1
+                continue
+
+            # Size or mtime changed (or the file came back): only the content hash can tell
+            try:
+                digest = hash_file(path)
+            except OSError:
+                digest = None
+            if digest is not None and digest == old_digest and status == "ok":
+                summary["touched"] += 1
+                touched.append((size, mtime_ns, time.time(), path))
+            else:
+                summary["changed"] += 1
+                todo[path] = (size, mtime_ns, digest)
+
+        if touched:
+            conn.executemany(
+                "UPDATE manifest SET size = ?, mtime_ns = ?, updated_at = ?, deleted = 0 WHERE path = ?", touched
+            )
+            conn.commit()
+
+        pending = 0
+        for result in self.service.iter_extract_many(
+            list(todo), workers=self.workers, isolated=self.isolated, **self.extractor_options
+        ):
+            path = result["path"]
+            size, mtime_ns, digest = todo[path]
+            if digest is None:
+                try:
+                    digest = hash_file(path)
+                except OSError:
+                    pass
+            ok = result["status"] == "ok"
+            summary["ok" if ok else "failed"] += 1
+            conn.execute(
+                "INSERT OR REPLACE INTO manifest (path, size, mtime_ns, digest, status, error, chars, updated_at, deleted) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                (path, size, mtime_ns, digest, result["status"], result["error"],
+                 len(result["text"]) if ok else None, time.time()),
+            )
+            pending += 1
+            if pending >= _COMMIT_EVERY:
+                conn.commit()
+                pending = 0
+            if self.handler is not None:
+                self.handler(result)
+        conn.commit()
+        return summary
+
+    def _tombstone(self, conn, paths: List[str]) -> int:
+        if not paths:
+            return 0
+        now = time.time()
+        conn.executemany(
+            "UPDATE manifest SET status = 'deleted', deleted = 1, updated_at = ? WHERE path = ?",
+            [(now, path) for path in paths],
+        )
+        conn.commit()
+        if self.on_delete is not None:
+            for path in paths:
+                self.on_delete(path)
+        return len(paths)
+
+
+def _prefix_range(directory: str) -> Tuple[str, str]:
+    """Bounds selecting every path below ``directory`` with a plain index range scan."""
+    prefix = directory.rstrip(os.sep) + os.sep
+    return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
@@ -19,6 +19,22 @@ class Config:
         self.interval_seconds = 30  # Change this to adjust interval
         self.similarity_threshold = 0.7  # 70%
         
+        # Extraction cache settings (used when UnifiedService is created with enable_cache=True)
+        self.extraction_cache_dir = os.path.join(self.base_dir, "extraction_cache")
+        self.extraction_cache_max_bytes = 512 * 1024 * 1024  # 512 MB of compressed text
+        
+        # Sandboxed extraction settings (UnifiedService.extract_many(..., isolated=True))
+        self.sandbox_timeout_seconds = 120  # wall-clock limit per file
+        self.sandbox_memory_limit_mb = 2048  # address-space limit per worker process
+        self.sandbox_max_jobs_per_worker = 100  # recycle workers after this many files
+        
+        # Incremental ingestion manifest (UnifiedService.ingest_directory)
+        self.ingest_manifest_path = os.path.join(self.base_dir, "ingest_manifest.db")
+        
+        # Async extraction settings (UnifiedService.aextract_from_file / aextract_many)
+        self.async_max_workers = None  # threads running extractions off the event loop (None: one per CPU)
+        self.async_max_concurrency = 32  # extractions in progress at once; more calls wait their turn
+        
         # Model settings
         self.embedding_model = "sentence-transformers/all-MiniLM-L6-v2"
         # For LangChain: HuggingFaceEmbeddings uses this model
\ No newline at end of file
@@ -1,18 +1,47 @@
 # ocr.py
-import easyocr
+from typing import List, Sequence, Union
+
+_reader = None
+
+
+def get_reader():
+    """Return the shared OCR reader, creating it on first use (once per process)."""
+    global _reader
+    if _reader is None:
+        import easyocr
+
+        _reader = easyocr.Reader(['en'], gpu=False)  # English, no GPU for local
+    return _reader
 
-# Initialize OCR reader (done once)
-reader = easyocr.Reader(['en'], gpu=False)  # English, no GPU for local
 
 def extract_text_from_image(image_path: str) -> str:
     """
     Extract text from an image using OCR.
-    
+
     Args:
         image_path (str): Path to the image file.
-    
+
     Returns:
         str: Extracted text.
     """
-    result = reader.readtext(image_path, detail=0, paragraph=True)
-    return ' '.join(result)
\ No newline at end of file
+    result = get_reader().readtext(image_path, detail=0, paragraph=True)
+    return ' '.join(result)
+
+
+def extract_text_from_images(images: Sequence[Union[str, bytes]], batch_size: int = 8) -> List[str]:
+    """
+    Extract text from several images with one reader.
+
+    Args:
+        images (list): Image paths or encoded image bytes (e.g. PNG data).
+        batch_size (int): Number of detected text regions recognized per
+            model call.
+
+    Returns:
+        list: Extracted text of each image, in input order.
+    """
+    reader = get_reader()
+    return [
+        ' '.join(reader.readtext(image, detail=0, paragraph=True, batch_size=batch_size))
+        for image in images
+    ]
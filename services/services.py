@@ -1,25 +1,27 @@
 """
 Unified service class that integrates Universal Extractor and Nexy-Rep functionalities.
 """
+import asyncio
 import os
+import threading
+import time
+import weakref
 from datetime import datetime
-from typing import Optional, Dict, Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import IO, AsyncIterator, Iterator, List, Optional, Dict, Any, Union
 import logging
 
 # Import Universal Extractor classes
-from .extractors.pdf_extractor import PDFExtractor
-from .extractors.docx_extractor import DocxExtractor
-from .extractors.csv_extractor import CSVExtractor
-from .extractors.txt_extractor import TXTExtractor
-from .extractors.json_extractor import JSONExtractor
-from .extractors.yaml_extractor import YAMLExtractor
-from .extractors.toml_extractor import TOMLExtractor
-from .extractors.markdown_extractor import MarkdownExtractor
-
-# Import Nexy-Rep configuration (lazy-import other heavy modules at runtime)
+from .extractors.base_extractor import BaseExtractor, DEFAULT_CHUNK_SIZE
+from .extractors.parallel import resolve_workers, run_extractor
+from .extractors.registry import registry
+from .extractors.result import ExtractionResult
+from .extraction_cache import ExtractionCache
+from .extraction_pool import SandboxedExtractionPool
+
+# Import Nexy-Rep configuration (lazy-import other heavy modules at runtime:
+# extractor backends load on first use, LLM and GitHub helpers inside their methods)
 from .nexy_rep.config import Config
-from .llm.agent_logic import get_query_generator_chain, get_llm, get_prompt
-from .github_activity import GitHubUserActivity
 
 
 class UnifiedService:
@@ -28,13 +30,15 @@ class UnifiedService:
     and image processing/OCR capabilities.
     """
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, enable_cache: bool = False):
         """
         Initialize the unified service.
         
         Args:
             config_path (str, optional): Path to the Nexy-Rep configuration file.
                 If not provided, default configuration will be used.
+            enable_cache (bool): Keep extracted text in a persistent on-disk cache
+                (``config.extraction_cache_dir``) so unchanged files are not re-parsed.
         """
         # Initialize Nexy-Rep configuration
         # Config currently does not accept a path; always instantiate and attach provided path for downstream use.
@@ -50,43 +54,442 @@ class UnifiedService:
             # If storage/init_db can't be imported at module import time, defer until runtime.
             logging.debug("nexy_rep.storage.init_db not available at import time; will initialize on first store")
         
-        # File type to extractor mapping
-        self.extractors = {
-            '.pdf': PDFExtractor,
-            '.docx': DocxExtractor,
-            '.csv': CSVExtractor,
-            '.txt': TXTExtractor,
-            '.json': JSONExtractor,
-            '.yaml': YAMLExtractor,
-            '.yml': YAMLExtractor,
-            '.toml': TOMLExtractor,
-            '.md': MarkdownExtractor
-        }
+        # File type to extractor mapping (shared registry; classes are imported on first use)
+        self.extractors = registry
+        
+        # Persistent extraction cache (opt-in)
+        self.extraction_cache: Optional[ExtractionCache] = None
+        if enable_cache:
+            self.extraction_cache = ExtractionCache(
+                self.config.extraction_cache_dir,
+                max_bytes=self.config.extraction_cache_max_bytes,
+            )
+        
+        # Async extraction (aextract_*): thread pool and per-event-loop
+        # concurrency limits, both created on first use
+        self._async_executor: Optional[ThreadPoolExecutor] = None
+        self._async_executor_lock = threading.Lock()
+        self._async_slots = weakref.WeakKeyDictionary()
         
         # Keep track of last processed image for similarity comparison
         self._last_embedding = None
     
-    def extract_from_file(self, file_path: str) -> str:
+    def extract_from_file(
+        self, file_path: str, return_result: bool = False, **extractor_options: Any
+    ) -> Union[str, ExtractionResult]:
         """
         Extract text from a document file.
         
         Args:
             file_path (str): Path to the document file.
+            return_result (bool): Return an ``ExtractionResult`` carrying the
+                text plus byte/character/page/row counts, the extractor name
+                and version, and per-stage timings (see ``to_metrics()``)
+                instead of the bare text.
+            **extractor_options: Keyword options forwarded to the extractor
+                (e.g. ``parallel=True, workers=8`` for PDFs).
         
         Returns:
-            str: Extracted text from the document.
+            str: Extracted text from the document, or an ``ExtractionResult``
+            if ``return_result`` is set.
             
         Raises:
             ValueError: If file type is not supported.
         """
-        file_ext = os.path.splitext(file_path)[1].lower()
-        
+        extractor = self.get_extractor(file_path, **extractor_options)
+        return self._extract(extractor, file_path, return_result, extractor_options)
+
+    def _extract(
+        self,
+        extractor: BaseExtractor,
+        file_path: str,
+        return_result: bool,
+        extractor_options: Dict[str, Any],
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Union[str, ExtractionResult]:
+        if self.extraction_cache is None:
+            if return_result:
+                return extractor.extract_result(cancel_event)
+            return extractor.extract_text(cancel_event)
+
+        start = time.perf_counter()
+        key = self.extraction_cache.key_for(file_path, type(extractor), extractor_options)
+        text = self.extraction_cache.get(key)
+        if text is not None:
+            if not return_result:
+                return text
+            elapsed = time.perf_counter() - start
+            return ExtractionResult(
+                text=text,
+                extractor=type(extractor).__name__,
+                version=extractor.version,
+                path=file_path,
+                bytes=os.path.getsize(file_path),
+                chars=len(text),
+                timings={"cache": elapsed, "total": elapsed},
+                cached=True,
+            )
+
+        result = extractor.extract_result(cancel_event) if return_result else None
+        text = extractor.extract_text(cancel_event) if result is None else result.text
+        self.extraction_cache.put(key, text)
+        return text if result is None else result
+
+    def get_extractor(self, file_path: str, **extractor_options: Any) -> BaseExtractor:
+        """
+        Build the extractor registered for the file's extension.
+
+        Args:
+            file_path (str): Path to the document file.
+            **extractor_options: Keyword options forwarded to the extractor.
+
+        Returns:
+            BaseExtractor: Extractor instance bound to ``file_path``.
+
+        Raises:
+            ValueError: If file type is not supported.
+        """
+        return self._extractor_class(file_path)(file_path, **extractor_options)
+
+    def _extractor_class(self, file_path: str) -> type:
+        file_ext = self.extractors.extension_of(file_path)
+
         if file_ext not in self.extractors:
             raise ValueError(f"Unsupported file type: {file_ext}")
-        
-        extractor = self.extractors[file_ext](file_path)
-        return extractor.extract_text()
+
+        return self.extractors[file_ext]
+
+    def iter_extract_from_file(
+        self, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, **extractor_options: Any
+    ) -> Iterator[str]:
+        """
+        Extract text from a document file as a stream of chunks.
+
+        Only one chunk (plus whatever the extractor is currently parsing)
+        is held in memory at a time, so this is the entrypoint to use for
+        very large documents.
+
+        Args:
+            file_path (str): Path to the document file.
+            chunk_size (int): Maximum number of characters per chunk.
+            **extractor_options: Keyword options forwarded to the extractor.
+
+        Yields:
+            str: Consecutive chunks of the extracted text. Joined together
+                they equal the result of ``extract_from_file``.
+
+        Raises:
+            ValueError: If file type is not supported.
+        """
+        return self.get_extractor(file_path, **extractor_options).iter_chunks(chunk_size)
+
+    def extract_to_stream(
+        self, file_path: str, stream: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE, **extractor_options: Any
+    ) -> int:
+        """
+        Extract text from a document file straight into a writable text stream.
+
+        Args:
+            file_path (str): Path to the document file.
+            stream: Any object with a ``write(str)`` method (open file,
+                ``socket.makefile('w')``, ``sys.stdout``...).
+            chunk_size (int): Maximum number of characters per write.
+            **extractor_options: Keyword options forwarded to the extractor.
+
+        Returns:
+            int: Number of characters written.
+
+        Raises:
+            ValueError: If file type is not supported.
+        """
+        return self.get_extractor(file_path, **extractor_options).write_to(stream, chunk_size)
     
+    def extract_many(
+        self, paths: List[str], workers: Optional[int] = None, isolated: bool = False, **extractor_options: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract text from many document files in parallel.
+
+        Files are scheduled most expensive first (size weighted by the
+        extractor's ``cost_weight``) to shorten the total run time, and a
+        failing file is reported in its result instead of aborting the batch.
+
+        Args:
+            paths (list): Paths of the document files.
+            workers (int, optional): Number of worker processes. Defaults to
+                the CPU count; ``1`` extracts in the current process.
+            isolated (bool): Run every file in a sandboxed worker process with
+                the timeout, memory limit and recycling settings from the config
+                (``sandbox_*``). A file that hangs, exhausts memory or crashes
+                its worker gets a failed result; the batch carries on.
+            **extractor_options: Keyword options forwarded to every extractor.
+
+        Returns:
+            list: One dict per input path, in input order:
+                {
+                    'index': int (position in ``paths``),
+                    'path': str,
+                    'text': str or None,
+                    'error': str or None,
+                    'status': 'ok' | 'error' | 'timeout' | 'memory_limit' | 'crashed'
+                }
+        """
+        results = [None] * len(paths)
+        for result in self.iter_extract_many(paths, workers=workers, isolated=isolated, **extractor_options):
+            results[result['index']] = result
+        return results
+
+    def iter_extract_many(
+        self, paths: List[str], workers: Optional[int] = None, isolated: bool = False, **extractor_options: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Generator version of ``extract_many`` that yields each result as soon
+        as its file is done (completion order, not input order).
+
+        Args:
+            paths (list): Paths of the document files.
+            workers (int, optional): Number of worker processes (see ``extract_many``).
+            isolated (bool): Use sandboxed worker processes (see ``extract_many``).
+            **extractor_options: Keyword options forwarded to every extractor.
+
+        Yields:
+            dict: Result dicts as described in ``extract_many``.
+        """
+        jobs = []
+        for index, file_path in enumerate(paths):
+            try:
+                extractor_cls = self._extractor_class(file_path)
+                cost = os.path.getsize(file_path) * extractor_cls.cost_weight
+            except (ValueError, OSError) as exc:
+                yield {'index': index, 'path': file_path, 'text': None, 'error': str(exc), 'status': 'error'}
+                continue
+
+            cache_key = None
+            if self.extraction_cache is not None:
+                cache_key = self.extraction_cache.key_for(file_path, extractor_cls, extractor_options)
+                text = self.extraction_cache.get(cache_key)
+                if text is not None:
+                    yield {'index': index, 'path': file_path, 'text': text, 'error': None, 'status': 'ok'}
+                    continue
+            jobs.append((cost, index, file_path, extractor_cls, cache_key))
+
+        # Longest jobs first so no large file starts last and stretches the batch
+        jobs.sort(key=lambda job: job[0], reverse=True)
+
+        def finish(job, text=None, exc=None):
+            _, index, file_path, _, cache_key = job
+            if exc is not None:
+                return {'index': index, 'path': file_path, 'text': None,
+                        'error': f"{type(exc).__name__}: {exc}", 'status': 'error'}
+            if cache_key is not None:
+                self.extraction_cache.put(cache_key, text)
+            return {'index': index, 'path': file_path, 'text': text, 'error': None, 'status': 'ok'}
+
+        workers = min(resolve_workers(workers), len(jobs))
+        if isolated and jobs:
+            with self._sandbox_pool(workers) as pool:
+                futures = {pool.submit(job[3], job[2], extractor_options): job for job in jobs}
+                for future in as_completed(futures):
+                    # pop: a finished future holds its text until released
+                    job = futures.pop(future)
+                    outcome = future.result()
+                    if outcome['status'] == 'ok':
+                        yield finish(job, outcome['text'])
+                    else:
+                        yield {'index': job[1], 'path': job[2], 'text': None,
+                               'error': outcome['error'], 'status': outcome['status']}
+            return
+
+        if workers <= 1:
+            for job in jobs:
+                try:
+                    text = run_extractor(job[3], job[2], extractor_options)
+                except Exception as exc:
+                    yield finish(job, exc=exc)
+                else:
+                    yield finish(job, text)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(run_extractor, job[3], job[2], extractor_options): job
+                for job in jobs
+            }
+            for future in as_completed(futures):
+                job = futures.pop(future)
+                exc = future.exception()
+                yield finish(job, exc=exc) if exc is not None else finish(job, future.result())
+
+    async def aextract_from_file(
+        self, file_path: str, return_result: bool = False, **extractor_options: Any
+    ) -> Union[str, ExtractionResult]:
+        """
+        Coroutine version of ``extract_from_file`` that never blocks the event loop.
+
+        The extraction runs on the service's bounded thread pool
+        (``config.async_max_workers``) and at most
+        ``config.async_max_concurrency`` extractions are in progress at
+        once; further calls wait their turn. Cancelling the awaiting task
+        drops a queued extraction, and stops a running one at its next
+        piece of text.
+
+        Args:
+            file_path (str): Path to the document file.
+            return_result (bool): Return an ``ExtractionResult`` (see ``extract_from_file``).
+            **extractor_options: Keyword options forwarded to the extractor.
+
+        Returns:
+            str: Extracted text, or an ``ExtractionResult`` if ``return_result`` is set.
+
+        Raises:
+            ValueError: If file type is not supported.
+        """
+        extractor = self.get_extractor(file_path, **extractor_options)
+        cancel_event = threading.Event()
+        async with self._async_slot():
+            future = self._get_async_executor().submit(
+                self._extract, extractor, file_path, return_result, extractor_options, cancel_event
+            )
+            try:
+                return await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                cancel_event.set()
+                raise
+
+    async def aextract_many(self, paths: List[str], **extractor_options: Any) -> List[Dict[str, Any]]:
+        """
+        Extract many document files concurrently without blocking the event loop.
+
+        Every file goes through ``aextract_from_file``, so the thread pool
+        and concurrency limits of the service apply across all callers. A
+        failing file is reported in its result instead of aborting the
+        batch; cancelling the call cancels every file still in progress.
+
+        Args:
+            paths (list): Paths of the document files.
+            **extractor_options: Keyword options forwarded to every extractor.
+
+        Returns:
+            list: One dict per input path, in input order, shaped like the
+                results of ``extract_many`` (``status`` is ``'ok'`` or ``'error'``).
+        """
+        async def extract_one(index: int, file_path: str) -> Dict[str, Any]:
+            try:
+                text = await self.aextract_from_file(file_path, **extractor_options)
+            except Exception as exc:
+                return {'index': index, 'path': file_path, 'text': None,
+                        'error': f"{type(exc).__name__}: {exc}", 'status': 'error'}
+            return {'index': index, 'path': file_path, 'text': text, 'error': None, 'status': 'ok'}
+
+        return list(await asyncio.gather(*(extract_one(i, p) for i, p in enumerate(paths))))
+
+    async def aiter_extract_from_file(
+        self, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, **extractor_options: Any
+    ) -> AsyncIterator[str]:
+        """
+        Async iterator version of ``iter_extract_from_file``.
+
+        Each chunk is produced on the service's thread pool only when the
+        consumer asks for it, so a slow client (e.g. a streaming HTTP
+        response) applies back-pressure and memory stays at one chunk.
+        Breaking out of the loop or cancelling the consumer stops the
+        extractor and closes the file.
+
+        Args:
+            file_path (str): Path to the document file.
+            chunk_size (int): Maximum number of characters per chunk.
+            **extractor_options: Keyword options forwarded to the extractor.
+
+        Yields:
+            str: Consecutive chunks of the extracted text.
+
+        Raises:
+            ValueError: If file type is not supported.
+        """
+        chunks = self.iter_extract_from_file(file_path, chunk_size, **extractor_options)
+        executor = self._get_async_executor()
+        future = None
+        async with self._async_slot():
+            try:
+                while True:
+                    future = executor.submit(next, chunks, None)
+                    chunk = await asyncio.wrap_future(future)
+                    if chunk is None:
+                        return
+                    yield chunk
+            finally:
+                # The generator can only be closed once no thread is advancing it
+                if future is not None and not future.done():
+                    future.add_done_callback(lambda _: chunks.close())
+                else:
+                    chunks.close()
+
+    def close(self) -> None:
+        """Shut down the thread pool used by the async API (it is recreated on next use)."""
+        with self._async_executor_lock:
+            executor, self._async_executor = self._async_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_async_executor(self) -> ThreadPoolExecutor:
+        with self._async_executor_lock:
+            if self._async_executor is None:
+                self._async_executor = ThreadPoolExecutor(
+                    max_workers=resolve_workers(self.config.async_max_workers),
+                    thread_name_prefix="nexa-extract",
+                )
+            return self._async_executor
+
+    def _async_slot(self) -> asyncio.Semaphore:
+        # asyncio primitives belong to one event loop: keep a semaphore per loop
+        loop = asyncio.get_running_loop()
+        slot = self._async_slots.get(loop)
+        if slot is None:
+            slot = asyncio.Semaphore(max(1, self.config.async_max_concurrency))
+            self._async_slots[loop] = slot
+        return slot
+
+    def ingest_directory(
+        self,
+        root: str,
+        manifest_path: Optional[str] = None,
+        watch: bool = False,
+        **ingester_options: Any,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Incrementally extract a directory tree, skipping files unchanged since the last run.
+
+        Args:
+            root (str): Directory to ingest.
+            manifest_path (str, optional): SQLite manifest to use. Defaults to
+                ``config.ingest_manifest_path``.
+            watch (bool): Keep running and ingest changes as they happen
+                (blocks until interrupted).
+            **ingester_options: Options for ``DirectoryIngester`` (``handler``,
+                ``on_delete``, ``workers``, ``isolated``, ``retry_failed`` and
+                extractor options).
+
+        Returns:
+            dict: Run summary (see ``DirectoryIngester.run``), or None in watch mode.
+        """
+        from .ingest import DirectoryIngester
+
+        ingester = DirectoryIngester(
+            root, manifest_path or self.config.ingest_manifest_path, service=self, **ingester_options
+        )
+        if watch:
+            ingester.watch()
+            return None
+        return ingester.run()
+
+    def _sandbox_pool(self, workers: int) -> SandboxedExtractionPool:
+        return SandboxedExtractionPool(
+            workers=workers,
+            timeout=self.config.sandbox_timeout_seconds,
+            memory_limit_mb=self.config.sandbox_memory_limit_mb,
+            max_jobs_per_worker=self.config.sandbox_max_jobs_per_worker,
+        )
+
     def capture_and_process_screen(self, store: bool = True) -> Dict[str, Any]:
         """
         Capture a screenshot, process it with OCR, and optionally store it.
@@ -287,6 +690,7 @@ class UnifiedService:
         model_to_use = model_name or os.environ.get("NEXA_DEFAULT_MODEL")
 
         try:
+            from .llm.agent_logic import get_query_generator_chain
             chain = get_query_generator_chain(model_name=model_to_use or "ollama", base_url=base_url, api_key=api_key)
             # The chain API in this project uses .invoke with a dict carrying context and question
             res = chain.invoke({"context": context, "question": question})
@@ -340,7 +744,8 @@ class UnifiedService:
         Returns:
             Plain text assistant response.
         """
-        # Lazy import storage helpers
+        # Lazy import storage and LLM helpers
+        from .llm.agent_logic import get_llm, get_prompt
         try:
             from .nexy_rep.storage import ensure_conversation_table, store_chat_message, get_chat_history
         except Exception:
@@ -430,6 +835,8 @@ class UnifiedService:
         Returns:
             dict: Summary returned by GitHubUserActivity.get_user_activity()
         """
+        from .github_activity import GitHubUserActivity
+
         tracker = GitHubUserActivity(
             username=username,
             start_date=start_date,
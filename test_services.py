@@ -2,8 +2,19 @@
 Comprehensive test script for the Unified Service.
 Tests both document extraction and image processing capabilities.
 """
+import asyncio
+import bz2
+import gzip
+import lzma
 import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
 import time
+import tracemalloc
+import zipfile
 from datetime import datetime
 from services.services import UnifiedService
 
@@ -24,6 +35,11 @@ def test_document_extraction(service, test_files_dir):
             'description': 'JSON file extraction',
             'check': lambda text: '"name"' in text and '"age"' in text
         },
+        {
+            'file': 'test.jsonl',
+            'description': 'JSON Lines file extraction',
+            'check': lambda text: len(text.splitlines()) == 3 and '"name": "Ravi"' in text
+        },
         {
             'file': 'test.yaml',
             'description': 'YAML file extraction',
@@ -70,6 +86,654 @@ def test_document_extraction(service, test_files_dir):
     
     return results
 
+def test_parallel_pdf_extraction(service, test_files_dir):
+    """Test page-sharded PDF extraction matches serial extraction, in page order."""
+    print("\n=== Testing Parallel PDF Extraction ===")
+
+    try:
+        import fitz  # PyMuPDF
+
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = os.path.join(tmp, 'pages.pdf')
+            doc = fitz.open()
+            for number in range(12):
+                doc.new_page().insert_text((72, 72), f"Marker page {number:02d}")
+            doc.save(file_path)
+            doc.close()
+
+            serial = service.extract_from_file(file_path)
+            # 2 pages per shard across 3 workers: six shards, so order depends on reassembly
+            sharded = service.extract_from_file(file_path, parallel=True, workers=3, min_pages_per_shard=2)
+        markers = [line for line in sharded.splitlines() if line.startswith("Marker page")]
+        in_order = markers == [f"Marker page {number:02d}" for number in range(12)]
+        success = sharded == serial and in_order
+        print(f"Pages in order: {in_order}, matches serial: {sharded == serial}")
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'Parallel PDF extraction', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'Parallel PDF extraction', 'success': False, 'error': str(e)}]
+
+def test_cli(service, test_files_dir):
+    """Test main.py's --head, --pages and --output-dir options end to end."""
+    print("\n=== Testing Command Line ===")
+
+    main_py = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py')
+
+    def run(*args):
+        return subprocess.run([sys.executable, main_py, *args], capture_output=True, text=True, timeout=120)
+
+    def read(path):
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = shutil.copy(os.path.join(test_files_dir, 'test.txt'), tmp)
+        full_text = service.extract_from_file(text_path)
+
+        try:
+            proc = run(text_path, '--head', '40')
+            head = read(os.path.join(tmp, 'test_extracted.txt'))
+            success = proc.returncode == 0 and head == full_text[:40]
+            print(f"--head 40: {len(head)} characters, prefix matches: {head == full_text[:40]}")
+            results.append({'test': 'CLI --head', 'success': success})
+        except Exception as e:
+            print(f"Error: {str(e)}")
+            results.append({'test': 'CLI --head', 'success': False, 'error': str(e)})
+
+        try:
+            import fitz  # PyMuPDF
+
+            pdf_path = os.path.join(tmp, 'pages.pdf')
+            doc = fitz.open()
+            for number in range(5):
+                doc.new_page().insert_text((72, 72), f"Marker page {number:02d}")
+            doc.save(pdf_path)
+            doc.close()
+            proc = run(pdf_path, '--pages', '2')
+            markers = [line for line in read(os.path.join(tmp, 'pages_extracted.txt')).splitlines()
+                       if line.startswith("Marker page")]
+            success = proc.returncode == 0 and markers == ["Marker page 00", "Marker page 01"]
+            print(f"--pages 2: {markers}")
+            results.append({'test': 'CLI --pages', 'success': success})
+        except Exception as e:
+            print(f"Error: {str(e)}")
+            results.append({'test': 'CLI --pages', 'success': False, 'error': str(e)})
+
+        try:
+            out_dir = os.path.join(tmp, 'out')
+            proc = run(text_path, '--output-dir', out_dir)
+            written = os.path.join(out_dir, 'test_extracted.txt')
+            success = (proc.returncode == 0 and os.path.exists(written) and read(written) == full_text)
+            print(f"--output-dir: wrote {os.path.relpath(written, tmp)}: {os.path.exists(written)}")
+            results.append({'test': 'CLI --output-dir', 'success': success})
+        except Exception as e:
+            print(f"Error: {str(e)}")
+            results.append({'test': 'CLI --output-dir', 'success': False, 'error': str(e)})
+
+    for result in results:
+        print(f"{result['test']}: " + ("Success" if result['success'] else "Failed"))
+    return results
+
+def test_streaming_extraction(service, test_files_dir):
+    """Test that chunked streaming yields exactly the same text as extract_from_file."""
+    print("\n=== Testing Streaming Extraction ===")
+
+    results = []
+    for name in ['test.txt', 'test.json', 'test.jsonl', 'test.yaml', 'test.toml', 'test.md', 'test.csv']:
+        file_path = os.path.join(test_files_dir, name)
+        if not os.path.exists(file_path):
+            print(f"Skipping {name} - file not found")
+            continue
+        try:
+            full_text = service.extract_from_file(file_path)
+            # A tiny chunk size forces many chunk boundaries
+            chunks = list(service.iter_extract_from_file(file_path, chunk_size=16))
+            success = "".join(chunks) == full_text and all(len(c) <= 16 for c in chunks)
+            print(f"{name}: {len(chunks)} chunks - {'Success' if success else 'Failed'}")
+            results.append({'test': f'Streaming {name}', 'success': success})
+        except Exception as e:
+            print(f"Error: {str(e)}")
+            results.append({'test': f'Streaming {name}', 'success': False, 'error': str(e)})
+
+    return results
+
+def test_extraction_cache(service, test_files_dir):
+    """Test cache hits, invalidation on file/extractor/option changes, LRU eviction and stats."""
+    print("\n=== Testing Extraction Cache ===")
+
+    from services.extraction_cache import ExtractionCache
+    from services.extractors.txt_extractor import TXTExtractor
+
+    class TXTExtractorV2(TXTExtractor):
+        version = "2"
+
+    previous = service.extraction_cache
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = service.extraction_cache = ExtractionCache(os.path.join(tmp, 'cache'))
+            file_path = os.path.join(tmp, 'notes.txt')
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write("first version")
+
+            miss = service.extract_from_file(file_path, return_result=True)
+            hit = service.extract_from_file(file_path, return_result=True)
+            hit_ok = not miss.cached and hit.cached and hit.text == miss.text == "first version"
+
+            # New size and mtime: the file is hashed again and re-extracted
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write("second, longer version")
+            os.utime(file_path, ns=(time.time_ns(), time.time_ns() + 10**9))
+            modified = service.extract_from_file(file_path, return_result=True)
+            modified_ok = not modified.cached and modified.text == "second, longer version"
+
+            sliced = service.extract_from_file(file_path, return_result=True, byte_range=(0, 6))
+            keys_ok = (
+                not sliced.cached and sliced.text == "second"
+                and cache.key_for(file_path, TXTExtractor) != cache.key_for(file_path, TXTExtractorV2)
+                and cache.key_for(file_path, TXTExtractor, {}) != cache.key_for(file_path, TXTExtractor, {'block_size': 64})
+            )
+            stats = cache.stats()
+            stats_ok = stats['hits'] == 1 and stats['misses'] == 3 and stats['entries'] == 3 and stats['hit_rate'] == 0.25
+
+            # Room for two 17-byte entries; reading 'a' makes 'b' the least recently used
+            small = ExtractionCache(os.path.join(tmp, 'small'), max_bytes=40)
+            for key in ('a', 'b'):
+                small.put(key, key * 1000)
+                time.sleep(0.01)
+            small.get('a')
+            time.sleep(0.01)
+            small.put('c', 'c' * 1000)
+            lru_ok = small.get('a') is not None and small.get('b') is None and small.stats()['entries'] == 2
+
+        success = hit_ok and modified_ok and keys_ok and stats_ok and lru_ok
+        print(f"Hit: {hit_ok}, modified: {modified_ok}, keys: {keys_ok}, stats: {stats_ok}, LRU: {lru_ok}")
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'Extraction cache', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'Extraction cache', 'success': False, 'error': str(e)}]
+    finally:
+        service.extraction_cache = previous
+
+def test_batch_extraction(service, test_files_dir):
+    """Test extract_many returns results in input order and reports per-file errors."""
+    print("\n=== Testing Batch Extraction ===")
+
+    names = ['test.txt', 'test.json', 'missing.txt', 'test.yaml', 'test.toml', 'test.md']
+    paths = [os.path.join(test_files_dir, name) for name in names]
+    try:
+        results = service.extract_many(paths, workers=2)
+        in_order = [r['path'] for r in results] == paths
+        errors_reported = results[2]['error'] is not None and results[2]['text'] is None
+        texts_match = all(
+            r['text'] == service.extract_from_file(r['path'])
+            for r in results if r['error'] is None
+        )
+        success = in_order and errors_reported and texts_match
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'Batch extraction', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'Batch extraction', 'success': False, 'error': str(e)}]
+
+def test_batch_streaming_memory(service, test_files_dir):
+    """Test iter_extract_many releases each result once it has been yielded."""
+    print("\n=== Testing Batch Streaming Memory ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i in range(10):
+                path = os.path.join(tmp, f'large_{i}.txt')
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(f"line {i}\n" * 250_000)
+                paths.append(path)
+            total = sum(os.path.getsize(path) for path in paths)
+
+            peaks = {}
+            for isolated in (False, True):
+                tracemalloc.start()
+                try:
+                    for result in service.iter_extract_many(paths, workers=2, isolated=isolated):
+                        assert result['status'] == 'ok', result['error']
+                        del result  # a streaming consumer keeps nothing
+                    peaks[isolated] = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+        # Holding every result would need at least the whole batch of text
+        success = all(peak < total / 2 for peak in peaks.values())
+        print(f"Batch: {total / 2**20:.1f} MB, peak: "
+              + ", ".join(f"{'isolated' if k else 'pool'} {v / 2**20:.1f} MB" for k, v in peaks.items()))
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'Batch streaming memory', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'Batch streaming memory', 'success': False, 'error': str(e)}]
+
+def test_markdown_inline(service, test_files_dir):
+    """Test Markdown escapes apply outside code spans only."""
+    print("\n=== Testing Markdown Inline ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = os.path.join(tmp, 'escapes.md')
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write("Run `a\\*b` with \\*stars\\* and **bold** `&amp;`\n")
+            text = service.extract_from_file(file_path)
+        # Inside code the backslash and entity are literal; outside, the escapes drop their backslash
+        success = text == "Run a\\*b with *stars* and bold &amp;"
+        print(f"Text: {text!r}")
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'Markdown inline', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'Markdown inline', 'success': False, 'error': str(e)}]
+
+def test_docx_extraction(service, test_files_dir):
+    """Test DOCX paragraphs, table rows, a text box and the page header."""
+    print("\n=== Testing DOCX Extraction ===")
+
+    try:
+        file_path = os.path.join(test_files_dir, 'sample.docx')
+        body = service.extract_from_file(file_path)
+        with_header = service.extract_from_file(file_path, include_headers_footers=True)
+        expected = "Quarterly report\nBefore Box text\nName | Age\nMurali | 20\nAfter the table"
+        # The text box is stored twice (DrawingML and a VML fallback) but must appear once
+        success = body == expected and with_header == "Company confidential\n" + expected
+        print(f"Body: {body.splitlines()}")
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'DOCX extraction', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'DOCX extraction', 'success': False, 'error': str(e)}]
+
+def test_yaml_multi_document(service, test_files_dir):
+    """Test multi-document YAML streams are emitted in order, separated by ---."""
+    print("\n=== Testing YAML Multi-Document ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = os.path.join(tmp, 'manifests.yaml')
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write("kind: Service\nname: api\n---\nkind: Deployment\nreplicas: 2\n")
+            result = service.extract_from_file(file_path, return_result=True)
+            flat = service.extract_from_file(file_path, output_format='flat')
+
+            # Documents are parsed one at a time: the first one is out before
+            # the broken third one is reached
+            broken_path = os.path.join(tmp, 'broken.yaml')
+            with open(broken_path, 'w', encoding='utf-8') as f:
+                f.write("first: 1\n---\nsecond: 2\n---\n[unclosed\n")
+            pieces = service.get_extractor(broken_path).iter_text()
+            streamed = next(pieces) == "{"
+            try:
+                "".join(pieces)
+                streamed = False
+            except Exception:
+                pass
+
+        expected = '{\n  "kind": "Service",\n  "name": "api"\n}\n---\n{\n  "kind": "Deployment",\n  "replicas": 2\n}'
+        success = (
+            result.text == expected
+            and result.counts.get('documents') == 2
+            and flat == "kind = Service\nname = api\n---\nkind = Deployment\nreplicas = 2"
+            and streamed
+        )
+        print(f"JSON: {result.text.splitlines()}, flat: {flat.splitlines()}, streamed: {streamed}")
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'YAML multi-document', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'YAML multi-document', 'success': False, 'error': str(e)}]
+
+def test_flat_output(service, test_files_dir):
+    """Test the flat key-path output of the JSON, YAML and TOML extractors."""
+    print("\n=== Testing Flat Output ===")
+
+    try:
+        def flat(name, **options):
+            return service.extract_from_file(os.path.join(test_files_dir, name), output_format='flat', **options)
+
+        students = "\n".join(
+            f"students[{i}].{key} = {value}"
+            for i, row in enumerate([("Murali", 20, "Bangalore"), ("Ravi", 21, "Mysore"), ("Kiran", 19, "Chennai")])
+            for key, value in zip(("name", "age", "city"), row)
+        )
+        same_paths = flat('test.json') == flat('test.yaml') == students
+        toml_ok = flat('test.toml', max_depth=1) == (
+            'student1 = {"name":"Murali","age":20,"city":"Bangalore"}\n'
+            'student2 = {"name":"Ravi","age":21,"city":"Mysore"}'
+        )
+        limits_ok = flat('test.json', max_depth=2, max_array_items=1) == (
+            'students[0] = {"name":"Murali","age":20,"city":"Bangalore"}\nstudents[1:] = <2 more items>'
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = os.path.join(tmp, 'keys.json')
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write('{"full name": "Tom", "a.b": [1, {"x y": null}], "ok": " pad "}')
+            streamed = service.extract_from_file(file_path, output_format='flat', streaming=True)
+            loaded = service.extract_from_file(file_path, output_format='flat', streaming=False)
+        quoted_ok = streamed == loaded == '["full name"] = Tom\n["a.b"][0] = 1\n["a.b"][1]["x y"] = null\nok = " pad "'
+
+        success = same_paths and toml_ok and limits_ok and quoted_ok
+        print(f"JSON/YAML: {same_paths}, TOML max_depth: {toml_ok}, limits: {limits_ok}, quoted keys: {quoted_ok}")
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'Flat output', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'Flat output', 'success': False, 'error': str(e)}]
+
+def test_isolated_extraction(service, test_files_dir):
+    """Test sandboxed extract_many matches in-process extraction and reports failures with a status."""
+    print("\n=== Testing Isolated Extraction ===")
+
+    names = ['test.txt', 'missing.txt', 'test.json']
+    paths = [os.path.join(test_files_dir, name) for name in names]
+    try:
+        results = service.extract_many(paths, workers=2, isolated=True)
+        statuses = [r['status'] for r in results]
+        texts_match = all(
+            r['text'] == service.extract_from_file(r['path'])
+            for r in results if r['status'] == 'ok'
+        )
+        success = statuses == ['ok', 'error', 'ok'] and texts_match
+        print(f"Statuses: {statuses}")
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'Isolated extraction', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'Isolated extraction', 'success': False, 'error': str(e)}]
+
+def test_worker_recycling(service, test_files_dir):
+    """Test recycled workers are stopped gracefully, not killed, after ok and error jobs."""
+    print("\n=== Testing Worker Recycling ===")
+
+    from services.extraction_pool import SandboxedExtractionPool
+
+    names = ['test.txt', 'missing.txt', 'test.json']
+    try:
+        with SandboxedExtractionPool(workers=1, max_jobs_per_worker=1) as pool:
+            retired = []
+            retire = pool._retire
+            pool._retire = lambda worker, kill: (retired.append(kill), retire(worker, kill))
+            results = pool.extract_many([os.path.join(test_files_dir, name) for name in names])
+        statuses = [r['status'] for r in results]
+        success = statuses == ['ok', 'error', 'ok'] and retired == [False, False, False]
+        print(f"Statuses: {statuses}, killed: {retired}")
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'Worker recycling', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'Worker recycling', 'success': False, 'error': str(e)}]
+
+def test_incremental_ingest(service, test_files_dir):
+    """Test directory ingestion only re-extracts changed files and tombstones deleted ones."""
+    print("\n=== Testing Incremental Ingestion ===")
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        docs_dir = os.path.join(work_dir, 'docs')
+        os.makedirs(docs_dir)
+        for name in ['test.txt', 'test.json', 'test.md']:
+            shutil.copy(os.path.join(test_files_dir, name), docs_dir)
+        manifest = os.path.join(work_dir, 'manifest.db')
+
+        first = service.ingest_directory(docs_dir, manifest_path=manifest, workers=1)
+        second = service.ingest_directory(docs_dir, manifest_path=manifest, workers=1)
+        with open(os.path.join(docs_dir, 'test.txt'), 'a') as f:
+            f.write('\nAppended line.')
+        os.remove(os.path.join(docs_dir, 'test.md'))
+        third = service.ingest_directory(docs_dir, manifest_path=manifest, workers=1)
+
+        success = (
+            (first['new'], first['ok']) == (3, 3)
+            and (second['unchanged'], second['ok']) == (3, 0)
+            and (third['changed'], third['unchanged'], third['deleted']) == (1, 1, 1)
+        )
+        print(f"Runs: {first['ok']} extracted, {second['unchanged']} unchanged, "
+              f"{third['changed']} changed / {third['deleted']} deleted")
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'Incremental ingestion', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'Incremental ingestion', 'success': False, 'error': str(e)}]
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+def test_txt_slicing(service, test_files_dir):
+    """Test TXT byte and line ranges on a plain file and a .txt.gz (stream path) give the same text."""
+    print("\n=== Testing TXT Slicing ===")
+
+    try:
+        data = 'l0\r\nl1\rl1b\nl2 a\u00e9\u20acb\nl3'.encode('utf-8')
+        with tempfile.TemporaryDirectory() as tmp:
+            plain = os.path.join(tmp, 'lines.txt')
+            with open(plain, 'wb') as f:
+                f.write(data)
+            with gzip.open(plain + '.gz', 'wb') as f:
+                f.write(data)
+
+            def sliced(path, **options):
+                return "".join(service.get_extractor(path, **options).iter_text())
+
+            results = {}
+            for path in (plain, plain + '.gz'):
+                whole = sliced(path)
+                # Every split point must tile the file, even inside a character or a CRLF pair
+                tiles = all(
+                    sliced(path, byte_range=(0, cut)) + sliced(path, byte_range=(cut, None)) == whole
+                    for cut in range(len(data) + 1)
+                )
+                # The cut falls inside the 3-byte euro sign, which goes to the next range
+                mid_char = sliced(path, byte_range=(0, 19)) == 'l0\nl1\nl1b\nl2 a\u00e9'
+                lines = sliced(path, line_range=(1, 3))
+                results[path] = (tiles, mid_char, lines)
+        plain_result, gz_result = results[plain], results[plain + '.gz']
+        success = plain_result == gz_result and plain_result == (True, True, 'l1\nl1b\nl2 a\u00e9\u20acb\n')
+        print(f"Plain: {plain_result}, gzip: {gz_result}")
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'TXT slicing', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'TXT slicing', 'success': False, 'error': str(e)}]
+
+def test_archive_extraction(service, test_files_dir):
+    """Test zip and tar.gz members are extracted in place, without unpacking to disk."""
+    print("\n=== Testing Archive Extraction ===")
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        names = ['test.txt', 'test.csv', 'test.json']
+        zip_path = os.path.join(work_dir, 'bundle.zip')
+        tar_path = os.path.join(work_dir, 'bundle.tar.gz')
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for name in names:
+                archive.write(os.path.join(test_files_dir, name), name)
+        with tarfile.open(tar_path, 'w:gz') as archive:
+            for name in names:
+                archive.add(os.path.join(test_files_dir, name), name)
+
+        success = True
+        for path in [zip_path, tar_path]:
+            text = service.extract_from_file(path)
+            found = [name for name in names if f"=== {name} ===" in text]
+            expected = service.extract_from_file(os.path.join(test_files_dir, 'test.txt'))
+            ok = found == names and expected in text
+            success = success and ok
+            print(f"{os.path.basename(path)}: {len(found)}/{len(names)} members, {len(text)} characters")
+
+        # A member with a bad CRC is skipped; the others are still extracted
+        bad_path = os.path.join(work_dir, 'bad.zip')
+        with zipfile.ZipFile(bad_path, 'w', zipfile.ZIP_STORED) as archive:
+            for name, body in [('a.txt', 'alpha'), ('b.txt', 'bravo'), ('c.txt', 'charlie')]:
+                archive.writestr(name, body)
+        with open(bad_path, 'r+b') as f:
+            data = f.read()
+            f.seek(data.index(b'bravo'))
+            f.write(b'B')
+        partial = service.extract_from_file(bad_path)
+        skipped = partial == "=== a.txt ===\nalpha\n\n=== c.txt ===\ncharlie"
+        success = success and skipped
+        print(f"bad.zip: corrupt member skipped - {skipped}")
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'Archive extraction', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'Archive extraction', 'success': False, 'error': str(e)}]
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+def test_extraction_result(service, test_files_dir):
+    """Test extract_from_file(return_result=True) reports counts and stage timings."""
+    print("\n=== Testing Extraction Results ===")
+
+    try:
+        file_path = os.path.join(test_files_dir, 'test.csv')
+        result = service.extract_from_file(file_path, return_result=True)
+        metrics = result.to_metrics()
+        success = (
+            result.text == service.extract_from_file(file_path)
+            and result.extractor == 'CSVExtractor'
+            and result.rows == 3
+            and result.chars == len(result.text)
+            and result.bytes == os.path.getsize(file_path)
+            and 'total' in result.timings
+            and metrics['nexa.extraction.csv.rows'] == 3
+        )
+        timings = ", ".join(f"{stage} {seconds * 1000:.2f}ms" for stage, seconds in result.timings.items())
+        print(f"{result.extractor} v{result.version}: {result.rows} rows, {result.chars} characters ({timings})")
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'Extraction result', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'Extraction result', 'success': False, 'error': str(e)}]
+
+def test_async_extraction(service, test_files_dir):
+    """Test the asyncio API returns the same text as the blocking calls."""
+    print("\n=== Testing Async Extraction ===")
+
+    async def run():
+        names = ['test.txt', 'test.csv', 'test.json', 'test.md']
+        paths = [os.path.join(test_files_dir, name) for name in names]
+        results = await service.aextract_many(paths + ['missing.txt'])
+        chunks = [chunk async for chunk in service.aiter_extract_from_file(paths[2], chunk_size=16)]
+        text = await service.aextract_from_file(paths[0])
+        return (
+            all(r['text'] == service.extract_from_file(p) for r, p in zip(results, paths))
+            and results[-1]['status'] == 'error'
+            and "".join(chunks) == service.extract_from_file(paths[2])
+            and text == service.extract_from_file(paths[0])
+        ), len(results), len(chunks)
+
+    try:
+        success, files, chunks = asyncio.run(run())
+        print(f"Extracted {files} files concurrently, streamed {chunks} chunks")
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'Async extraction', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'Async extraction', 'success': False, 'error': str(e)}]
+
+def test_compressed_extraction(service, test_files_dir):
+    """Test .gz/.bz2/.xz inputs are decompressed on the fly into the inner format's extractor."""
+    print("\n=== Testing Compressed Extraction ===")
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        success = True
+        for name, opener, ext in [('test.csv', gzip.open, '.gz'), ('test.jsonl', bz2.open, '.bz2'),
+                                  ('test.txt', lzma.open, '.xz')]:
+            source = os.path.join(test_files_dir, name)
+            target = os.path.join(work_dir, name + ext)
+            with open(source, 'rb') as f, opener(target, 'wb') as out:
+                shutil.copyfileobj(f, out)
+            ok = service.extract_from_file(target) == service.extract_from_file(source)
+            success = success and ok
+            print(f"{name + ext}: {'matches' if ok else 'differs from'} {name}")
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'Compressed extraction', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'Compressed extraction', 'success': False, 'error': str(e)}]
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+def test_csv_filtering(service, test_files_dir):
+    """Test CSV column selection with equality and range predicates."""
+    print("\n=== Testing CSV Filtering ===")
+
+    try:
+        file_path = os.path.join(test_files_dir, 'test.csv')
+        by_range = service.extract_from_file(file_path, usecols=['Name'], where={'Age': (20, 21)})
+        by_value = service.extract_from_file(file_path, usecols=['Name', 'City'], where={'City': 'Chennai'})
+        success = by_range == "Murali\nRavi" and by_value == "Kiran | Chennai"
+        print(f"Age 20-21: {by_range.splitlines()}, City == Chennai: {by_value.splitlines()}")
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'CSV filtering', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'CSV filtering', 'success': False, 'error': str(e)}]
+
+def test_xlsx_extraction(service, test_files_dir):
+    """Test XLSX extraction with sheet selection and row limits."""
+    print("\n=== Testing XLSX Extraction ===")
+
+    try:
+        import openpyxl
+
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = os.path.join(tmp, 'people.xlsx')
+            workbook = openpyxl.Workbook()
+            people = workbook.active
+            people.title = 'People'
+            for row in [['Name', 'Age'], ['Murali', 20], [None, None], ['Ravi', 21]]:
+                people.append(row)
+            workbook.create_sheet('Cities').append(['Chennai', True])
+            workbook.save(file_path)
+
+            full = service.extract_from_file(file_path)
+            selected = service.extract_from_file(file_path, sheets=['People'], max_rows=2)
+        success = (
+            full == "=== People ===\nName | Age\nMurali | 20\nRavi | 21\n\n=== Cities ===\nChennai | TRUE"
+            and selected == "Name | Age\nMurali | 20"
+        )
+        print(f"All sheets: {full.splitlines()}, People (2 rows): {selected.splitlines()}")
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'XLSX extraction', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'XLSX extraction', 'success': False, 'error': str(e)}]
+
+def test_html_extraction(service, test_files_dir):
+    """Test HTML extraction skips scripts, styles and navigation and decodes entities."""
+    print("\n=== Testing HTML Extraction ===")
+
+    try:
+        page = (
+            "<html><head><title>Team &amp; Cities</title><style>p { color: red }</style></head><body>"
+            "<nav><a href='/'>Home</a></nav><script>if (a < b) { track('<p>'); }</script>"
+            "<h1>People</h1><p>Murali   lives in\n<b>Chennai</b> &mdash; caf&eacute;</p>"
+            "<table><tr><th>Name</th><th>Age</th></tr><tr><td>Ravi</td><td>21</td></tr></table>"
+            "<footer>Copyright</footer></body></html>"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = os.path.join(tmp, 'page.html')
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(page)
+            text = service.extract_from_file(file_path)
+            small_blocks = service.extract_from_file(file_path, block_size=8)
+        expected = "Team & Cities\nPeople\nMurali lives in Chennai \u2014 caf\u00e9\nName | Age\nRavi | 21"
+        success = text == expected and small_blocks == expected
+        print(f"Text: {text.splitlines()}")
+        print("Status: Success" if success else "Status: Failed")
+        return [{'test': 'HTML extraction', 'success': success}]
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return [{'test': 'HTML extraction', 'success': False, 'error': str(e)}]
+
 def test_image_processing(service):
     """Test image capture, OCR, and similarity detection."""
     print("\n=== Testing Image Processing ===")
@@ -132,6 +796,27 @@ def main():
     # Test document extraction
     test_files_dir = os.path.join(os.path.dirname(__file__), "test_files")
     doc_results = test_document_extraction(service, test_files_dir)
+    doc_results += test_parallel_pdf_extraction(service, test_files_dir)
+    doc_results += test_cli(service, test_files_dir)
+    doc_results += test_streaming_extraction(service, test_files_dir)
+    doc_results += test_extraction_cache(service, test_files_dir)
+    doc_results += test_batch_extraction(service, test_files_dir)
+    doc_results += test_batch_streaming_memory(service, test_files_dir)
+    doc_results += test_markdown_inline(service, test_files_dir)
+    doc_results += test_docx_extraction(service, test_files_dir)
+    doc_results += test_yaml_multi_document(service, test_files_dir)
+    doc_results += test_flat_output(service, test_files_dir)
+    doc_results += test_isolated_extraction(service, test_files_dir)
+    doc_results += test_worker_recycling(service, test_files_dir)
+    doc_results += test_incremental_ingest(service, test_files_dir)
+    doc_results += test_txt_slicing(service, test_files_dir)
+    doc_results += test_archive_extraction(service, test_files_dir)
+    doc_results += test_extraction_result(service, test_files_dir)
+    doc_results += test_async_extraction(service, test_files_dir)
+    doc_results += test_compressed_extraction(service, test_files_dir)
+    doc_results += test_csv_filtering(service, test_files_dir)
+    doc_results += test_xlsx_extraction(service, test_files_dir)
+    doc_results += test_html_extraction(service, test_files_dir)
     
     # Test image processing
     img_results = test_image_processing(service)